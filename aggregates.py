@@ -0,0 +1,277 @@
+"""
+Módulo de agregados materializados de ocupación por hotel.
+
+Los contadores (reservaciones y noches vendidas por hotel, por mes y por
+ubicación) se actualizan con cada alta, baja o modificación de las tablas
+de hoteles y reservaciones, por lo que los reportes se consultan en O(1)
+sin recorrer las reservaciones. rebuild() y verify() recalculan todo
+desde cero para comprobar los contadores.
+"""
+
+import calendar
+import weakref
+from collections import Counter
+from datetime import date
+
+from storage import Subscription
+
+
+def month_nights(start, end):
+    """
+    Reparte las noches [start, end) entre los meses que abarcan.
+
+    Args:
+        start (int): Ordinal de la primera noche.
+        end (int): Ordinal de la salida.
+
+    Yields:
+        tuple: (mes 'AAAA-MM', noches en ese mes).
+    """
+    while start < end:
+        day = date.fromordinal(start)
+        next_month = date(day.year + day.month // 12, day.month % 12 + 1,
+                          1).toordinal()
+        stop = min(end, next_month)
+        yield f"{day.year:04d}-{day.month:02d}", stop - start
+        start = stop
+
+
+class HotelAggregates:
+    """
+    Agregados de ocupación mantenidos al día con las tablas.
+
+    Atributos:
+        bookings (Counter): Reservaciones por hotel_id.
+        nights (Counter): Noches vendidas por hotel_id.
+        hotel_month_nights (Counter): Noches vendidas por (hotel_id, mes).
+        month_nights (Counter): Noches vendidas por mes, todos los hoteles.
+        location_bookings (Counter): Reservaciones por ubicación.
+        rooms (dict): Habitaciones por hotel_id.
+        location (dict): Ubicación por hotel_id.
+    """
+
+    def __init__(self, hotels_table, reservation_tables):
+        """
+        Inicializa los agregados (sin suscribirlos a las tablas).
+
+        Args:
+            hotels_table (RecordTable): Tabla de hoteles.
+            reservation_tables (list): Tablas de reservaciones (una por
+                partición).
+        """
+        self.hotels_table = hotels_table
+        self.reservation_tables = list(reservation_tables)
+        self.bookings = Counter()
+        self.nights = Counter()
+        self.hotel_month_nights = Counter()
+        self.month_nights = Counter()
+        self.location_bookings = Counter()
+        self.rooms = {}
+        self.location = {}
+
+    def add_reservation(self, reservation, sign=1):
+        """
+        Suma (o resta, con sign=-1) una reservación a los contadores.
+
+        Args:
+            reservation (Reservation): Reservación agregada o eliminada.
+            sign (int, optional): 1 para sumar, -1 para restar.
+        """
+        try:
+            start, end = reservation.nights()
+        except ValueError:
+            return
+        hotel_id = reservation.hotel_id
+        self.bookings[hotel_id] += sign
+        self.nights[hotel_id] += sign * (end - start)
+        if hotel_id in self.location:
+            self.location_bookings[self.location[hotel_id]] += sign
+        for month, nights in month_nights(start, end):
+            self.hotel_month_nights[hotel_id, month] += sign * nights
+            self.month_nights[month] += sign * nights
+
+    def add_hotel(self, hotel, sign=1):
+        """
+        Registra (o olvida, con sign=-1) la capacidad y ubicación de un hotel.
+
+        Args:
+            hotel (Hotel): Hotel agregado o eliminado.
+            sign (int, optional): 1 para registrar, -1 para olvidar.
+        """
+        bookings = self.bookings[hotel.hotel_id]
+        self.location_bookings[hotel.location] += sign * bookings
+        if sign > 0:
+            self.rooms[hotel.hotel_id] = hotel.rooms
+            self.location[hotel.hotel_id] = hotel.location
+        else:
+            self.rooms.pop(hotel.hotel_id, None)
+            self.location.pop(hotel.hotel_id, None)
+
+    def rebuild(self):
+        """Recalcula todos los contadores a partir de las tablas."""
+        for counter in (self.bookings, self.nights, self.hotel_month_nights,
+                        self.month_nights, self.location_bookings):
+            counter.clear()
+        self.rooms = {}
+        self.location = {}
+        for hotel in self.hotels_table.values():
+            self.add_hotel(hotel)
+        for table in self.reservation_tables:
+            for reservation in table.values():
+                self.add_reservation(reservation)
+
+    def as_dict(self):
+        """
+        Obtiene los contadores sin las entradas en cero.
+
+        Returns:
+            dict: Contadores por nombre.
+        """
+        return {
+            name: {key: value
+                   for key, value in getattr(self, name).items() if value}
+            for name in ('bookings', 'nights', 'hotel_month_nights',
+                         'month_nights', 'location_bookings')
+        }
+
+    def verify(self):
+        """
+        Compara los contadores con un recálculo completo.
+
+        Returns:
+            bool: True si los contadores incrementales son correctos.
+        """
+        fresh = HotelAggregates(self.hotels_table, self.reservation_tables)
+        fresh.rebuild()
+        return fresh.as_dict() == self.as_dict() and fresh.rooms == self.rooms
+
+    def occupancy_rate(self, hotel_id, month):
+        """
+        Calcula la ocupación de un hotel en un mes.
+
+        Args:
+            hotel_id (str): ID del hotel.
+            month (str): Mes 'AAAA-MM'.
+
+        Returns:
+            float: Noches vendidas entre noches disponibles (0.0 si el
+                hotel no existe o no tiene habitaciones).
+        """
+        rooms = self.rooms.get(hotel_id, 0)
+        if rooms <= 0:
+            return 0.0
+        year, number = (int(part) for part in month.split('-'))
+        days = calendar.monthrange(year, number)[1]
+        return self.hotel_month_nights[hotel_id, month] / (rooms * days)
+
+    def bookings_by_location(self, location):
+        """
+        Obtiene el número de reservaciones en una ubicación.
+
+        Args:
+            location (str): Ubicación.
+
+        Returns:
+            int: Reservaciones de los hoteles de esa ubicación.
+        """
+        return self.location_bookings[location]
+
+    def nights_sold(self, month, hotel_id=None):
+        """
+        Obtiene las noches vendidas en un mes.
+
+        Args:
+            month (str): Mes 'AAAA-MM'.
+            hotel_id (str, optional): Limitar a un hotel.
+
+        Returns:
+            int: Noches vendidas.
+        """
+        if hotel_id is None:
+            return self.month_nights[month]
+        return self.hotel_month_nights[hotel_id, month]
+
+
+class _HotelListener:
+    """Mantiene la capacidad y ubicación de los hoteles en los agregados."""
+
+    def __init__(self, aggregates):
+        self.aggregates = aggregates
+        self.active = False
+
+    def on_insert(self, hotel):
+        """Registra un hotel."""
+        self.aggregates.add_hotel(hotel)
+
+    def on_delete(self, hotel):
+        """Olvida un hotel."""
+        self.aggregates.add_hotel(hotel, -1)
+
+    def on_reset(self, _):
+        """Recalcula los agregados tras recargar la tabla."""
+        if self.active:
+            self.aggregates.rebuild()
+
+
+class _ReservationListener:
+    """Suma y resta las reservaciones en los agregados."""
+
+    def __init__(self, aggregates):
+        self.aggregates = aggregates
+        self.active = False
+
+    def on_insert(self, reservation):
+        """Suma una reservación."""
+        self.aggregates.add_reservation(reservation)
+
+    def on_delete(self, reservation):
+        """Resta una reservación."""
+        self.aggregates.add_reservation(reservation, -1)
+
+    def on_reset(self, _):
+        """Recalcula los agregados tras recargar la tabla."""
+        if self.active:
+            self.aggregates.rebuild()
+
+
+# Agregados por tabla de hoteles. Las claves son referencias débiles y
+# los agregados se guardan en un WeakSet: solo los retienen sus
+# observadores, que forman una Subscription y se retiran de todas las
+# tablas en cuanto cualquiera de ellas se descarta del caché.
+_AGGREGATES = weakref.WeakKeyDictionary()
+
+
+def hotel_aggregates(hotels_table, reservation_tables):
+    """
+    Obtiene los agregados de un conjunto de tablas, creándolos y
+    suscribiéndolos a sus cambios la primera vez. Si alguna de las
+    tablas ya se descartó del caché, los agregados son una copia fija
+    que no se guarda.
+
+    Args:
+        hotels_table (RecordTable): Tabla de hoteles.
+        reservation_tables (list): Tablas de reservaciones (una por
+            partición).
+
+    Returns:
+        HotelAggregates: Agregados mantenidos al día.
+    """
+    tables = (hotels_table, *reservation_tables)
+    known = _AGGREGATES.setdefault(hotels_table, weakref.WeakSet())
+    if not any(table.closed for table in tables):
+        for aggregates in known:
+            current = aggregates.reservation_tables
+            if len(current) == len(tables) - 1 and all(
+                    a is b for a, b in zip(current, reservation_tables)):
+                return aggregates
+    aggregates = HotelAggregates(hotels_table, reservation_tables)
+    listeners = [_HotelListener(aggregates)]
+    listeners += [_ReservationListener(aggregates)
+                  for _ in reservation_tables]
+    subscription = Subscription(zip(tables, listeners))
+    aggregates.rebuild()
+    for listener in listeners:
+        listener.active = True
+    if subscription.active:
+        known.add(aggregates)
+    return aggregates
@@ -0,0 +1,269 @@
+"""
+Módulo de análisis vectorizado de las reservaciones con NumPy.
+
+Las reservaciones se cargan una vez en arreglos columnares (llegada y
+salida como datetime64[D], hotel y cliente como códigos enteros de
+categoría) y cada métrica se calcula con operaciones de NumPy en lugar
+de ciclos de Python sobre objetos Reservation con fechas en texto:
+duración promedio de la estancia, anticipación de la reservación,
+ocupación por noche y principales clientes.
+
+NumPy es una dependencia opcional: el resto del sistema no lo importa y
+este módulo sólo lo exige al crear los arreglos (pip install numpy).
+
+Uso:
+    python analytics.py data/reservations_data.txt
+        --events data/events.log --top 5
+"""
+
+import argparse
+from datetime import date
+
+from events import read_events
+from reservation import Reservation
+from shards import shard_files
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - instalación sin NumPy
+    np = None
+
+EPOCH = date(1970, 1, 1).toordinal()
+
+NIGHTS = 'nights'
+RESERVATIONS = 'reservations'
+
+
+def booking_dates(events_path):
+    """
+    Obtiene la fecha en que se creó cada reservación, a partir del
+    historial de eventos (el archivo de reservaciones no la guarda).
+
+    Args:
+        events_path (str): Archivo de eventos (ver events.py).
+
+    Returns:
+        dict: Fecha ISO (hora local) del último ReservationCreated por
+            reservation_id.
+    """
+    dates = {}
+    for event, _ in read_events(events_path):
+        if event.type == 'ReservationCreated':
+            created = date.fromtimestamp(event.timestamp)
+            dates[event.line.split('|', 1)[0]] = created.isoformat()
+    return dates
+
+
+class ReservationArrays:
+    """
+    Reservaciones en arreglos de NumPy, una fila por reservación.
+
+    Atributos:
+        ids (list): reservation_id de cada fila.
+        hotels (ndarray): hotel_id de cada código de hotel.
+        hotel_codes (ndarray): Código de hotel (int32) de cada fila.
+        customers (ndarray): customer_id de cada código de cliente.
+        customer_codes (ndarray): Código de cliente (int32) de cada fila.
+        check_in (ndarray): Llegada (datetime64[D]) de cada fila.
+        check_out (ndarray): Salida (datetime64[D]) de cada fila.
+        booked_on (ndarray): Fecha de creación (datetime64[D], NaT si no
+            se conoce) de cada fila.
+        invalid (int): Reservaciones omitidas por fechas inválidas.
+    """
+
+    def __init__(self, reservations, booked_on=None):
+        """
+        Convierte las reservaciones a arreglos en una sola pasada.
+
+        Args:
+            reservations (iterable): Objetos Reservation.
+            booked_on (dict, optional): Fecha ISO de creación por
+                reservation_id (ver booking_dates()), para la anticipación.
+
+        Raises:
+            ImportError: Si NumPy no está instalado.
+        """
+        if np is None:
+            raise ImportError("analytics requiere NumPy (pip install numpy)")
+        hotels = {}
+        customers = {}
+        ids = []
+        hotel_codes = []
+        customer_codes = []
+        starts = []
+        ends = []
+        booked = []
+        booked_on = booked_on or {}
+        invalid = 0
+        for reservation in reservations:
+            try:
+                start, end = reservation.nights()
+            except ValueError:
+                invalid += 1
+                continue
+            ids.append(reservation.reservation_id)
+            hotel_codes.append(hotels.setdefault(reservation.hotel_id,
+                                                 len(hotels)))
+            customer_codes.append(customers.setdefault(reservation.customer_id,
+                                                       len(customers)))
+            starts.append(start)
+            ends.append(end)
+            booked.append(booked_on.get(reservation.reservation_id, 'NaT'))
+        self.ids = ids
+        self.hotels = np.array(list(hotels), dtype=object)
+        self.hotel_codes = np.array(hotel_codes, dtype=np.int32)
+        self.customers = np.array(list(customers), dtype=object)
+        self.customer_codes = np.array(customer_codes, dtype=np.int32)
+        self.check_in = (np.array(starts, dtype=np.int64)
+                         - EPOCH).astype('datetime64[D]')
+        self.check_out = (np.array(ends, dtype=np.int64)
+                          - EPOCH).astype('datetime64[D]')
+        self.booked_on = np.array(booked, dtype='datetime64[D]')
+        self.invalid = invalid
+
+    @staticmethod
+    def load(filename, events_path=None):
+        """
+        Crea los arreglos de un archivo de reservaciones.
+
+        Args:
+            filename (str): Archivo de reservaciones o manifiesto de
+                particiones.
+            events_path (str, optional): Historial de eventos del que se
+                toman las fechas de creación.
+
+        Returns:
+            ReservationArrays: Arreglos de todas las particiones.
+        """
+        booked_on = booking_dates(events_path) if events_path else None
+        return ReservationArrays((r for shard in shard_files(filename)
+                                  for r in Reservation.table(shard).values()),
+                                 booked_on)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def stay_lengths(self):
+        """
+        Obtiene las noches de cada estancia.
+
+        Returns:
+            ndarray: Noches (int64) por fila.
+        """
+        return (self.check_out - self.check_in).astype(np.int64)
+
+    def average_stay(self):
+        """
+        Calcula la duración promedio de la estancia.
+
+        Returns:
+            float: Noches promedio, o None si no hay reservaciones.
+        """
+        return float(self.stay_lengths().mean()) if len(self) else None
+
+    def lead_times(self):
+        """
+        Obtiene los días entre la creación de cada reservación y la llegada.
+
+        Returns:
+            ndarray: Días de anticipación (int64) de las filas con fecha
+                de creación.
+        """
+        known = ~np.isnat(self.booked_on)
+        return (self.check_in[known] - self.booked_on[known]).astype(np.int64)
+
+    def average_lead_time(self):
+        """
+        Calcula la anticipación promedio de las reservaciones.
+
+        Returns:
+            float: Días promedio, o None si ninguna reservación tiene fecha
+                de creación.
+        """
+        leads = self.lead_times()
+        return float(leads.mean()) if leads.size else None
+
+    def occupancy_per_night(self, hotel_id=None):
+        """
+        Cuenta las habitaciones ocupadas en cada noche, con un arreglo de
+        diferencias (+1 en la llegada, -1 en la salida) y una suma acumulada.
+
+        Args:
+            hotel_id (str, optional): Limitar a un hotel; por omisión todos.
+
+        Returns:
+            tuple: (noches como datetime64[D], habitaciones ocupadas por
+                noche), desde la primera llegada hasta la última noche.
+        """
+        check_in, check_out = self.check_in, self.check_out
+        if hotel_id is not None:
+            codes = np.flatnonzero(self.hotels == hotel_id)
+            rows = self.hotel_codes == (codes[0] if codes.size else -1)
+            check_in, check_out = check_in[rows], check_out[rows]
+        if not check_in.size:
+            return (np.array([], dtype='datetime64[D]'),
+                    np.array([], dtype=np.int64))
+        first = check_in.min()
+        nights = int((check_out.max() - first).astype(np.int64))
+        arrivals = np.bincount((check_in - first).astype(np.int64),
+                               minlength=nights + 1)
+        departures = np.bincount((check_out - first).astype(np.int64),
+                                 minlength=nights + 1)
+        diff = arrivals - departures
+        return first + np.arange(nights), np.cumsum(diff[:-1])
+
+    def top_customers(self, count=10, by=NIGHTS):
+        """
+        Obtiene los clientes con más noches o más reservaciones.
+
+        Args:
+            count (int, optional): Número de clientes.
+            by (str, optional): NIGHTS o RESERVATIONS.
+
+        Returns:
+            list: Tuplas (customer_id, total) de mayor a menor; los empates
+                se ordenan por la primera aparición del cliente.
+
+        Raises:
+            ValueError: Si by no es NIGHTS ni RESERVATIONS.
+        """
+        if by not in (NIGHTS, RESERVATIONS):
+            raise ValueError(f"criterio desconocido: {by}")
+        weights = self.stay_lengths() if by == NIGHTS else None
+        totals = np.bincount(self.customer_codes, weights=weights,
+                             minlength=len(self.customers)).astype(np.int64)
+        order = np.argsort(-totals, kind='stable')[:count]
+        return [(self.customers[code], int(totals[code])) for code in order]
+
+
+def main():
+    """Punto de entrada del reporte."""
+    parser = argparse.ArgumentParser(
+        description="Métricas de las reservaciones con NumPy")
+    parser.add_argument("reservations")
+    parser.add_argument("--events",
+                        help="historial de eventos para la anticipación")
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    arrays = ReservationArrays.load(args.reservations, args.events)
+    stay = arrays.average_stay()
+    print(f"Reservaciones: {len(arrays)} "
+          f"({arrays.invalid} con fechas inválidas)")
+    print("Estancia promedio: "
+          + ("-" if stay is None else f"{stay:.2f} noches"))
+    if args.events:
+        lead = arrays.average_lead_time()
+        print("Anticipación promedio: "
+              + ("-" if lead is None else f"{lead:.1f} días"))
+    nights, booked = arrays.occupancy_per_night()
+    if booked.size:
+        busiest = int(booked.argmax())
+        print(f"Noche con más ocupación: {nights[busiest]} "
+              f"({booked[busiest]} habitaciones)")
+    for customer_id, total in arrays.top_customers(args.top):
+        print(f"{customer_id}|{total} noches")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,413 @@
+"""
+Módulo que define el motor de disponibilidad por noche.
+
+La ocupación de cada hotel se guarda en un arreglo compacto de enteros
+(una posición por noche), por lo que verificar una estancia cuesta
+O(noches) y no depende del número de reservaciones.
+"""
+
+import weakref
+from array import array
+from datetime import date
+from functools import lru_cache
+
+from storage import Subscription
+
+
+@lru_cache(maxsize=4096)
+def parse_date(value):
+    """
+    Convierte una fecha ISO (AAAA-MM-DD) a su número ordinal.
+
+    Args:
+        value (str): Fecha en formato ISO.
+
+    Returns:
+        int: Ordinal de la fecha.
+
+    Raises:
+        ValueError: Si la fecha no es válida.
+    """
+    return date.fromisoformat(value).toordinal()
+
+
+@lru_cache(maxsize=4096)
+def format_date(ordinal):
+    """
+    Convierte un número ordinal a fecha ISO (AAAA-MM-DD).
+
+    Args:
+        ordinal (int): Ordinal de la fecha.
+
+    Returns:
+        str: Fecha en formato ISO.
+    """
+    return date.fromordinal(ordinal).isoformat()
+
+
+def stay_nights(check_in, check_out):
+    """
+    Obtiene el rango de noches [inicio, fin) de una estancia.
+
+    Args:
+        check_in (str): Fecha de llegada.
+        check_out (str): Fecha de salida.
+
+    Returns:
+        tuple: (ordinal de la primera noche, ordinal de la salida).
+
+    Raises:
+        ValueError: Si alguna fecha es inválida o la salida no es
+            posterior a la llegada.
+    """
+    start, end = parse_date(check_in), parse_date(check_out)
+    if end <= start:
+        raise ValueError(f"la salida {check_out} no es posterior a {check_in}")
+    return start, end
+
+
+class NightlyOccupancy:
+    """
+    Habitaciones ocupadas por noche de un hotel.
+
+    Atributos:
+        base (int): Ordinal de la primera noche del arreglo.
+        counts (array): Habitaciones ocupadas a partir de base.
+    """
+
+    def __init__(self):
+        """Inicializa una ocupación vacía."""
+        self.base = None
+        self.counts = array('I')
+
+    def add(self, start, end, delta):
+        """
+        Suma delta a las noches [start, end).
+
+        Args:
+            start (int): Ordinal de la primera noche.
+            end (int): Ordinal de la salida.
+            delta (int): Habitaciones a sumar (negativo para liberar).
+        """
+        if self.base is None:
+            self.base = start
+        if start < self.base:
+            padding = array('I', bytes(4 * (self.base - start)))
+            self.counts = padding + self.counts
+            self.base = start
+        missing = end - self.base - len(self.counts)
+        if missing > 0:
+            self.counts.extend(array('I', bytes(4 * missing)))
+        for i in range(start - self.base, end - self.base):
+            self.counts[i] = max(self.counts[i] + delta, 0)
+
+    def booked(self, night):
+        """
+        Obtiene las habitaciones ocupadas en una noche.
+
+        Args:
+            night (int): Ordinal de la noche.
+
+        Returns:
+            int: Habitaciones ocupadas esa noche.
+        """
+        if self.base is None or not 0 <= night - self.base < len(self.counts):
+            return 0
+        return self.counts[night - self.base]
+
+    def max_booked(self, start, end):
+        """
+        Obtiene la ocupación máxima de un rango de noches en O(noches).
+
+        Args:
+            start (int): Ordinal de la primera noche.
+            end (int): Ordinal de la salida.
+
+        Returns:
+            int: Máximo de habitaciones ocupadas en [start, end).
+        """
+        if self.base is None:
+            return 0
+        lo = max(start - self.base, 0)
+        hi = min(end - self.base, len(self.counts))
+        if lo >= hi:
+            return 0
+        return max(self.counts[lo:hi])
+
+    def peak(self):
+        """
+        Obtiene la ocupación de la noche más ocupada.
+
+        Returns:
+            int: Máximo de habitaciones ocupadas en cualquier noche.
+        """
+        return max(self.counts, default=0)
+
+
+class AvailabilityIndex:
+    """
+    Índice de disponibilidad por hotel y por noche, mantenido a partir
+    de las tablas de hoteles y de reservaciones.
+
+    Atributos:
+        capacity (dict): Habitaciones totales por hotel_id.
+        occupancy (dict): NightlyOccupancy por hotel_id.
+    """
+
+    def __init__(self):
+        """Inicializa un índice vacío."""
+        self.capacity = {}
+        self.occupancy = {}
+
+    def add_stay(self, hotel_id, check_in, check_out, rooms=1):
+        """
+        Ocupa habitaciones de un hotel durante una estancia.
+
+        Args:
+            hotel_id (str): ID del hotel.
+            check_in (str): Fecha de llegada.
+            check_out (str): Fecha de salida.
+            rooms (int, optional): Habitaciones a ocupar.
+        """
+        self.add_nights(hotel_id, *stay_nights(check_in, check_out), rooms)
+
+    def add_nights(self, hotel_id, start, end, rooms=1):
+        """
+        Ocupa habitaciones de un hotel en las noches [start, end).
+
+        Args:
+            hotel_id (str): ID del hotel.
+            start (int): Ordinal de la primera noche.
+            end (int): Ordinal de la salida.
+            rooms (int, optional): Habitaciones a ocupar (negativo para
+                liberar).
+        """
+        occupancy = self.occupancy.setdefault(hotel_id, NightlyOccupancy())
+        occupancy.add(start, end, rooms)
+
+    def remove_stay(self, hotel_id, check_in, check_out, rooms=1):
+        """
+        Libera habitaciones de un hotel durante una estancia.
+
+        Args:
+            hotel_id (str): ID del hotel.
+            check_in (str): Fecha de llegada.
+            check_out (str): Fecha de salida.
+            rooms (int, optional): Habitaciones a liberar.
+        """
+        self.add_nights(hotel_id, *stay_nights(check_in, check_out), -rooms)
+
+    def booked_on(self, hotel_id, night):
+        """
+        Obtiene las habitaciones ocupadas de un hotel en una noche.
+
+        Args:
+            hotel_id (str): ID del hotel.
+            night (str): Fecha de la noche.
+
+        Returns:
+            int: Habitaciones ocupadas esa noche.
+        """
+        occupancy = self.occupancy.get(hotel_id)
+        return occupancy.booked(parse_date(night)) if occupancy else 0
+
+    def free_rooms(self, hotel_id, check_in, check_out):
+        """
+        Habitaciones libres durante todas las noches de una estancia.
+
+        Args:
+            hotel_id (str): ID del hotel.
+            check_in (str): Fecha de llegada.
+            check_out (str): Fecha de salida.
+
+        Returns:
+            int: Habitaciones libres, o None si el hotel no existe.
+        """
+        if hotel_id not in self.capacity:
+            return None
+        return self.free_nights(hotel_id, *stay_nights(check_in, check_out))
+
+    def free_nights(self, hotel_id, start, end):
+        """
+        Habitaciones libres durante todas las noches [start, end), con
+        las fechas ya convertidas (para consultar muchos hoteles).
+
+        Args:
+            hotel_id (str): ID del hotel.
+            start (int): Ordinal de la primera noche.
+            end (int): Ordinal de la salida.
+
+        Returns:
+            int: Habitaciones libres, o None si el hotel no existe.
+        """
+        capacity = self.capacity.get(hotel_id)
+        if capacity is None:
+            return None
+        occupancy = self.occupancy.get(hotel_id)
+        booked = occupancy.max_booked(start, end) if occupancy else 0
+        return max(capacity - booked, 0)
+
+    def rooms_available(self, hotel_id):
+        """
+        Habitaciones libres en la noche más ocupada de un hotel: el valor
+        que se guarda en Hotel.rooms_available. Se deriva de la ocupación,
+        por lo que reservar y cancelar lo mantienen consistente.
+
+        Args:
+            hotel_id (str): ID del hotel.
+
+        Returns:
+            int: Habitaciones libres, o None si el hotel no existe.
+        """
+        capacity = self.capacity.get(hotel_id)
+        if capacity is None:
+            return None
+        occupancy = self.occupancy.get(hotel_id)
+        return max(capacity - (occupancy.peak() if occupancy else 0), 0)
+
+    def can_book(self, hotel_id, check_in, check_out, rooms=1, overbooking=0):
+        """
+        Indica si se pueden ocupar habitaciones durante una estancia.
+
+        Args:
+            hotel_id (str): ID del hotel.
+            check_in (str): Fecha de llegada.
+            check_out (str): Fecha de salida.
+            rooms (int, optional): Habitaciones requeridas.
+            overbooking (int, optional): Reservaciones por noche que se
+                aceptan por encima de la capacidad.
+
+        Returns:
+            bool: True si hay suficientes habitaciones todas las noches.
+        """
+        capacity = self.capacity.get(hotel_id)
+        if capacity is None:
+            return False
+        start, end = stay_nights(check_in, check_out)
+        occupancy = self.occupancy.get(hotel_id)
+        booked = occupancy.max_booked(start, end) if occupancy else 0
+        return capacity + overbooking - booked >= rooms
+
+    def is_full(self, hotel_id, start, end, overbooking=0):
+        """
+        Indica si ninguna noche de [start, end) admite otra reservación.
+
+        Args:
+            hotel_id (str): ID del hotel.
+            start (int): Ordinal de la primera noche.
+            end (int): Ordinal de la salida.
+            overbooking (int, optional): Reservaciones por noche que se
+                aceptan por encima de la capacidad.
+
+        Returns:
+            bool: True si todas las noches están llenas (o el hotel no existe).
+        """
+        capacity = self.capacity.get(hotel_id)
+        if capacity is None:
+            return True
+        occupancy = self.occupancy.get(hotel_id)
+        if occupancy is None:
+            return capacity + overbooking <= 0
+        return all(occupancy.booked(night) >= capacity + overbooking
+                   for night in range(start, end))
+
+    def hotels_with_free_rooms(self, check_in, check_out, min_rooms=1):
+        """
+        Busca los hoteles con al menos min_rooms libres en una estancia,
+        sin recorrer las reservaciones.
+
+        Args:
+            check_in (str): Fecha de llegada.
+            check_out (str): Fecha de salida.
+            min_rooms (int, optional): Habitaciones libres requeridas.
+
+        Returns:
+            list: Lista de tuplas (hotel_id, habitaciones libres).
+        """
+        result = []
+        for hotel_id in self.capacity:
+            free = self.free_rooms(hotel_id, check_in, check_out)
+            if free >= min_rooms:
+                result.append((hotel_id, free))
+        return result
+
+
+class _HotelListener:
+    """Mantiene la capacidad del índice a partir de la tabla de hoteles."""
+
+    def __init__(self, index):
+        self.index = index
+
+    def on_insert(self, hotel):
+        """Registra la capacidad de un hotel."""
+        self.index.capacity[hotel.hotel_id] = hotel.rooms
+
+    def on_delete(self, hotel):
+        """Olvida la capacidad de un hotel."""
+        self.index.capacity.pop(hotel.hotel_id, None)
+
+    def on_reset(self, hotels):
+        """Reconstruye la capacidad de todos los hoteles."""
+        self.index.capacity = {h.hotel_id: h.rooms for h in hotels}
+
+
+class _ReservationListener:
+    """Mantiene la ocupación del índice con la tabla de reservaciones."""
+
+    def __init__(self, index):
+        self.index = index
+
+    def on_insert(self, reservation):
+        """Ocupa las noches de una reservación."""
+        try:
+            self.index.add_nights(reservation.hotel_id, *reservation.nights())
+        except ValueError:
+            pass
+
+    def on_delete(self, reservation):
+        """Libera las noches de una reservación."""
+        try:
+            self.index.add_nights(reservation.hotel_id,
+                                  *reservation.nights(), -1)
+        except ValueError:
+            pass
+
+    def on_reset(self, reservations):
+        """Reconstruye la ocupación a partir de todas las reservaciones."""
+        self.index.occupancy = {}
+        for reservation in reservations:
+            self.on_insert(reservation)
+
+
+# Índice por tabla de reservaciones y por tabla de hoteles. Las claves
+# son referencias débiles y los observadores forman una Subscription:
+# al descartarse cualquiera de las dos tablas del caché se retiran de
+# ambas, y la entrada desaparece con la tabla descartada.
+_INDEXES = weakref.WeakKeyDictionary()
+
+
+def availability_index(hotels_table, reservations_table):
+    """
+    Obtiene el índice de disponibilidad de un par de tablas, creándolo
+    y suscribiéndolo a sus cambios la primera vez. Si alguna de las
+    tablas ya se descartó del caché, el índice es una copia fija que no
+    se guarda.
+
+    Args:
+        hotels_table (RecordTable): Tabla de hoteles.
+        reservations_table (RecordTable): Tabla de reservaciones.
+
+    Returns:
+        AvailabilityIndex: Índice mantenido al día.
+    """
+    by_hotels = _INDEXES.setdefault(reservations_table,
+                                    weakref.WeakKeyDictionary())
+    index = by_hotels.get(hotels_table)
+    if index is None:
+        index = AvailabilityIndex()
+        subscription = Subscription(
+            [(hotels_table, _HotelListener(index)),
+             (reservations_table, _ReservationListener(index))])
+        if subscription.active:
+            by_hotels[hotels_table] = index
+    return index
@@ -0,0 +1,144 @@
+"""
+Benchmark de las métricas de analytics.py contra ciclos de Python.
+
+Calcula sobre las mismas reservaciones sintéticas (en memoria, sin leer
+archivos) la estancia promedio, la anticipación promedio, la ocupación
+por noche y los principales clientes de dos formas: con un ciclo de
+Python sobre los objetos Reservation y sus fechas en texto, y con
+ReservationArrays (se reporta aparte el costo de crear los arreglos).
+
+Uso:
+    python -m benchmarks.bench_analytics --rows 1000000
+"""
+
+import argparse
+import random
+import time
+from collections import Counter
+from datetime import date, timedelta
+
+from analytics import ReservationArrays
+from availability import parse_date, stay_nights
+from reservation import Reservation
+
+
+def generate(rows, seed=1):
+    """
+    Crea reservaciones sintéticas con su fecha de creación.
+
+    Args:
+        rows (int): Número de reservaciones.
+        seed (int, optional): Semilla del generador.
+
+    Returns:
+        tuple: (lista de Reservation, dict de fecha ISO de creación por ID).
+    """
+    rng = random.Random(seed)
+    first = date(2030, 1, 1)
+    days = [(first + timedelta(days=i)).isoformat() for i in range(400)]
+    reservations = []
+    booked_on = {}
+    for i in range(rows):
+        start = rng.randrange(30, 380)
+        nights = rng.randrange(1, 15)
+        reservations.append(Reservation(f"R{i}",
+                                        f"H{rng.randrange(rows // 100 + 1)}",
+                                        f"C{rng.randrange(rows // 10 + 1)}",
+                                        (days[start], days[start + nights])))
+        booked_on[f"R{i}"] = days[start - rng.randrange(1, 30)]
+    return reservations, booked_on
+
+
+def python_metrics(reservations, booked_on, top=10):
+    """
+    Calcula las métricas con un ciclo de Python sobre las reservaciones.
+
+    Returns:
+        tuple: (estancia promedio, anticipación promedio, habitaciones
+            ocupadas por noche (dict ordinal -> total), principales clientes).
+    """
+    total_nights = 0
+    count = 0
+    total_lead = 0
+    leads = 0
+    occupancy = Counter()
+    customer_nights = Counter()
+    for res in reservations:
+        try:
+            start, end = stay_nights(res.check_in, res.check_out)
+        except ValueError:
+            continue
+        total_nights += end - start
+        count += 1
+        booked = booked_on.get(res.reservation_id)
+        if booked is not None:
+            total_lead += start - parse_date(booked)
+            leads += 1
+        for night in range(start, end):
+            occupancy[night] += 1
+        customer_nights[res.customer_id] += end - start
+    return (total_nights / count, total_lead / leads, occupancy,
+            customer_nights.most_common(top))
+
+
+def numpy_metrics(arrays, top=10):
+    """Calcula las mismas métricas con ReservationArrays."""
+    nights, booked = arrays.occupancy_per_night()
+    return (arrays.average_stay(), arrays.average_lead_time(),
+            (nights, booked), arrays.top_customers(top))
+
+
+def run(rows):
+    """
+    Ejecuta el benchmark y verifica que ambas formas coincidan.
+
+    Args:
+        rows (int): Número de reservaciones.
+
+    Returns:
+        dict: Segundos de cada forma, de la creación de los arreglos y la
+            mejora.
+    """
+    reservations, booked_on = generate(rows)
+    result = {}
+
+    start = time.perf_counter()
+    expected = python_metrics(reservations, booked_on)
+    result["python_seconds"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    arrays = ReservationArrays(reservations, booked_on)
+    result["build_seconds"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = numpy_metrics(arrays)
+    result["numpy_seconds"] = time.perf_counter() - start
+
+    nights, booked = actual[2]
+    occupancy = {int(n.astype('int64')) + date(1970, 1, 1).toordinal(): int(b)
+                 for n, b in zip(nights, booked) if b}
+    result["match"] = (abs(actual[0] - expected[0]) < 1e-9
+                       and abs(actual[1] - expected[1]) < 1e-9
+                       and occupancy == dict(expected[2])
+                       and actual[3] == expected[3])
+    result["speedup"] = result["python_seconds"] / result["numpy_seconds"]
+    return result
+
+
+def main():
+    """Punto de entrada del benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1000000)
+    args = parser.parse_args()
+
+    result = run(args.rows)
+    print(f"Reservaciones: {args.rows}")
+    print(f"Ciclo de Python: {result['python_seconds'] * 1000:.0f} ms")
+    print(f"NumPy:           {result['numpy_seconds'] * 1000:.0f} ms "
+          f"({result['speedup']:.0f}x; crear los arreglos: "
+          f"{result['build_seconds'] * 1000:.0f} ms)")
+    print("Resultados iguales: " + ("sí" if result["match"] else "NO"))
+
+
+if __name__ == "__main__":
+    main()
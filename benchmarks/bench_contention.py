@@ -0,0 +1,92 @@
+"""
+Benchmark de reservaciones concurrentes entre varios procesos.
+
+Cada proceso intenta reservar la misma noche en un hotel con capacidad
+limitada. Al final se verifica que no haya sobreventa y se reporta el
+número de reservaciones por segundo.
+
+Uso:
+    python -m benchmarks.bench_contention --workers 4 --attempts 200
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from multiprocessing import Process
+
+from hotel import Hotel
+from customer import Customer
+from reservation import Reservation
+
+
+def _worker(directory, worker_id, attempts):
+    """Intenta crear attempts reservaciones desde un proceso."""
+    hotel_file = os.path.join(directory, "hotels_data.txt")
+    cust_file = os.path.join(directory, "customers_data.txt")
+    res_file = os.path.join(directory, "reservations_data.txt")
+    for i in range(attempts):
+        r = Reservation(f"R{worker_id}-{i}", "H1", "C1",
+                        ("2025-03-01", "2025-03-02"))
+        Reservation.create_reservation(res_file, hotel_file, cust_file, r)
+
+
+def run(workers, attempts, rooms):
+    """
+    Ejecuta el benchmark en un directorio temporal.
+
+    Args:
+        workers (int): Número de procesos.
+        attempts (int): Reservaciones que intenta cada proceso.
+        rooms (int): Habitaciones del hotel.
+
+    Returns:
+        dict: Reservaciones creadas, segundos y operaciones por segundo.
+    """
+    directory = tempfile.mkdtemp(prefix="bench_contention_")
+    try:
+        hotel_file = os.path.join(directory, "hotels_data.txt")
+        Hotel.create_hotel(hotel_file, Hotel("H1", "Bench", "Loc", rooms))
+        Customer.create_customer(os.path.join(directory, "customers_data.txt"),
+                                 Customer("C1", "Bench", "555", "b@mail.com"))
+
+        processes = [Process(target=_worker, args=(directory, w, attempts))
+                     for w in range(workers)]
+        start = time.perf_counter()
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        seconds = time.perf_counter() - start
+
+        booked = len(Reservation.load_reservations(
+            os.path.join(directory, "reservations_data.txt")))
+        return {
+            "booked": booked,
+            "overbooked": booked > rooms,
+            "seconds": seconds,
+            "ops_per_second": workers * attempts / seconds,
+        }
+    finally:
+        shutil.rmtree(directory)
+
+
+def main():
+    """Punto de entrada del benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--attempts", type=int, default=200)
+    parser.add_argument("--rooms", type=int, default=100)
+    args = parser.parse_args()
+
+    result = run(args.workers, args.attempts, args.rooms)
+    print(f"Procesos: {args.workers}, intentos por proceso: {args.attempts}, "
+          f"habitaciones: {args.rooms}")
+    print(f"Reservaciones creadas: {result['booked']} "
+          f"(sobreventa: {'sí' if result['overbooked'] else 'no'})")
+    print(f"Operaciones por segundo: {result['ops_per_second']:.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark de reservaciones en grupo contra un ciclo de una habitación.
+
+Reserva un bloque de habitaciones en uno o varios hoteles de dos formas
+sobre los mismos datos: con create_reservation una vez por habitación
+(una lectura y reescritura por llamada) y con create_group_booking (una
+sola confirmación).
+
+Uso:
+    python -m benchmarks.bench_group --rooms 40 --hotels 2 --rows 10000
+"""
+
+import argparse
+import shutil
+import tempfile
+import time
+
+from benchmarks.harness import generate_dataset
+from customer import Customer
+from reservation import Reservation
+from storage import close_all
+
+
+def _block(rooms, hotels, prefix):
+    """Reparte rooms habitaciones entre los primeros hotels hoteles."""
+    reservations = []
+    for number in range(hotels):
+        share = rooms // hotels + (1 if number < rooms % hotels else 0)
+        reservations += Reservation.group(f"{prefix}{number}", f"H{number}",
+                                          "C0", ("2030-06-01", "2030-06-04"),
+                                          share)
+    return reservations
+
+
+def run(rooms, hotels, rows):
+    """
+    Ejecuta el benchmark en un directorio temporal.
+
+    Args:
+        rooms (int): Habitaciones del bloque.
+        hotels (int): Hoteles entre los que se reparte el bloque.
+        rows (int): Hoteles, clientes y reservaciones del conjunto de datos.
+
+    Returns:
+        dict: Segundos de cada forma y la mejora del grupo.
+    """
+    result = {}
+    for mode in ("loop", "group"):
+        directory = tempfile.mkdtemp(prefix="bench_group_")
+        try:
+            hotel_file, cust_file, res_file = generate_dataset(directory, rows)
+            files = (res_file, hotel_file, cust_file)
+            reservations = _block(rooms, hotels, "G")
+            Customer.table(cust_file)
+            Reservation.availability(res_file, hotel_file)
+            start = time.perf_counter()
+            if mode == "loop":
+                booked = sum(Reservation.create_reservation(*files, res)
+                             for res in reservations)
+            else:
+                created = Reservation.create_group_booking(*files,
+                                                           reservations)
+                booked = len(reservations) if created else 0
+            result[f"{mode}_seconds"] = time.perf_counter() - start
+            result[f"{mode}_booked"] = booked
+        finally:
+            close_all()
+            shutil.rmtree(directory)
+    result["speedup"] = result["loop_seconds"] / result["group_seconds"]
+    return result
+
+
+def main():
+    """Punto de entrada del benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rooms", type=int, default=40)
+    parser.add_argument("--hotels", type=int, default=1)
+    parser.add_argument("--rows", type=int, default=10000)
+    args = parser.parse_args()
+
+    result = run(args.rooms, args.hotels, args.rows)
+    print(f"Habitaciones: {args.rooms}, hoteles: {args.hotels}, "
+          f"registros: {args.rows}")
+    print(f"Una por una: {result['loop_booked']} reservadas en "
+          f"{result['loop_seconds'] * 1000:.1f} ms")
+    print(f"En grupo:    {result['group_booked']} reservadas en "
+          f"{result['group_seconds'] * 1000:.1f} ms "
+          f"({result['speedup']:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
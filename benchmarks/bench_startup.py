@@ -0,0 +1,106 @@
+"""
+Benchmark del arranque de la línea de comandos.
+
+Mide el tiempo de pared de un proceso 'python main.py <subcomando>' por
+operación (importación de módulos y lectura de los archivos incluidas)
+contra un intérprete vacío, y el costo por operación de las mismas
+operaciones ejecutadas en un solo proceso con el modo batch.
+
+Uso:
+    python -m benchmarks.bench_startup --rows 10000 --repeat 5 --batch 2000
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.harness import generate_dataset
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN = os.path.join(ROOT, "main.py")
+
+COMMANDS = {
+    "python": None,
+    "hotel show": ["hotel", "show", "H1"],
+    "customer show": ["customer", "show", "C1"],
+    "reservation show": ["reservation", "show", "R1"],
+    "hotel modify": ["hotel", "modify", "H1", "--name", "Hotel Uno"],
+    "reservation book": ["reservation", "book", "{id}", "H2", "C2",
+                         "2031-01-01", "2031-01-02"],
+    "search": ["search", "Ciudad 7", "2031-01-01", "2031-01-03",
+               "--page-size", "5"],
+}
+
+
+def _run(files, arguments, stdin=None):
+    """Ejecuta un proceso y devuelve sus segundos de pared."""
+    if arguments is None:
+        command = [sys.executable, "-c", "pass"]
+    else:
+        command = [sys.executable, MAIN, "--hotels", files[0],
+                   "--customers", files[1], "--reservations", files[2],
+                   *arguments]
+    start = time.perf_counter()
+    subprocess.run(command, input=stdin, stdout=subprocess.DEVNULL,
+                   stderr=subprocess.DEVNULL, check=False, text=True)
+    return time.perf_counter() - start
+
+
+def run(rows, repeat, batch):
+    """
+    Ejecuta el benchmark en un directorio temporal.
+
+    Args:
+        rows (int): Hoteles, clientes y reservaciones del conjunto de datos.
+        repeat (int): Procesos por subcomando (se reporta el mejor).
+        batch (int): Reservaciones del modo batch.
+
+    Returns:
+        dict: Segundos por subcomando, y total y por operación del batch.
+    """
+    directory = tempfile.mkdtemp(prefix="bench_startup_")
+    try:
+        files = generate_dataset(directory, rows)
+        result = {}
+        serial = 0
+        for name, arguments in COMMANDS.items():
+            times = []
+            for _ in range(repeat):
+                serial += 1
+                args = None if arguments is None else \
+                    [arg.format(id=f"S{serial}") for arg in arguments]
+                times.append(_run(files, args))
+            result[name] = min(times)
+        lines = "".join(f"reservation book B{i} H{i % rows} C{i % rows} "
+                        "2031-02-01 2031-02-02\n" for i in range(batch))
+        result["batch_seconds"] = _run(
+            files, ["batch", "--commit-every", str(batch)], lines)
+        result["batch_per_op"] = result["batch_seconds"] / max(batch, 1)
+        return result
+    finally:
+        shutil.rmtree(directory)
+
+
+def main():
+    """Punto de entrada del benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--batch", type=int, default=2000)
+    args = parser.parse_args()
+
+    result = run(args.rows, args.repeat, args.batch)
+    print(f"Registros: {args.rows}, mejor de {args.repeat} procesos")
+    for name in COMMANDS:
+        print(f"{name:<18} {result[name] * 1000:7.1f} ms")
+    print(f"batch: {args.batch} reservaciones en "
+          f"{result['batch_seconds'] * 1000:.1f} ms "
+          f"({result['batch_per_op'] * 1000:.2f} ms por operación)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+"""
+Benchmark de las operaciones CRUD y de reservaciones.
+
+Genera hoteles, clientes y reservaciones sintéticos del tamaño indicado,
+mide cada operación pública y reporta operaciones por segundo, latencias
+p50/p99 y memoria máxima. Los resultados pueden guardarse en JSON y
+compararse contra una ejecución anterior para detectar regresiones.
+
+Uso:
+    python -m benchmarks.harness --rows 1000 100000 --output actual.json
+    python -m benchmarks.harness --rows 1000 --compare actual.json
+    python -m benchmarks.harness --rows 1000 --metrics metricas.prom
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+import metrics
+from hotel import Hotel
+from customer import Customer
+from reservation import Reservation
+from storage import close_all
+
+HOTEL_FILE = "hotels_data.txt"
+CUST_FILE = "customers_data.txt"
+RES_FILE = "reservations_data.txt"
+
+BASE_DATE = date(2025, 1, 1)
+
+
+def generate_dataset(directory, rows):
+    """
+    Escribe archivos sintéticos con rows hoteles, clientes y reservaciones.
+
+    Args:
+        directory (str): Directorio destino.
+        rows (int): Registros por archivo.
+
+    Returns:
+        tuple: Rutas (hoteles, clientes, reservaciones).
+    """
+    hotel_file = os.path.join(directory, HOTEL_FILE)
+    cust_file = os.path.join(directory, CUST_FILE)
+    res_file = os.path.join(directory, RES_FILE)
+    hotels = max(rows // 100, 1)
+    per_hotel = rows // hotels + 1
+
+    with open(hotel_file, 'w', encoding='utf-8') as file:
+        file.writelines(
+            f"H{i}|Hotel {i}|Ciudad {i % 50}|{per_hotel}|{per_hotel}\n"
+            for i in range(rows)
+        )
+    with open(cust_file, 'w', encoding='utf-8') as file:
+        file.writelines(
+            f"C{i}|Cliente {i}|555-{i:07d}|cliente{i}@mail.com\n"
+            for i in range(rows)
+        )
+    with open(res_file, 'w', encoding='utf-8') as file:
+        for i in range(rows):
+            check_in = BASE_DATE + timedelta(days=i % 365)
+            check_out = check_in + timedelta(days=1 + i % 7)
+            file.write(f"R{i}|H{i % hotels}|C{i}|{check_in.isoformat()}|"
+                       f"{check_out.isoformat()}\n")
+    return hotel_file, cust_file, res_file
+
+
+def measure(operation, repeat):
+    """
+    Mide una operación varias veces.
+
+    Args:
+        operation (callable): Recibe el número de iteración.
+        repeat (int): Número de ejecuciones cronometradas; se hace una
+            ejecución adicional para medir la memoria máxima.
+
+    Returns:
+        dict: ops_per_second, p50_ms, p99_ms y peak_kb.
+    """
+    latencies = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        operation(i)
+        latencies.append(time.perf_counter() - start)
+
+    # La memoria se mide en una ejecución aparte: tracemalloc altera los
+    # tiempos.
+    tracemalloc.start()
+    operation(repeat)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies.sort()
+    total = sum(latencies)
+    p99 = min(int(len(latencies) * 0.99), len(latencies) - 1)
+    return {
+        "ops_per_second": repeat / total if total > 0 else float(repeat),
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[p99] * 1000,
+        "peak_kb": peak / 1024,
+    }
+
+
+def _silenced(func):
+    """Ejecuta func descartando los mensajes de consola."""
+    def wrapper(*args):
+        stdout = sys.stdout
+        with open(os.devnull, 'w', encoding='utf-8') as devnull:
+            sys.stdout = devnull
+            try:
+                return func(*args)
+            finally:
+                sys.stdout = stdout
+    return wrapper
+
+
+def operations(hotel_file, cust_file, res_file, rows):
+    """
+    Define las operaciones a medir sobre un conjunto de datos.
+
+    Args:
+        hotel_file (str): Archivo de hoteles.
+        cust_file (str): Archivo de clientes.
+        res_file (str): Archivo de reservaciones.
+        rows (int): Registros por archivo.
+
+    Returns:
+        list: Lista de tuplas (nombre, operación, repeticiones).
+    """
+    def cold_load(_):
+        close_all()
+        Hotel.load_hotels(hotel_file)
+
+    def book(i):
+        r = Reservation(f"BR{i}", f"H{i % rows}", f"C{i % rows}",
+                        ("2026-06-01", "2026-06-03"))
+        Reservation.create_reservation(res_file, hotel_file, cust_file, r)
+
+    return [
+        ("load_hotels (frío)", cold_load, 5),
+        ("load_hotels", lambda _: Hotel.load_hotels(hotel_file), 5),
+        ("find_hotel",
+         lambda i: Hotel.find_hotel(hotel_file, f"H{rows - 1 - i}"), 50),
+        ("create_hotel", lambda i: Hotel.create_hotel(
+            hotel_file, Hotel(f"BH{i}", "Bench", "Loc", 10)), 20),
+        ("create_reservation", book, 20),
+        ("cancel_reservation", lambda i: Reservation.cancel_reservation(
+            res_file, hotel_file, f"BR{i}"), 20),
+        ("delete_customer", lambda i: Customer.delete_customer(
+            cust_file, f"C{rows - 1 - i}"), 20),
+    ]
+
+
+def run(sizes):
+    """
+    Ejecuta el benchmark para cada tamaño.
+
+    Args:
+        sizes (list): Tamaños de los conjuntos de datos.
+
+    Returns:
+        dict: Resultados por "operación@tamaño".
+    """
+    results = {}
+    for rows in sizes:
+        directory = tempfile.mkdtemp(prefix="bench_harness_")
+        try:
+            files = generate_dataset(directory, rows)
+            close_all()
+            for name, operation, repeat in operations(*files, rows):
+                results[f"{name}@{rows}"] = measure(_silenced(operation),
+                                                    repeat)
+        finally:
+            close_all()
+            shutil.rmtree(directory)
+    return results
+
+
+def compare(current, baseline, threshold):
+    """
+    Compara dos ejecuciones por operaciones por segundo.
+
+    Args:
+        current (dict): Resultados actuales.
+        baseline (dict): Resultados anteriores.
+        threshold (float): Caída relativa que se considera regresión.
+
+    Returns:
+        list: Lista de tuplas (clave, cambio relativo, es_regresión).
+    """
+    rows = []
+    for key, result in current.items():
+        if key not in baseline:
+            continue
+        before = baseline[key]["ops_per_second"]
+        after = result["ops_per_second"]
+        change = (after - before) / before if before else 0.0
+        rows.append((key, change, change < -threshold))
+    return rows
+
+
+def main():
+    """Punto de entrada del benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 100000],
+                        help="tamaños a medir, p. ej. 1000 100000 1000000")
+    parser.add_argument("--output", help="guardar resultados en JSON")
+    parser.add_argument("--compare", help="JSON de una ejecución anterior")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="caída de ops/s considerada regresión "
+                             "(0.2 = 20%%)")
+    parser.add_argument("--metrics", help="guardar el desglose de "
+                        "metrics.py (texto Prometheus)")
+    args = parser.parse_args()
+
+    if args.metrics:
+        metrics.enable()
+    results = run(args.rows)
+    if args.metrics:
+        metrics.write_prometheus(args.metrics)
+    print(f"{'operación':<32}{'ops/s':>12}{'p50 ms':>10}{'p99 ms':>10}"
+          f"{'pico KB':>12}")
+    for key, r in results.items():
+        print(f"{key:<32}{r['ops_per_second']:>12.1f}{r['p50_ms']:>10.3f}"
+              f"{r['p99_ms']:>10.3f}{r['peak_kb']:>12.0f}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as file:
+            baseline = json.load(file)
+        regressions = 0
+        changes = compare(results, baseline, args.threshold)
+        for key, change, regressed in changes:
+            mark = "  REGRESIÓN" if regressed else ""
+            print(f"{key:<32}{change:>+10.1%}{mark}")
+            regressions += regressed
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Módulo con las operaciones de carga y eliminación masiva sobre las
+tablas en memoria, y la exportación en flujo de su contenido.
+"""
+
+import time
+
+
+class BulkResult:
+    """
+    Resultado de una operación masiva.
+
+    Atributos:
+        processed (int): Registros aplicados.
+        rejected (list): IDs rechazados (duplicados, inexistentes o inválidos).
+        seconds (float): Duración de la operación.
+    """
+
+    def __init__(self, processed, rejected, seconds):
+        """
+        Inicializa el resultado.
+
+        Args:
+            processed (int): Registros aplicados.
+            rejected (list): IDs rechazados.
+            seconds (float): Duración en segundos.
+        """
+        self.processed = processed
+        self.rejected = rejected
+        self.seconds = seconds
+
+    @property
+    def records_per_second(self):
+        """float: Registros procesados (aplicados y rechazados) por segundo."""
+        total = self.processed + len(self.rejected)
+        return total / self.seconds if self.seconds > 0 else float(total)
+
+    def __repr__(self):
+        return (f"BulkResult(processed={self.processed}, "
+                f"rejected={len(self.rejected)}, "
+                f"records_per_second={self.records_per_second:.0f})")
+
+
+def merge_results(results, rejected=()):
+    """
+    Combina los resultados de varias operaciones masivas, por ejemplo
+    una por partición.
+
+    Args:
+        results (list): Resultados a combinar.
+        rejected (iterable, optional): IDs rechazados fuera de esas
+            operaciones.
+
+    Returns:
+        BulkResult: Registros aplicados, IDs rechazados y duración totales.
+    """
+    ids = [i for r in results for i in r.rejected] + list(rejected)
+    return BulkResult(sum(r.processed for r in results), ids,
+                      sum(r.seconds for r in results))
+
+
+def bulk_insert(table, records, accept=None):
+    """
+    Agrega muchos registros con una sola escritura del archivo.
+    Los IDs duplicados (en la tabla o dentro del mismo lote) se
+    detectan en una sola pasada con el índice de la tabla.
+
+    Args:
+        table (RecordTable): Tabla destino.
+        records (iterable): Registros a agregar.
+        accept (callable, optional): Validación adicional; recibe el
+            registro y regresa False para rechazarlo.
+
+    Returns:
+        BulkResult: Resultado de la operación.
+    """
+    start = time.perf_counter()
+    processed = 0
+    rejected = []
+    with table.batch():
+        for record in records:
+            if table.key(record) in table or (accept and not accept(record)):
+                rejected.append(table.key(record))
+                continue
+            table.insert(record)
+            processed += 1
+    return BulkResult(processed, rejected, time.perf_counter() - start)
+
+
+def bulk_delete(table, record_ids, on_delete=None):
+    """
+    Elimina muchos registros con una sola escritura del archivo.
+
+    Args:
+        table (RecordTable): Tabla destino.
+        record_ids (iterable): IDs a eliminar.
+        on_delete (callable, optional): Se llama con cada registro eliminado.
+
+    Returns:
+        BulkResult: Resultado de la operación; los IDs inexistentes
+        se reportan como rechazados.
+    """
+    start = time.perf_counter()
+    processed = 0
+    rejected = []
+    with table.batch():
+        for record_id in record_ids:
+            record = table.delete(record_id)
+            if record is None:
+                rejected.append(record_id)
+                continue
+            if on_delete:
+                on_delete(record)
+            processed += 1
+    return BulkResult(processed, rejected, time.perf_counter() - start)
+
+
+def export_table(table, out, predicate=None):
+    """
+    Escribe los registros de una tabla en un flujo de texto, una línea
+    a la vez, con el mismo formato que el archivo de datos.
+
+    Args:
+        table (RecordTable): Tabla origen.
+        out (io.TextIOBase): Flujo de salida (archivo abierto,
+            sys.stdout, ...).
+        predicate (callable, optional): Filtro de registros a exportar.
+
+    Returns:
+        BulkResult: Resultado de la operación.
+    """
+    start = time.perf_counter()
+    processed = 0
+    for record in table.values():
+        if predicate and not predicate(record):
+            continue
+        out.write(f"{record.to_line()}\n")
+        processed += 1
+    return BulkResult(processed, [], time.perf_counter() - start)
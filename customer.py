@@ -4,7 +4,13 @@ Módulo que define la clase Customer y sus métodos
 para CRUD y manejo de archivos.
 """
 
-import os
+from operator import attrgetter
+
+from bulk import bulk_delete, bulk_insert, export_table
+from indexes import secondary_index
+from metrics import timed
+from storage import intern_text, iter_records, open_table
+from transaction import Transaction
 
 
 class Customer:
@@ -18,6 +24,8 @@ class Customer:
         email (str): Correo electrónico.
     """
 
+    __slots__ = ('customer_id', 'name', 'phone', 'email')
+
     def __init__(self, customer_id, name, phone, email):
         """
         Inicializa un objeto Customer.
@@ -28,7 +36,7 @@ class Customer:
             phone (str): Teléfono del cliente.
             email (str): Email del cliente.
         """
-        self.customer_id = customer_id
+        self.customer_id = intern_text(customer_id)
         self.name = name
         self.phone = phone
         self.email = email
@@ -67,36 +75,150 @@ class Customer:
 
         return modified
 
+    def to_line(self):
+        """
+        Convierte el cliente a una línea del archivo de datos.
+
+        Returns:
+            str: Línea con formato customer_id|nombre|telefono|email
+        """
+        return f"{self.customer_id}|{self.name}|{self.phone}|{self.email}"
+
+    @staticmethod
+    def from_line(line):
+        """
+        Crea un cliente a partir de una línea del archivo de datos.
+
+        Args:
+            line (str): Línea sin salto de línea.
+
+        Returns:
+            Customer: Objeto Customer.
+
+        Raises:
+            ValueError: Si la línea no tiene el formato esperado.
+        """
+        return Customer.from_fields(line.split('|'))
+
+    @staticmethod
+    def from_fields(fields):
+        """
+        Crea un cliente a partir de los campos de una línea.
+
+        Args:
+            fields (list): Campos en el orden del archivo de datos.
+
+        Returns:
+            Customer: Objeto Customer.
+
+        Raises:
+            ValueError: Si los campos no tienen el formato esperado.
+        """
+        cust_id, name, phone, email = fields
+        return Customer(cust_id, name, phone, email)
+
+    @staticmethod
+    def table(filename, workers=None):
+        """
+        Obtiene la tabla en memoria del archivo de clientes.
+
+        Args:
+            filename (str): Ruta del archivo.
+            workers (int, optional): Procesos para cargar el archivo en
+                paralelo (ver loader.py).
+
+        Returns:
+            RecordTable: Tabla indexada por customer_id.
+        """
+        return open_table(filename, Customer.from_line,
+                          attrgetter('customer_id'),
+                          from_fields=Customer.from_fields, workers=workers,
+                          kind='customer')
+
+    @staticmethod
+    def iter_customers(filename, predicate=None):
+        """
+        Itera los clientes del archivo de forma perezosa, sin cargar
+        la lista completa. El llamador puede detenerse en cualquier momento.
+
+        Args:
+            filename (str): Ruta del archivo.
+            predicate (callable, optional): Filtro; recibe un Customer.
+
+        Yields:
+            Customer: Objetos Customer que cumplen el filtro.
+        """
+        return iter_records(filename, Customer.from_line,
+                            attrgetter('customer_id'), predicate,
+                            from_fields=Customer.from_fields)
+
+    @staticmethod
+    @timed('find_customer')
+    def find_customer(filename, customer_id):
+        """
+        Busca el cliente por su ID, deteniéndose en la primera coincidencia.
+
+        Args:
+            filename (str): Ruta del archivo.
+            customer_id (str): ID buscado.
+
+        Returns:
+            Customer: Objeto Customer, o None si no existe.
+        """
+        return next(iter_records(filename, Customer.from_line,
+                                 attrgetter('customer_id'),
+                                 record_id=customer_id,
+                                 from_fields=Customer.from_fields),
+                    None)
+
+    @staticmethod
+    def find_by_email(filename, email):
+        """
+        Busca los clientes con un email usando el índice secundario.
+
+        Args:
+            filename (str): Ruta del archivo.
+            email (str): Email buscado.
+
+        Returns:
+            list: Lista de objetos Customer.
+        """
+        return secondary_index(Customer.table(filename), 'email').lookup(email)
+
+    @staticmethod
+    def find_by_phone(filename, phone):
+        """
+        Busca los clientes con un teléfono usando el índice secundario.
+
+        Args:
+            filename (str): Ruta del archivo.
+            phone (str): Teléfono buscado.
+
+        Returns:
+            list: Lista de objetos Customer.
+        """
+        return secondary_index(Customer.table(filename), 'phone').lookup(phone)
+
     @staticmethod
-    def load_customers(filename):
+    @timed('load_customers')
+    def load_customers(filename, workers=None):
         """
         Carga la lista de clientes desde un archivo de texto.
         Formato esperado: customer_id|nombre|telefono|email
 
         Args:
             filename (str): Ruta del archivo.
+            workers (int, optional): Procesos para cargar en paralelo un
+                archivo grande; las líneas inválidas quedan en
+                table(filename).load_report.
 
         Returns:
             list: Lista de objetos Customer.
         """
-        customers = []
-        if not os.path.exists(filename):
-            return customers
-
-        with open(filename, 'r', encoding='utf-8') as file:
-            for line in file:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    cust_id, name, phone, email = line.split('|')
-                    c = Customer(cust_id, name, phone, email)
-                    customers.append(c)
-                except ValueError as err:
-                    print(f"[Error] Línea inválida: '{line}'. {err}")
-        return customers
+        return Customer.table(filename, workers).snapshot()
 
     @staticmethod
+    @timed('save_customers')
     def save_customers(filename, customers_list):
         """
         Guarda la lista de clientes en un archivo de texto (sobrescribe).
@@ -106,12 +228,13 @@ class Customer:
             filename (str): Ruta del archivo.
             customers_list (list): Lista de objetos Customer.
         """
-        with open(filename, 'w', encoding='utf-8') as file:
-            for cust in customers_list:
-                line = f"{cust.customer_id}|{cust.name}|{cust.phone}|{cust.email}\n"
-                file.write(line)
+        table = Customer.table(filename)
+        with Transaction(table):
+            table.replace(customers_list)
+            table.flush()
 
     @staticmethod
+    @timed('create_customer')
     def create_customer(filename, customer_obj):
         """
         Agrega un nuevo cliente en el archivo.
@@ -123,17 +246,38 @@ class Customer:
         Returns:
             bool: True si se agregó, False si existe ID duplicado.
         """
-        customers_list = Customer.load_customers(filename)
-        for c in customers_list:
-            if c.customer_id == customer_obj.customer_id:
-                print(f"[Error] Ya existe un cliente con ID '{customer_obj.customer_id}'")
+        table = Customer.table(filename)
+        with Transaction(table):
+            if not table.insert(customer_obj):
+                print("[Error] Ya existe un cliente con ID "
+                      f"'{customer_obj.customer_id}'")
                 return False
+        return True
+
+    @staticmethod
+    @timed('update_customer')
+    def update_customer(filename, customer_obj):
+        """
+        Guarda los cambios de un cliente existente (por ejemplo, después
+        de modify_customer_info) y actualiza los índices.
+
+        Args:
+            filename (str): Ruta del archivo.
+            customer_obj (Customer): Objeto Customer con los datos nuevos.
 
-        customers_list.append(customer_obj)
-        Customer.save_customers(filename, customers_list)
+        Returns:
+            bool: True si se guardó, False si no se encontró el ID.
+        """
+        table = Customer.table(filename)
+        with Transaction(table):
+            if not table.update(customer_obj):
+                print("[Aviso] No se encontró el Cliente con ID "
+                      f"'{customer_obj.customer_id}'.")
+                return False
         return True
 
     @staticmethod
+    @timed('delete_customer')
     def delete_customer(filename, customer_id):
         """
         Elimina un cliente del archivo por su ID.
@@ -145,11 +289,59 @@ class Customer:
         Returns:
             bool: True si se eliminó, False si no se encontró.
         """
-        customers_list = Customer.load_customers(filename)
-        new_list = [c for c in customers_list if c.customer_id != customer_id]
-        if len(new_list) == len(customers_list):
-            print(f"[Aviso] No se encontró el Cliente con ID '{customer_id}'.")
-            return False
-
-        Customer.save_customers(filename, new_list)
+        table = Customer.table(filename)
+        with Transaction(table):
+            if table.delete(customer_id) is None:
+                print("[Aviso] No se encontró el Cliente con ID "
+                      f"'{customer_id}'.")
+                return False
         return True
+
+    @staticmethod
+    @timed('bulk_create_customers')
+    def bulk_create_customers(filename, customers):
+        """
+        Agrega muchos clientes con una sola escritura del archivo.
+
+        Args:
+            filename (str): Ruta del archivo.
+            customers (iterable): Objetos Customer a agregar.
+
+        Returns:
+            BulkResult: Clientes agregados, IDs duplicados y registros/segundo.
+        """
+        table = Customer.table(filename)
+        with Transaction(table):
+            return bulk_insert(table, customers)
+
+    @staticmethod
+    @timed('bulk_delete_customers')
+    def bulk_delete_customers(filename, customer_ids):
+        """
+        Elimina muchos clientes con una sola escritura del archivo.
+
+        Args:
+            filename (str): Ruta del archivo.
+            customer_ids (iterable): IDs de los clientes a eliminar.
+
+        Returns:
+            BulkResult: Clientes eliminados, IDs no encontrados y
+                registros/segundo.
+        """
+        table = Customer.table(filename)
+        with Transaction(table):
+            return bulk_delete(table, customer_ids)
+
+    @staticmethod
+    def export_customers(filename, out):
+        """
+        Exporta los clientes a un flujo de texto en el formato del archivo.
+
+        Args:
+            filename (str): Ruta del archivo.
+            out (io.TextIOBase): Flujo de salida.
+
+        Returns:
+            BulkResult: Clientes exportados y registros/segundo.
+        """
+        return export_table(Customer.table(filename), out)
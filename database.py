@@ -0,0 +1,429 @@
+"""
+Módulo del almacenamiento en una base de datos SQLite.
+
+Una base de datos guarda una sola tabla (hotels, customers o
+reservations) con índices sobre las columnas que se consultan. La tabla
+en memoria se carga igual que un archivo de texto, pero cada cambio se
+escribe como una fila (INSERT/UPDATE/DELETE preparados) en lugar de
+reescribir el archivo, y el modo WAL permite lectores y escritores
+concurrentes desde otros procesos.
+
+Uso:
+    python database.py to-sqlite hotel data/hotels_data.txt data/hotels.db
+    python database.py to-text data/hotels.db data/hotels_data.txt
+"""
+
+import argparse
+import os
+import sqlite3
+from itertools import groupby
+
+from journal import DELETE
+from snapshot import INT, SCHEMAS
+from storage import SQLITE_MAGIC as MAGIC, RecordTable
+
+BUSY_TIMEOUT = 30.0
+
+TABLES = {
+    'hotel': ('hotels', ('hotel_id', 'name', 'location', 'rooms',
+                         'rooms_available')),
+    'customer': ('customers', ('customer_id', 'name', 'phone', 'email')),
+    'reservation': ('reservations', ('reservation_id', 'hotel_id',
+                                     'customer_id', 'check_in', 'check_out')),
+}
+
+INDEXES = {
+    'hotel': (('location',),),
+    'customer': (('email',), ('phone',)),
+    'reservation': (('hotel_id', 'check_in'), ('customer_id',)),
+}
+
+
+def is_database(filename):
+    """
+    Indica si un archivo es una base de datos SQLite.
+
+    Args:
+        filename (str): Ruta del archivo.
+
+    Returns:
+        bool: True si el archivo empieza con la firma de SQLite.
+    """
+    try:
+        with open(filename, 'rb') as file:
+            return file.read(len(MAGIC)) == MAGIC
+    except FileNotFoundError:
+        return False
+
+
+def connect(filename, kind=None):
+    """
+    Abre una base de datos en modo WAL y crea su tabla e índices si
+    no existen.
+
+    Args:
+        filename (str): Ruta de la base de datos.
+        kind (str, optional): 'hotel', 'customer' o 'reservation'; si se
+            omite se deduce de la tabla que ya existe.
+
+    Returns:
+        tuple: (sqlite3.Connection, tipo de registro).
+
+    Raises:
+        ValueError: Si se omite kind y la base no tiene ninguna tabla conocida.
+    """
+    connection = sqlite3.connect(filename, timeout=BUSY_TIMEOUT,
+                                 isolation_level=None)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=FULL")
+    if kind is None:
+        existing = {name for name, in connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table'")}
+        kind = next((k for k, (name, _) in TABLES.items()
+                     if name in existing), None)
+        if kind is None:
+            connection.close()
+            raise ValueError(f"{filename} no contiene una tabla de hoteles, "
+                             f"clientes o reservaciones")
+    name, columns = TABLES[kind]
+    definitions = [f"{column} {'INTEGER' if code == INT else 'TEXT'}"
+                   for column, code in zip(columns, SCHEMAS[kind])]
+    definitions[0] += " PRIMARY KEY"
+    connection.execute(f"CREATE TABLE IF NOT EXISTS {name} "
+                       f"({', '.join(definitions)})")
+    for index in INDEXES[kind]:
+        connection.execute("CREATE INDEX IF NOT EXISTS "
+                           f"{name}_{'_'.join(index)} "
+                           f"ON {name} ({', '.join(index)})")
+    return connection, kind
+
+
+class SQLiteWriter:
+    """
+    Escribe las operaciones de una tabla en la base de datos. Tiene la
+    interfaz de Journal, por lo que la tabla se comporta como en modo
+    registro: los cambios se aplican fila por fila y un lote (o una
+    transacción) se escribe en una sola transacción de SQLite.
+
+    Atributos:
+        path (str): Ruta de la base de datos.
+        entries (int): Siempre 0; la base nunca necesita compactarse.
+    """
+
+    def __init__(self, connection, kind, path):
+        """
+        Prepara las sentencias de la tabla.
+
+        Args:
+            connection (sqlite3.Connection): Conexión abierta con connect().
+            kind (str): Tipo de registro.
+            path (str): Ruta de la base de datos.
+        """
+        self.connection = connection
+        self.path = path
+        self.entries = 0
+        self._durable = True
+        name, columns = TABLES[kind]
+        updates = ', '.join(f"{c} = excluded.{c}" for c in columns[1:])
+        self.upsert_sql = (f"INSERT INTO {name} ({', '.join(columns)}) "
+                           f"VALUES ({', '.join('?' * len(columns))}) "
+                           f"ON CONFLICT ({columns[0]}) "
+                           f"DO UPDATE SET {updates}")
+        self.delete_sql = f"DELETE FROM {name} WHERE {columns[0]} = ?"
+        self.clear_sql = f"DELETE FROM {name}"
+
+    @property
+    def durable(self):
+        """bool: Sincronizar cada transacción al disco (synchronous=FULL)."""
+        return self._durable
+
+    @durable.setter
+    def durable(self, value):
+        self._durable = value
+        mode = 'FULL' if value else 'NORMAL'
+        self.connection.execute(f"PRAGMA synchronous={mode}")
+
+    def append(self, operation, payload):
+        """
+        Aplica una operación en su propia transacción.
+
+        Args:
+            operation (str): INSERT, UPDATE o DELETE.
+            payload (str): Línea del registro, o su ID en DELETE.
+        """
+        self.append_many([(operation, payload)])
+
+    def append_many(self, operations):
+        """
+        Aplica varias operaciones en una sola transacción. Las operaciones
+        consecutivas del mismo tipo se envían con executemany.
+
+        Args:
+            operations (list): Tuplas (operación, contenido).
+        """
+        with self.transaction():
+            for is_delete, group in groupby(operations,
+                                            lambda op: op[0] == DELETE):
+                if is_delete:
+                    self.connection.executemany(
+                        self.delete_sql, ((payload,) for _, payload in group))
+                else:
+                    self.connection.executemany(
+                        self.upsert_sql,
+                        (payload.split('|') for _, payload in group))
+
+    def rewrite(self, lines):
+        """
+        Reemplaza todas las filas en una sola transacción.
+
+        Args:
+            lines (iterable): Líneas de los registros.
+        """
+        with self.transaction():
+            self.connection.execute(self.clear_sql)
+            self.connection.executemany(self.upsert_sql,
+                                        (line.split('|') for line in lines))
+
+    def transaction(self):
+        """
+        Abre una transacción de escritura que espera a otros escritores.
+
+        Returns:
+            sqlite3.Connection: Conexión usable en un bloque with.
+        """
+        self.connection.execute("BEGIN IMMEDIATE")
+        return self.connection
+
+    def read(self):
+        """No hay operaciones pendientes de aplicar: la base está al día."""
+        return iter(())
+
+    def truncate(self):
+        """No hace nada: las operaciones ya están en la base."""
+
+    def remove(self):
+        """No hace nada: la base no tiene un registro aparte."""
+
+
+class SQLiteTable(RecordTable):
+    """
+    Tabla en memoria respaldada por una base de datos SQLite. Las
+    lecturas usan los registros en memoria; cada cambio se escribe en la
+    base sin reescribirla y refresh() detecta los cambios de otros
+    procesos con PRAGMA data_version.
+
+    Atributos:
+        kind (str): Tipo de registro de la tabla.
+        connection (sqlite3.Connection): Conexión a la base de datos.
+    """
+
+    def __init__(self, filename, parse, key, kind=None, from_fields=None):
+        """
+        Abre (o crea) la base de datos y carga sus filas.
+
+        Args:
+            filename (str): Ruta de la base de datos.
+            parse (callable): Convierte una línea en un registro.
+            key (callable): Obtiene el ID de un registro.
+            kind (str, optional): Tipo de registro; obligatorio si la
+                base no existe.
+            from_fields (callable, optional): Crea un registro a partir
+                de sus campos.
+        """
+        self.connection, self.kind = connect(filename, kind)
+        self._pid = os.getpid()
+        super().__init__(filename, parse, key, from_fields=from_fields)
+        self.journal = SQLiteWriter(self.connection, self.kind, filename)
+        self._signature = self._current_signature()
+
+    def _load(self, records):
+        """
+        Carga las filas de la base en el orden en que se insertaron.
+
+        Args:
+            records (dict): Registros indexados por ID.
+        """
+        name, columns = TABLES[self.kind]
+        rows = self.connection.execute(
+            f"SELECT {', '.join(columns)} FROM {name} ORDER BY rowid")
+        for fields in rows:
+            record = self.from_row(fields)
+            records[self.key(record)] = record
+
+    def lookup(self, column, value):
+        """
+        Consulta la base directamente usando sus índices.
+
+        Args:
+            column (str): Columna de la tabla.
+            value (object): Valor buscado.
+
+        Returns:
+            list: Registros nuevos (no los de la tabla en memoria).
+
+        Raises:
+            ValueError: Si la columna no existe.
+        """
+        name, columns = TABLES[self.kind]
+        if column not in columns:
+            raise ValueError(f"{name} no tiene la columna {column}")
+        rows = self.connection.execute(
+            f"SELECT {', '.join(columns)} FROM {name} "
+            f"WHERE {column} = ? ORDER BY rowid",
+            (value,))
+        return [self.from_row(fields) for fields in rows]
+
+    def write_file(self, path):
+        """
+        Escribe el contenido de la tabla en otra base de datos.
+
+        Args:
+            path (str): Ruta destino.
+        """
+        connection, _ = connect(path, self.kind)
+        try:
+            SQLiteWriter(connection, self.kind, path).rewrite(
+                r.to_line() for r in self._records.values())
+        finally:
+            connection.close()
+
+    def _current_signature(self):
+        """
+        Obtiene la versión de la base, que cambia cuando otra conexión
+        confirma una transacción.
+
+        Returns:
+            int: Valor de PRAGMA data_version.
+        """
+        return self.connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def refresh(self):
+        """
+        Recarga las filas si otra conexión cambió la base. En un proceso
+        hijo (fork) se abre una conexión nueva, porque la heredada no
+        puede usarse.
+
+        Returns:
+            bool: True si se recargó, False en caso contrario.
+        """
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self.connection, _ = connect(self.filename, self.kind)
+            self.journal = SQLiteWriter(self.connection, self.kind,
+                                        self.filename)
+            self.reload()
+            return True
+        return super().refresh()
+
+    def flush(self):
+        """Escribe las operaciones pendientes y, tras replace(), las filas."""
+        self.flush_journal()
+        if self._pending:
+            self.compact()
+
+    def flush_journal(self):
+        """Escribe en la base las operaciones acumuladas en un lote."""
+        if not self._journal_buffer:
+            return
+        self.journal.append_many(self._journal_buffer)
+        self._journal_buffer = []
+        self._signature = self._current_signature()
+        self._notify_commit()
+
+    def compact(self):
+        """Reemplaza todas las filas de la base con el contenido en memoria."""
+        self.journal.rewrite(r.to_line() for r in self._records.values())
+        self._journal_buffer = []
+        self._pending = 0
+        self._signature = self._current_signature()
+        self._notify_commit()
+
+    def disable_journal(self):
+        """No hace nada: una base de datos siempre escribe fila por fila."""
+
+    def close(self):
+        """Cierra la conexión a la base de datos."""
+        self.connection.close()
+
+
+def text_to_database(text_file, database_file, kind):
+    """
+    Copia un archivo delimitado por '|' a una base de datos.
+
+    Args:
+        text_file (str): Archivo de texto origen.
+        database_file (str): Base de datos destino (se reemplaza su tabla).
+        kind (str): 'hotel', 'customer' o 'reservation'.
+
+    Returns:
+        int: Filas copiadas.
+    """
+    width = len(TABLES[kind][1])
+    lines = []
+    with open(text_file, 'r', encoding='utf-8') as file:
+        for line in file:
+            line = line.strip()
+            if not line:
+                continue
+            if line.count('|') != width - 1:
+                print(f"[Error] Datos inválidos en línea: '{line}'.")
+                continue
+            lines.append(line)
+    connection, _ = connect(database_file, kind)
+    try:
+        SQLiteWriter(connection, kind, database_file).rewrite(lines)
+    finally:
+        connection.close()
+    return len(lines)
+
+
+def database_to_text(database_file, text_file):
+    """
+    Copia la tabla de una base de datos al formato delimitado por '|'.
+
+    Args:
+        database_file (str): Base de datos origen.
+        text_file (str): Archivo de texto destino.
+
+    Returns:
+        int: Filas copiadas.
+    """
+    connection, kind = connect(database_file)
+    name, columns = TABLES[kind]
+    count = 0
+    try:
+        with open(text_file, 'w', encoding='utf-8') as file:
+            for fields in connection.execute(
+                    f"SELECT {', '.join(columns)} FROM {name} ORDER BY rowid"):
+                file.write('|'.join(str(f) for f in fields) + '\n')
+                count += 1
+    finally:
+        connection.close()
+    return count
+
+
+def main():
+    """Punto de entrada de la migración entre texto y SQLite."""
+    parser = argparse.ArgumentParser(
+        description="Migra entre archivos de texto y SQLite")
+    commands = parser.add_subparsers(dest="command", required=True)
+    to_sqlite = commands.add_parser("to-sqlite", help="texto a base de datos")
+    to_sqlite.add_argument("kind", choices=sorted(TABLES))
+    to_sqlite.add_argument("source")
+    to_sqlite.add_argument("target")
+    to_text = commands.add_parser("to-text", help="base de datos a texto")
+    to_text.add_argument("source")
+    to_text.add_argument("target")
+    args = parser.parse_args()
+
+    if os.path.abspath(args.source) == os.path.abspath(args.target):
+        parser.error("el origen y el destino deben ser archivos distintos")
+    if args.command == "to-sqlite":
+        count = text_to_database(args.source, args.target, args.kind)
+    else:
+        count = database_to_text(args.source, args.target)
+    print(f"{count} registros migrados.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,593 @@
+"""
+Módulo de historial de eventos (event sourcing) de los archivos de datos.
+
+Cada cambio confirmado en las tablas se anexa a un archivo de eventos
+(HotelCreated, RoomsChanged, ReservationCreated, ReservationCancelled,
+...), con la marca de tiempo de la confirmación y el registro completo.
+Cada snapshot_every eventos se guarda una instantánea del estado, por lo
+que el estado actual (o el de cualquier momento pasado) se reconstruye
+con la última instantánea anterior y los eventos que la siguen.
+
+Formato del archivo de eventos:
+    <timestamp>|<tipo>|<registro en el formato del archivo de datos>
+
+Formato de una instantánea (<eventos>.<desplazamiento>.snap):
+    snapshot|<desplazamiento en el archivo de eventos>|<timestamp>
+    <tipo de registro>|<registro>
+    ...
+
+Uso:
+    python events.py replay data/events.log --at 2025-03-10T12:00:00
+        --out pasado/
+    python events.py history data/events.log R300
+    python events.py snapshot data/events.log
+"""
+
+import argparse
+import os
+import time
+from collections import namedtuple
+from datetime import datetime
+
+from hotel import Hotel
+from customer import Customer
+from reservation import Reservation
+from shards import open_manifest, shard_files
+from transaction import atomic_write, file_lock, lock_path
+
+HOTEL = 'hotel'
+CUSTOMER = 'customer'
+RESERVATION = 'reservation'
+
+# Tipos de evento por tipo de registro: (alta, modificación, baja).
+EVENT_TYPES = {
+    HOTEL: ('HotelCreated', 'HotelModified', 'HotelDeleted'),
+    CUSTOMER: ('CustomerCreated', 'CustomerModified', 'CustomerDeleted'),
+    RESERVATION: ('ReservationCreated', 'ReservationModified',
+                  'ReservationCancelled'),
+}
+ROOMS_CHANGED = 'RoomsChanged'
+
+KINDS = {name: kind for kind, names in EVENT_TYPES.items() for name in names}
+KINDS[ROOMS_CHANGED] = HOTEL
+REMOVALS = {names[2] for names in EVENT_TYPES.values()}
+
+SNAPSHOT_SUFFIX = '.snap'
+SNAPSHOT_HEADER = 'snapshot'
+
+Event = namedtuple('Event', ['timestamp', 'type', 'line'])
+
+
+def record_id(line):
+    """
+    Obtiene el ID de un registro en el formato del archivo de datos.
+
+    Args:
+        line (str): Línea del registro.
+
+    Returns:
+        str: Primer campo de la línea.
+    """
+    return line.split('|', 1)[0]
+
+
+def event_type(kind, old, new):
+    """
+    Clasifica el cambio de un registro.
+
+    Args:
+        kind (str): Tipo de registro.
+        old (str): Línea confirmada antes, o None si no existía.
+        new (str): Línea actual, o None si se eliminó.
+
+    Returns:
+        str: Tipo de evento. Los cambios de un hotel que sólo afectan
+            sus habitaciones son RoomsChanged.
+    """
+    created, modified, removed = EVENT_TYPES[kind]
+    if old is None:
+        return created
+    if new is None:
+        return removed
+    if kind == HOTEL and old.split('|')[:3] == new.split('|')[:3]:
+        return ROOMS_CHANGED
+    return modified
+
+
+def read_events(path, offset=0):
+    """
+    Lee los eventos completos de un archivo a partir de un desplazamiento.
+    Una última línea sin salto (escritura interrumpida) se ignora.
+
+    Args:
+        path (str): Archivo de eventos.
+        offset (int, optional): Byte donde empieza la lectura.
+
+    Yields:
+        tuple: (Event, desplazamiento del siguiente evento).
+    """
+    try:
+        file = open(path, 'rb')  # pylint: disable=consider-using-with
+    except FileNotFoundError:
+        return
+    with file:
+        file.seek(offset)
+        for raw in file:
+            if not raw.endswith(b'\n'):
+                return
+            offset += len(raw)
+            text = raw.decode('utf-8').rstrip('\n')
+            timestamp, name, line = text.split('|', 2)
+            yield Event(float(timestamp), name, line), offset
+
+
+class EventState:
+    """
+    Estado reconstruido a partir de eventos.
+
+    Atributos:
+        records (dict): Por tipo de registro, las líneas indexadas por ID.
+        offset (int): Desplazamiento del archivo de eventos ya aplicado.
+        timestamp (float): Marca de tiempo del último evento aplicado.
+    """
+
+    def __init__(self, offset=0, timestamp=0.0):
+        """
+        Inicializa un estado vacío.
+
+        Args:
+            offset (int, optional): Desplazamiento ya aplicado.
+            timestamp (float, optional): Marca de tiempo del estado.
+        """
+        self.records = {kind: {} for kind in EVENT_TYPES}
+        self.offset = offset
+        self.timestamp = timestamp
+
+    def apply(self, event):
+        """
+        Aplica un evento al estado.
+
+        Args:
+            event (Event): Evento a aplicar.
+        """
+        records = self.records[KINDS[event.type]]
+        if event.type in REMOVALS:
+            records.pop(record_id(event.line), None)
+        else:
+            records[record_id(event.line)] = event.line
+        self.timestamp = event.timestamp
+
+    def lines(self, kind):
+        """
+        Obtiene las líneas de un tipo de registro.
+
+        Args:
+            kind (str): 'hotel', 'customer' o 'reservation'.
+
+        Returns:
+            list: Líneas en el orden en que se crearon los registros.
+        """
+        return list(self.records[kind].values())
+
+    def save(self, hotel_file, cust_file, res_file):
+        """
+        Escribe el estado como archivos de datos de texto.
+
+        Args:
+            hotel_file (str): Archivo de hoteles destino.
+            cust_file (str): Archivo de clientes destino.
+            res_file (str): Archivo de reservaciones destino.
+        """
+        for kind, filename in ((HOTEL, hotel_file), (CUSTOMER, cust_file),
+                               (RESERVATION, res_file)):
+            atomic_write(filename, self.lines(kind))
+
+
+def snapshot_files(path):
+    """
+    Obtiene las instantáneas de un archivo de eventos.
+
+    Args:
+        path (str): Archivo de eventos.
+
+    Returns:
+        list: Rutas de las instantáneas, de la más antigua a la más nueva.
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    prefix = f"{name}."
+    return sorted(os.path.join(directory, f) for f in os.listdir(directory)
+                  if f.startswith(prefix) and f.endswith(SNAPSHOT_SUFFIX))
+
+
+def read_snapshot(snapshot_file, header_only=False):
+    """
+    Lee una instantánea.
+
+    Args:
+        snapshot_file (str): Ruta de la instantánea.
+        header_only (bool, optional): Leer sólo el desplazamiento y la
+            marca de tiempo.
+
+    Returns:
+        EventState: Estado guardado en la instantánea.
+    """
+    with open(snapshot_file, 'r', encoding='utf-8') as file:
+        _, offset, timestamp = file.readline().rstrip('\n').split('|')
+        state = EventState(int(offset), float(timestamp))
+        if header_only:
+            return state
+        for line in file:
+            kind, _, entry = line.rstrip('\n').partition('|')
+            state.records[kind][record_id(entry)] = entry
+    return state
+
+
+def write_snapshot(path, state):
+    """
+    Guarda una instantánea del estado junto al archivo de eventos.
+
+    Args:
+        path (str): Archivo de eventos.
+        state (EventState): Estado a guardar; su desplazamiento nombra
+            la instantánea.
+
+    Returns:
+        str: Ruta de la instantánea.
+    """
+    snapshot_file = f"{path}.{state.offset:012d}{SNAPSHOT_SUFFIX}"
+    lines = [f"{SNAPSHOT_HEADER}|{state.offset}|{state.timestamp:.6f}"]
+    lines.extend(f"{kind}|{line}" for kind, records in state.records.items()
+                 for line in records.values())
+    atomic_write(snapshot_file, lines)
+    return snapshot_file
+
+
+def replay(path, at=None):
+    """
+    Reconstruye el estado con la última instantánea anterior a un
+    momento y los eventos que la siguen.
+
+    Args:
+        path (str): Archivo de eventos.
+        at (float, optional): Marca de tiempo (time.time()); por omisión
+            el estado actual.
+
+    Returns:
+        EventState: Estado en ese momento (vacío si es anterior al
+            inicio del historial).
+    """
+    state = EventState()
+    snapshots = snapshot_files(path)
+    for snapshot_file in reversed(snapshots):
+        if at is None or read_snapshot(snapshot_file,
+                                       header_only=True).timestamp <= at:
+            state = read_snapshot(snapshot_file)
+            break
+    else:
+        if snapshots:
+            return state
+    for event, offset in read_events(path, state.offset):
+        if at is not None and event.timestamp > at:
+            break
+        state.apply(event)
+        state.offset = offset
+    return state
+
+
+def history(path, wanted_id):
+    """
+    Obtiene todos los eventos de un registro (auditoría).
+
+    Args:
+        path (str): Archivo de eventos.
+        wanted_id (str): ID del hotel, cliente o reservación.
+
+    Returns:
+        list: Eventos del registro en orden.
+    """
+    return [event for event, _ in read_events(path)
+            if record_id(event.line) == wanted_id]
+
+
+class _Recorder:
+    """
+    Observador de una tabla que convierte sus cambios confirmados en
+    eventos. Guarda la última línea confirmada de cada registro y, en
+    cada confirmación, compara sólo los IDs que cambiaron (o todos tras
+    recargar o reemplazar la tabla).
+    """
+
+    def __init__(self, store, table, kind, owns):
+        self.store = store
+        self.table = table
+        self.kind = kind
+        self.owns = owns
+        self.changed = set()
+        self.reset = False
+        self.committed = {}
+
+    def on_insert(self, entry):
+        """Marca el ID de un registro agregado."""
+        self.changed.add(self.table.key(entry))
+
+    def on_delete(self, entry):
+        """Marca el ID de un registro eliminado."""
+        self.changed.add(self.table.key(entry))
+
+    def on_reset(self, _):
+        """Marca todos los registros para compararlos en la confirmación."""
+        self.reset = True
+
+    def on_commit(self):
+        """Anexa los eventos de los cambios recién escritos."""
+        if self.changed or self.reset:
+            self.store.commit(self)
+
+    def sync(self):
+        """Toma el contenido actual de la tabla como confirmado."""
+        self.committed = {self.table.key(r): r.to_line()
+                          for r in self.table.values()}
+        self.changed = set()
+        self.reset = False
+
+    def diff(self):
+        """
+        Compara la tabla con las líneas confirmadas.
+
+        Returns:
+            list: Tuplas (tipo de evento, línea) de los cambios.
+        """
+        if self.reset:
+            keys = self.committed.keys() | {self.table.key(r)
+                                            for r in self.table.values()}
+        else:
+            keys = self.changed
+        changes = []
+        for key in keys:
+            old = self.committed.get(key)
+            entry = self.table.get(key)
+            new = entry.to_line() if entry is not None else None
+            if old == new:
+                continue
+            changes.append((event_type(self.kind, old, new),
+                            new if new is not None else old))
+            if new is None:
+                del self.committed[key]
+            else:
+                self.committed[key] = new
+        self.changed = set()
+        self.reset = False
+        return changes
+
+
+class EventStore:
+    """
+    Archivo de eventos al que anexan los observadores de las tablas.
+
+    Atributos:
+        path (str): Ruta del archivo de eventos.
+        snapshot_every (int): Eventos entre instantáneas.
+        offset (int): Bytes del archivo ya conocidos por este proceso.
+        pending (int): Eventos desde la última instantánea.
+        last_timestamp (float): Marca de tiempo del último evento.
+        recorders (list): Observadores de las tablas registradas.
+    """
+
+    def __init__(self, path, snapshot_every=1000):
+        """
+        Abre (o crea) un archivo de eventos.
+
+        Args:
+            path (str): Ruta del archivo de eventos.
+            snapshot_every (int, optional): Eventos entre instantáneas.
+        """
+        self.path = os.path.abspath(path)
+        self.snapshot_every = snapshot_every
+        self.recorders = []
+        self.offset = 0
+        self.pending = 0
+        self.last_timestamp = 0.0
+        snapshots = snapshot_files(self.path)
+        if snapshots:
+            header = read_snapshot(snapshots[-1], header_only=True)
+            self.offset = header.offset
+            self.last_timestamp = header.timestamp
+        self._catch_up()
+
+    def attach(self, table, kind, owns=None):
+        """
+        Registra los cambios de una tabla a partir de su contenido actual.
+
+        Args:
+            table (RecordTable): Tabla observada (sin cambios pendientes).
+            kind (str): 'hotel', 'customer' o 'reservation'.
+            owns (callable, optional): Indica si una línea de otro proceso
+                pertenece a esta tabla (particiones); por omisión todas.
+        """
+        for recorder in self.recorders:
+            if recorder.table is table:
+                return
+        recorder = _Recorder(self, table, kind, owns or (lambda line: True))
+        table.add_listener(recorder)
+        recorder.sync()
+        self.recorders.append(recorder)
+
+    def _catch_up(self):
+        """Aplica a los observadores los eventos de otros procesos."""
+        for event, offset in read_events(self.path, self.offset):
+            kind = KINDS[event.type]
+            for recorder in self.recorders:
+                if recorder.kind == kind and recorder.owns(event.line):
+                    if event.type in REMOVALS:
+                        recorder.committed.pop(record_id(event.line), None)
+                    else:
+                        recorder.committed[record_id(event.line)] = event.line
+            self.offset = offset
+            self.pending += 1
+            self.last_timestamp = event.timestamp
+
+    def commit(self, recorder):
+        """
+        Anexa los cambios de una tabla bajo el candado del archivo de
+        eventos y guarda una instantánea si corresponde.
+
+        Args:
+            recorder (_Recorder): Observador de la tabla confirmada.
+        """
+        with file_lock(lock_path(self.path)):
+            self._catch_up()
+            changes = recorder.diff()
+            if not changes:
+                return
+            timestamp = max(time.time(), self.last_timestamp)
+            data = ''.join(f"{timestamp:.6f}|{name}|{line}\n"
+                           for name, line in changes).encode('utf-8')
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                         0o644)
+            try:
+                os.write(fd, data)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            self.offset += len(data)
+            self.pending += len(changes)
+            self.last_timestamp = timestamp
+            if self.pending >= self.snapshot_every:
+                self.snapshot()
+
+    def snapshot(self):
+        """
+        Guarda una instantánea del estado actual.
+
+        Returns:
+            str: Ruta de la instantánea.
+        """
+        with file_lock(lock_path(self.path)):
+            state = replay(self.path)
+            self.offset = state.offset
+            self.pending = 0
+            return write_snapshot(self.path, state)
+
+
+_STORES = {}
+
+
+def _shard_owner(manifest, filename):
+    """
+    Crea el filtro de las reservaciones que guarda una partición.
+
+    Args:
+        manifest (ShardManifest): Manifiesto de las particiones.
+        filename (str): Ruta absoluta de la partición.
+
+    Returns:
+        callable: Recibe una línea y devuelve True si es de la partición.
+    """
+    def owns(line):
+        shard = manifest.shards.get(manifest.key_for(line.split('|')[1]))
+        return shard is not None and os.path.abspath(shard) == filename
+    return owns
+
+
+def record(hotel_file, cust_file, res_file, path=None, snapshot_every=1000):
+    """
+    Empieza a registrar los cambios de los tres archivos. Si el archivo
+    de eventos no existe, su primera instantánea es el contenido actual.
+    Las tablas quedan fijadas en el caché para no perder sus observadores;
+    las particiones creadas después no se registran.
+
+    Args:
+        hotel_file (str): Archivo de hoteles.
+        cust_file (str): Archivo de clientes.
+        res_file (str): Archivo de reservaciones o manifiesto de particiones.
+        path (str, optional): Archivo de eventos; por omisión events.log
+            en el directorio de los datos.
+        snapshot_every (int, optional): Eventos entre instantáneas.
+
+    Returns:
+        EventStore: Archivo de eventos con las tablas registradas.
+    """
+    if path is None:
+        path = os.path.join(os.path.dirname(os.path.abspath(hotel_file)),
+                            'events.log')
+    path = os.path.abspath(path)
+    hotels = Hotel.table(hotel_file)
+    customers = Customer.table(cust_file)
+    shards = [Reservation.table(shard) for shard in shard_files(res_file)]
+
+    with file_lock(lock_path(path)):
+        if not os.path.exists(path):
+            state = EventState(timestamp=time.time())
+            for kind, tables in ((HOTEL, [hotels]), (CUSTOMER, [customers]),
+                                 (RESERVATION, shards)):
+                for table in tables:
+                    state.records[kind].update(
+                        (table.key(r), r.to_line()) for r in table.values())
+            open(path, 'ab').close()  # pylint: disable=consider-using-with
+            write_snapshot(path, state)
+        store = _STORES.get(path)
+        if store is None:
+            store = _STORES[path] = EventStore(path, snapshot_every)
+        store.snapshot_every = snapshot_every
+
+    manifest = open_manifest(res_file)
+    store.attach(hotels, HOTEL)
+    store.attach(customers, CUSTOMER)
+    for table in shards:
+        owner = (None if manifest is None
+                 else _shard_owner(manifest, table.filename))
+        store.attach(table, RESERVATION, owner)
+    for table in [hotels, customers, *shards]:
+        table.pinned = True
+    return store
+
+
+def parse_time(value):
+    """
+    Convierte una fecha y hora ISO (hora local) a marca de tiempo.
+
+    Args:
+        value (str): Fecha 'AAAA-MM-DD' o fecha y hora 'AAAA-MM-DDTHH:MM:SS'.
+
+    Returns:
+        float: Segundos desde la época.
+    """
+    return datetime.fromisoformat(value).timestamp()
+
+
+def main():
+    """Punto de entrada de las herramientas del historial."""
+    parser = argparse.ArgumentParser(
+        description="Historial de eventos de los datos")
+    commands = parser.add_subparsers(dest="command", required=True)
+    replay_cmd = commands.add_parser(
+        "replay", help="reconstruir el estado en un momento")
+    replay_cmd.add_argument("events")
+    replay_cmd.add_argument("--at", type=parse_time,
+                            help="fecha y hora ISO (hora local)")
+    replay_cmd.add_argument("--out", required=True, help="directorio destino")
+    history_cmd = commands.add_parser("history", help="eventos de un registro")
+    history_cmd.add_argument("events")
+    history_cmd.add_argument("record_id")
+    snapshot_cmd = commands.add_parser(
+        "snapshot", help="guardar una instantánea ahora")
+    snapshot_cmd.add_argument("events")
+    args = parser.parse_args()
+
+    if args.command == "replay":
+        state = replay(args.events, args.at)
+        os.makedirs(args.out, exist_ok=True)
+        state.save(*(os.path.join(args.out, name) for name in (
+            "hotels_data.txt", "customers_data.txt", "reservations_data.txt")))
+        moment = datetime.fromtimestamp(state.timestamp).isoformat()
+        print(f"Estado al {moment} guardado en {args.out}.")
+    elif args.command == "history":
+        for event in history(args.events, args.record_id):
+            print(f"{datetime.fromtimestamp(event.timestamp).isoformat()} "
+                  f"{event.type} {event.line}")
+    else:
+        print(f"Instantánea guardada en {EventStore(args.events).snapshot()}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,379 @@
+"""
+Módulo de ordenamiento externo y combinación de archivos de reservaciones.
+
+Los archivos se leen en bloques que caben en el presupuesto de memoria;
+cada bloque se ordena y se escribe como una corrida temporal, y las
+corridas se combinan con heapq.merge (en varias pasadas si son más de
+FAN_IN), por lo que la memoria no depende del tamaño de los archivos.
+
+Las reservaciones se ordenan por reservation_id o por (hotel_id,
+check_in). Con unique, cada reservation_id queda una sola vez: las
+copias idénticas se descartan y las que comparten el ID con datos
+distintos se reportan como conflicto, conservando la primera en el
+orden de los archivos de entrada.
+
+Uso:
+    python external_sort.py sort data/reservations_data.txt ordenadas.txt
+        --order hotel
+    python external_sort.py merge recepcion1.txt recepcion2.txt
+        -o data/reservations_data.txt
+"""
+
+import argparse
+import heapq
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from collections import namedtuple
+from operator import itemgetter
+
+from loader import Diagnostic
+from shards import shard_files
+from transaction import atomic_write
+
+BY_ID = 'id'
+BY_HOTEL = 'hotel'
+
+KEYS = {
+    BY_ID: itemgetter(0),
+    BY_HOTEL: itemgetter(1, 3, 0),
+}
+
+FIELDS = 5
+
+MEMORY = 64 * 1024 * 1024
+
+FAN_IN = 64
+
+# Bytes estimados por registro en memoria además del texto de la línea
+# (tupla de la corrida, cadenas de la clave y su encabezado).
+RECORD_OVERHEAD = 300
+
+Conflict = namedtuple('Conflict', ['reservation_id', 'kept_source', 'kept',
+                                   'source', 'line'])
+
+
+class SortReport:
+    """
+    Reporte de un ordenamiento o una combinación.
+
+    Atributos:
+        target (str): Archivo escrito.
+        records (int): Registros escritos.
+        duplicates (int): Copias idénticas descartadas.
+        conflicts (list): Conflict de cada reservation_id repetido con
+            datos distintos (se conservó kept).
+        diagnostics (list): Diagnostic de cada línea inválida (omitida).
+        runs (int): Corridas temporales escritas.
+        passes (int): Pasadas de combinación.
+        seconds (float): Duración.
+    """
+
+    def __init__(self, target):
+        """
+        Inicializa un reporte vacío.
+
+        Args:
+            target (str): Archivo escrito.
+        """
+        self.target = target
+        self.records = 0
+        self.duplicates = 0
+        self.conflicts = []
+        self.diagnostics = []
+        self.runs = 0
+        self.passes = 0
+        self.seconds = 0.0
+
+    @property
+    def ok(self):
+        """bool: True si no hubo conflictos ni líneas inválidas."""
+        return not self.conflicts and not self.diagnostics
+
+    def summary(self):
+        """
+        Resume el reporte en una línea.
+
+        Returns:
+            str: Registros escritos, duplicados, conflictos y líneas inválidas.
+        """
+        message = (f"{self.records} registros en '{self.target}' "
+                   f"({self.duplicates} duplicados descartados).")
+        if self.conflicts:
+            first = self.conflicts[0]
+            message += (f" [Error] {len(self.conflicts)} conflicto(s) de ID; "
+                        f"primero '{first.reservation_id}': se conservó "
+                        f"'{first.kept}' ({first.kept_source}) y no "
+                        f"'{first.line}' ({first.source}).")
+        if self.diagnostics:
+            message += (f" [Error] {len(self.diagnostics)} línea(s) "
+                        "inválida(s) omitida(s).")
+        return message
+
+    def to_dict(self):
+        """
+        Convierte el reporte a tipos serializables en JSON.
+
+        Returns:
+            dict: Contenido del reporte.
+        """
+        return {
+            "target": self.target,
+            "records": self.records,
+            "duplicates": self.duplicates,
+            "runs": self.runs,
+            "passes": self.passes,
+            "seconds": self.seconds,
+            "conflicts": [c._asdict() for c in self.conflicts],
+            "diagnostics": [d._asdict() for d in self.diagnostics],
+        }
+
+    def __repr__(self):
+        return (f"SortReport(records={self.records}, "
+                f"duplicates={self.duplicates}, "
+                f"conflicts={len(self.conflicts)}, runs={self.runs})")
+
+
+def _write_run(directory, entries):
+    """Escribe una corrida ordenada, una línea 'fuente|registro' por valor."""
+    fd, path = tempfile.mkstemp(suffix='.run', dir=directory)
+    with os.fdopen(fd, 'w', encoding='utf-8') as file:
+        file.writelines(f"{source}|{line}\n" for _, source, line in entries)
+    return path
+
+
+def _read_run(path, key):
+    """Itera las entradas (clave, fuente, registro) de una corrida."""
+    with open(path, 'r', encoding='utf-8') as file:
+        for raw in file:
+            source, line = raw.rstrip('\n').split('|', 1)
+            yield key(line.split('|')), int(source), line
+
+
+def _make_runs(sources, directory, key, memory, report):
+    """
+    Lee los archivos en bloques de hasta memory bytes estimados y escribe
+    cada bloque ordenado (de forma estable) como una corrida.
+
+    Returns:
+        list: Rutas de las corridas, en el orden de entrada.
+    """
+    runs = []
+    entries = []
+    size = 0
+    for number, source in enumerate(sources):
+        with open(source, 'rb') as file:
+            offset = 0
+            for line_number, raw in enumerate(file, 1):
+                start, offset = offset, offset + len(raw)
+                line = raw.decode('utf-8', errors='replace').strip()
+                if not line:
+                    continue
+                fields = line.split('|')
+                if len(fields) != FIELDS or not fields[0]:
+                    report.diagnostics.append(Diagnostic(
+                        line_number, start, line,
+                        f"se esperaban {FIELDS} campos en '{source}'"))
+                    continue
+                entries.append((key(fields), number, line))
+                size += 2 * len(line) + RECORD_OVERHEAD
+                if size >= memory:
+                    entries.sort(key=itemgetter(0))
+                    runs.append(_write_run(directory, entries))
+                    entries = []
+                    size = 0
+    if entries or not runs:
+        entries.sort(key=itemgetter(0))
+        runs.append(_write_run(directory, entries))
+    report.runs += len(runs)
+    return runs
+
+
+def _merge_runs(runs, directory, key, fan_in, report):
+    """
+    Combina corridas consecutivas de fan_in en fan_in hasta que queden
+    a lo más fan_in (el orden entre corridas se conserva, por lo que la
+    combinación sigue siendo estable).
+
+    Returns:
+        list: Rutas de las corridas restantes.
+    """
+    while len(runs) > fan_in:
+        merged = []
+        for i in range(0, len(runs), fan_in):
+            group = runs[i:i + fan_in]
+            merged.append(_write_run(directory, heapq.merge(
+                *(_read_run(path, key) for path in group), key=itemgetter(0))))
+            for path in group:
+                os.remove(path)
+        runs = merged
+        report.runs += len(runs)
+        report.passes += 1
+    return runs
+
+
+def _unique(entries, sources, report):
+    """
+    Deja pasar la primera entrada de cada reservation_id (las repetidas
+    deben llegar juntas, es decir, ordenadas por ID).
+    """
+    kept_id = kept_source = kept_line = None
+    for entry in entries:
+        _, source, line = entry
+        reservation_id = line.split('|', 1)[0]
+        if reservation_id == kept_id:
+            if line == kept_line:
+                report.duplicates += 1
+            else:
+                report.conflicts.append(Conflict(
+                    reservation_id, sources[kept_source], kept_line,
+                    sources[source], line))
+            continue
+        kept_id, kept_source, kept_line = reservation_id, source, line
+        yield entry
+
+
+def _sort(sources, target, order, unique, memory, fan_in, directory, report):
+    """Ordena sources en target con corridas en directory."""
+    key = KEYS[order]
+    runs = _merge_runs(_make_runs(sources, directory, key, memory, report),
+                       directory, key, fan_in, report)
+    entries = heapq.merge(*(_read_run(path, key) for path in runs),
+                          key=itemgetter(0))
+    report.passes += 1
+    if unique:
+        entries = _unique(entries, sources, report)
+    report.records = 0
+
+    def lines():
+        for _, _, line in entries:
+            report.records += 1
+            yield line
+
+    atomic_write(target, lines())
+    for path in runs:
+        os.remove(path)
+
+
+def sort_reservations(source, target, order=BY_HOTEL, unique=True,
+                      memory=MEMORY, fan_in=FAN_IN):
+    """
+    Ordena un archivo de reservaciones sin cargarlo completo en memoria.
+
+    Args:
+        source (str): Archivo de reservaciones o manifiesto de particiones.
+        target (str): Archivo destino (puede ser source; se reemplaza de
+            forma atómica al terminar).
+        order (str, optional): BY_HOTEL para (hotel_id, check_in,
+            reservation_id) o BY_ID para reservation_id.
+        unique (bool, optional): Dejar una sola reservación por ID (en
+            BY_HOTEL se agrega una pasada por ID para encontrarlas).
+        memory (int, optional): Presupuesto de memoria en bytes.
+        fan_in (int, optional): Corridas que se combinan a la vez.
+
+    Returns:
+        SortReport: Registros, duplicados, conflictos y líneas inválidas.
+
+    Raises:
+        ValueError: Si order no es BY_ID ni BY_HOTEL.
+    """
+    return merge_reservations([source], target, order, unique, memory, fan_in)
+
+
+def merge_reservations(sources, target, order=BY_ID, unique=True,
+                       memory=MEMORY, fan_in=FAN_IN):
+    """
+    Combina varios archivos de reservaciones (por ejemplo, de distintas
+    recepciones) en un solo archivo ordenado, con memoria acotada. Cada
+    reservation_id queda una vez; si dos archivos lo tienen con datos
+    distintos se conserva el del primer archivo y se reporta el conflicto.
+
+    Args:
+        sources (list): Archivos de reservaciones o manifiestos, en orden
+            de preferencia.
+        target (str): Archivo destino (puede ser uno de sources).
+        order (str, optional): BY_ID o BY_HOTEL.
+        unique (bool, optional): Quitar duplicados y reportar conflictos.
+        memory (int, optional): Presupuesto de memoria en bytes.
+        fan_in (int, optional): Corridas que se combinan a la vez.
+
+    Returns:
+        SortReport: Registros, duplicados, conflictos y líneas inválidas.
+
+    Raises:
+        ValueError: Si order no es BY_ID ni BY_HOTEL.
+    """
+    if order not in KEYS:
+        raise ValueError(f"orden desconocido: {order}")
+    start = time.perf_counter()
+    files = [shard for source in sources for shard in shard_files(source)]
+    report = SortReport(target)
+    directory = tempfile.mkdtemp(prefix='.sort_',
+                                 dir=os.path.dirname(os.path.abspath(target)))
+    try:
+        if unique and order != BY_ID:
+            # Los repetidos sólo quedan juntos en orden de ID: primero se
+            # depura por ID y luego se ordena el resultado.
+            unique_file = os.path.join(directory, 'unique.txt')
+            _sort(files, unique_file, BY_ID, True, memory, fan_in,
+                  directory, report)
+            _sort([unique_file], target, order, False, memory, fan_in,
+                  directory, report)
+        else:
+            _sort(files, target, order, unique, memory, fan_in,
+                  directory, report)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def main():
+    """Punto de entrada de la línea de comandos."""
+    options = argparse.ArgumentParser(add_help=False)
+    options.add_argument("--order", choices=sorted(KEYS), default=None,
+                         help="por omisión hotel en sort e id en merge")
+    options.add_argument("--memory", type=int, default=MEMORY // (1024 * 1024),
+                         help="presupuesto de memoria en MiB")
+    options.add_argument("--keep-duplicates", action="store_true")
+    options.add_argument("--report", help="guardar el reporte en JSON")
+    parser = argparse.ArgumentParser(
+        description="Ordena y combina archivos de reservaciones "
+                    "con memoria acotada")
+    commands = parser.add_subparsers(dest="command", required=True)
+    command = commands.add_parser("sort", parents=[options],
+                                  help="ordenar un archivo")
+    command.add_argument("source")
+    command.add_argument("target")
+    command = commands.add_parser("merge", parents=[options],
+                                  help="combinar varios archivos")
+    command.add_argument("sources", nargs="+")
+    command.add_argument("-o", "--output", required=True)
+    args = parser.parse_args()
+
+    memory = args.memory * 1024 * 1024
+    unique = not args.keep_duplicates
+    try:
+        if args.command == "sort":
+            report = sort_reservations(args.source, args.target,
+                                       args.order or BY_HOTEL, unique, memory)
+        else:
+            report = merge_reservations(args.sources, args.output,
+                                        args.order or BY_ID, unique, memory)
+    except FileNotFoundError as err:
+        print(f"[Error] No se encontró el archivo '{err.filename}'.")
+        sys.exit(1)
+    print(report.summary())
+    print(f"{report.runs} corridas, {report.passes} pasadas, "
+          f"{report.seconds:.2f} s")
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as file:
+            json.dump(report.to_dict(), file, indent=2, ensure_ascii=False)
+    sys.exit(0 if report.ok else 1)
+
+
+if __name__ == "__main__":
+    main()
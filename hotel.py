@@ -4,7 +4,13 @@ Módulo que define la clase Hotel y sus métodos
 para CRUD y manejo de archivos.
 """
 
-import os
+from operator import attrgetter
+
+from bulk import bulk_delete, bulk_insert, export_table
+from indexes import secondary_index
+from metrics import timed
+from storage import intern_text, iter_records, open_table
+from transaction import Transaction
 
 
 class Hotel:
@@ -19,6 +25,8 @@ class Hotel:
         rooms_available (int): habitaciones disponibles.
     """
 
+    __slots__ = ('hotel_id', 'name', 'location', 'rooms', 'rooms_available')
+
     def __init__(self, hotel_id, name, location, rooms):
         """
         Inicializa un objeto Hotel.
@@ -29,9 +37,9 @@ class Hotel:
             location (str): Ubicación del hotel.
             rooms (int): Número total de habitaciones.
         """
-        self.hotel_id = hotel_id
+        self.hotel_id = intern_text(hotel_id)
         self.name = name
-        self.location = location
+        self.location = intern_text(location)
         self.rooms = int(rooms)
         self.rooms_available = int(rooms)
 
@@ -95,8 +103,121 @@ class Hotel:
         if self.rooms_available < self.rooms:
             self.rooms_available += 1
 
+    def to_line(self):
+        """
+        Convierte el hotel a una línea del archivo de datos.
+
+        Returns:
+            str: Línea con formato
+                hotel_id|nombre|ubicacion|rooms|rooms_available
+        """
+        return (f"{self.hotel_id}|{self.name}|{self.location}|"
+                f"{self.rooms}|{self.rooms_available}")
+
+    @staticmethod
+    def from_line(line):
+        """
+        Crea un hotel a partir de una línea del archivo de datos.
+
+        Args:
+            line (str): Línea sin salto de línea.
+
+        Returns:
+            Hotel: Objeto Hotel.
+
+        Raises:
+            ValueError: Si la línea no tiene el formato esperado.
+        """
+        return Hotel.from_fields(line.split('|'))
+
+    @staticmethod
+    def from_fields(fields):
+        """
+        Crea un hotel a partir de los campos de una línea.
+
+        Args:
+            fields (list): Campos en el orden del archivo de datos.
+
+        Returns:
+            Hotel: Objeto Hotel.
+
+        Raises:
+            ValueError: Si los campos no tienen el formato esperado.
+        """
+        hotel_id, name, location, rooms, rooms_avail = fields
+        h = Hotel(hotel_id, name, location, rooms)
+        h.rooms_available = int(rooms_avail)
+        return h
+
+    @staticmethod
+    def table(filename, workers=None):
+        """
+        Obtiene la tabla en memoria del archivo de hoteles.
+
+        Args:
+            filename (str): Ruta del archivo.
+            workers (int, optional): Procesos para cargar el archivo en
+                paralelo (ver loader.py).
+
+        Returns:
+            RecordTable: Tabla indexada por hotel_id.
+        """
+        return open_table(filename, Hotel.from_line, attrgetter('hotel_id'),
+                          from_fields=Hotel.from_fields, workers=workers,
+                          kind='hotel')
+
+    @staticmethod
+    def iter_hotels(filename, predicate=None):
+        """
+        Itera los hoteles del archivo de forma perezosa, sin cargar
+        la lista completa. El llamador puede detenerse en cualquier momento.
+
+        Args:
+            filename (str): Ruta del archivo.
+            predicate (callable, optional): Filtro; recibe un Hotel.
+
+        Yields:
+            Hotel: Objetos Hotel que cumplen el filtro.
+        """
+        return iter_records(filename, Hotel.from_line, attrgetter('hotel_id'),
+                            predicate, from_fields=Hotel.from_fields)
+
+    @staticmethod
+    @timed('find_hotel')
+    def find_hotel(filename, hotel_id):
+        """
+        Busca el hotel por su ID, deteniéndose en la primera coincidencia.
+
+        Args:
+            filename (str): Ruta del archivo.
+            hotel_id (str): ID buscado.
+
+        Returns:
+            Hotel: Objeto Hotel, o None si no existe.
+        """
+        return next(iter_records(filename, Hotel.from_line,
+                                 attrgetter('hotel_id'), record_id=hotel_id,
+                                 from_fields=Hotel.from_fields),
+                    None)
+
     @staticmethod
-    def load_hotels(filename):
+    def find_by_location(filename, location):
+        """
+        Busca los hoteles de una ubicación con el índice secundario.
+
+        Args:
+            filename (str): Ruta del archivo.
+            location (str): Ubicación buscada.
+
+        Returns:
+            list: Lista de objetos Hotel.
+        """
+        index = secondary_index(Hotel.table(filename), 'location')
+        return index.lookup(location)
+
+    @staticmethod
+    @timed('load_hotels')
+    def load_hotels(filename, workers=None):
         """
         Carga la lista de hoteles desde un archivo de texto.
         El formato esperado es:
@@ -104,29 +225,17 @@ class Hotel:
 
         Args:
             filename (str): Ruta del archivo.
+            workers (int, optional): Procesos para cargar en paralelo un
+                archivo grande; las líneas inválidas quedan en
+                table(filename).load_report.
 
         Returns:
             list: Lista de objetos Hotel.
         """
-        hotels = []
-        if not os.path.exists(filename):
-            return hotels
-
-        with open(filename, 'r', encoding='utf-8') as file:
-            for line in file:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    hotel_id, name, location, rooms, rooms_avail = line.split('|')
-                    h = Hotel(hotel_id, name, location, rooms)
-                    h.rooms_available = int(rooms_avail)
-                    hotels.append(h)
-                except ValueError as err:
-                    print(f"[Error] Datos inválidos en línea: '{line}'. Error: {err}")
-        return hotels
+        return Hotel.table(filename, workers).snapshot()
 
     @staticmethod
+    @timed('save_hotels')
     def save_hotels(filename, hotels_list):
         """
         Guarda la lista de hoteles en un archivo de texto.
@@ -136,13 +245,13 @@ class Hotel:
             filename (str): Ruta del archivo.
             hotels_list (list): Lista de objetos Hotel.
         """
-        with open(filename, 'w', encoding='utf-8') as file:
-            for hotel in hotels_list:
-                line = f"{hotel.hotel_id}|{hotel.name}|{hotel.location}|"
-                line += f"{hotel.rooms}|{hotel.rooms_available}\n"
-                file.write(line)
+        table = Hotel.table(filename)
+        with Transaction(table):
+            table.replace(hotels_list)
+            table.flush()
 
     @staticmethod
+    @timed('create_hotel')
     def create_hotel(filename, hotel_obj):
         """
         Crea un hotel y lo agrega al archivo de hoteles.
@@ -154,17 +263,38 @@ class Hotel:
         Returns:
             bool: True si se guarda correctamente, False si ya existe un ID igual.
         """
-        hotels_list = Hotel.load_hotels(filename)
-        for h in hotels_list:
-            if h.hotel_id == hotel_obj.hotel_id:
-                print(f"[Error] Ya existe un Hotel con ID '{hotel_obj.hotel_id}'")
+        table = Hotel.table(filename)
+        with Transaction(table):
+            if not table.insert(hotel_obj):
+                print("[Error] Ya existe un Hotel con ID "
+                      f"'{hotel_obj.hotel_id}'")
                 return False
+        return True
 
-        hotels_list.append(hotel_obj)
-        Hotel.save_hotels(filename, hotels_list)
+    @staticmethod
+    @timed('update_hotel')
+    def update_hotel(filename, hotel_obj):
+        """
+        Guarda los cambios de un hotel existente (por ejemplo, después
+        de modify_info) y actualiza los índices.
+
+        Args:
+            filename (str): Ruta del archivo.
+            hotel_obj (Hotel): Objeto Hotel con los datos nuevos.
+
+        Returns:
+            bool: True si se guardó, False si no se encontró el ID.
+        """
+        table = Hotel.table(filename)
+        with Transaction(table):
+            if not table.update(hotel_obj):
+                print("[Aviso] No se encontró el Hotel con ID "
+                      f"'{hotel_obj.hotel_id}'.")
+                return False
         return True
 
     @staticmethod
+    @timed('delete_hotel')
     def delete_hotel(filename, hotel_id):
         """
         Elimina un hotel del archivo por su ID.
@@ -176,11 +306,58 @@ class Hotel:
         Returns:
             bool: True si se eliminó, False si no se encontró.
         """
-        hotels_list = Hotel.load_hotels(filename)
-        new_list = [h for h in hotels_list if h.hotel_id != hotel_id]
-        if len(new_list) == len(hotels_list):
-            print(f"[Aviso] No se encontró el Hotel con ID '{hotel_id}'.")
-            return False
-
-        Hotel.save_hotels(filename, new_list)
+        table = Hotel.table(filename)
+        with Transaction(table):
+            if table.delete(hotel_id) is None:
+                print(f"[Aviso] No se encontró el Hotel con ID '{hotel_id}'.")
+                return False
         return True
+
+    @staticmethod
+    @timed('bulk_create_hotels')
+    def bulk_create_hotels(filename, hotels):
+        """
+        Agrega muchos hoteles con una sola escritura del archivo.
+
+        Args:
+            filename (str): Ruta del archivo.
+            hotels (iterable): Objetos Hotel a agregar.
+
+        Returns:
+            BulkResult: Hoteles agregados, IDs duplicados y registros/segundo.
+        """
+        table = Hotel.table(filename)
+        with Transaction(table):
+            return bulk_insert(table, hotels)
+
+    @staticmethod
+    @timed('bulk_delete_hotels')
+    def bulk_delete_hotels(filename, hotel_ids):
+        """
+        Elimina muchos hoteles con una sola escritura del archivo.
+
+        Args:
+            filename (str): Ruta del archivo.
+            hotel_ids (iterable): IDs de los hoteles a eliminar.
+
+        Returns:
+            BulkResult: Hoteles eliminados, IDs no encontrados y
+                registros/segundo.
+        """
+        table = Hotel.table(filename)
+        with Transaction(table):
+            return bulk_delete(table, hotel_ids)
+
+    @staticmethod
+    def export_hotels(filename, out):
+        """
+        Exporta los hoteles a un flujo de texto en el formato del archivo.
+
+        Args:
+            filename (str): Ruta del archivo.
+            out (io.TextIOBase): Flujo de salida.
+
+        Returns:
+            BulkResult: Hoteles exportados y registros/segundo.
+        """
+        return export_table(Hotel.table(filename), out)
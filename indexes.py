@@ -0,0 +1,121 @@
+"""
+Módulo que define los índices secundarios sobre las tablas en memoria.
+
+Un índice secundario agrupa los registros por el valor de un campo
+(por ejemplo, las reservaciones por hotel_id) y se mantiene al día con
+los cambios de la tabla, por lo que las consultas cuestan O(coincidencias).
+"""
+
+import copy
+from bisect import bisect_left, bisect_right, insort
+from operator import attrgetter
+
+
+class SecondaryIndex:
+    """
+    Índice de una tabla por el valor de un campo.
+
+    Atributos:
+        field (str): Nombre del campo indexado.
+        ordered (bool): Si es True se mantienen los valores ordenados
+            para consultas por rango.
+        buckets (dict): Registros por valor, cada uno un dict por ID.
+    """
+
+    def __init__(self, table, field, ordered=False):
+        """
+        Inicializa el índice (aún sin suscribirlo a la tabla).
+
+        Args:
+            table (RecordTable): Tabla indexada.
+            field (str): Nombre del campo indexado.
+            ordered (bool, optional): Mantener los valores ordenados.
+        """
+        self.field = field
+        self.ordered = ordered
+        self.buckets = {}
+        self._value = attrgetter(field)
+        self._key = table.key
+        self._sorted_values = []
+
+    def on_insert(self, record):
+        """Agrega un registro a su grupo."""
+        value = self._value(record)
+        bucket = self.buckets.get(value)
+        if bucket is None:
+            bucket = self.buckets[value] = {}
+            if self.ordered:
+                insort(self._sorted_values, value)
+        bucket[self._key(record)] = record
+
+    def on_delete(self, record):
+        """Quita un registro de su grupo."""
+        value = self._value(record)
+        bucket = self.buckets.get(value)
+        if bucket is None:
+            return
+        bucket.pop(self._key(record), None)
+        if not bucket:
+            del self.buckets[value]
+            if self.ordered:
+                position = bisect_left(self._sorted_values, value)
+                del self._sorted_values[position]
+
+    def on_reset(self, records):
+        """Reconstruye el índice con todos los registros."""
+        self.buckets = {}
+        self._sorted_values = []
+        for record in records:
+            self.on_insert(record)
+
+    def lookup(self, value):
+        """
+        Busca los registros con un valor exacto.
+
+        Args:
+            value (object): Valor buscado.
+
+        Returns:
+            list: Copias de los registros encontrados.
+        """
+        return [copy.copy(r) for r in self.buckets.get(value, {}).values()]
+
+    def lookup_range(self, low, high):
+        """
+        Busca los registros con valor en el rango [low, high]. Requiere
+        un índice ordenado.
+
+        Args:
+            low (object): Valor mínimo.
+            high (object): Valor máximo.
+
+        Returns:
+            list: Copias de los registros, ordenadas por valor.
+        """
+        start = bisect_left(self._sorted_values, low)
+        end = bisect_right(self._sorted_values, high)
+        return [copy.copy(r)
+                for value in self._sorted_values[start:end]
+                for r in self.buckets[value].values()]
+
+
+def secondary_index(table, field, ordered=False):
+    """
+    Obtiene el índice de una tabla por un campo, creándolo y
+    suscribiéndolo a sus cambios la primera vez.
+
+    Args:
+        table (RecordTable): Tabla indexada.
+        field (str): Nombre del campo indexado.
+        ordered (bool, optional): Mantener los valores ordenados.
+
+    Returns:
+        SecondaryIndex: Índice mantenido al día.
+    """
+    for listener in table.listeners:
+        if isinstance(listener, SecondaryIndex) and listener.field == field \
+                and listener.ordered >= ordered:
+            return listener
+    index = SecondaryIndex(table, field, ordered)
+    table.add_listener(index)
+    return index
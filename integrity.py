@@ -0,0 +1,161 @@
+"""
+Módulo de verificación de integridad referencial entre los archivos.
+
+Revisa los tres archivos en una sola pasada con uniones por hash (los
+índices por ID de cada tabla): reservaciones cuyo hotel o cliente ya no
+existe y hoteles cuyo contador rooms_available no coincide con sus
+reservaciones (las habitaciones libres en la noche más ocupada, la misma
+regla con la que se actualiza al reservar y cancelar). Opcionalmente
+reconstruye los contadores.
+
+Uso:
+    python integrity.py
+    python integrity.py --repair
+"""
+
+import argparse
+import copy
+import sys
+
+from availability import AvailabilityIndex
+from hotel import Hotel
+from customer import Customer
+from reservation import Reservation
+from shards import shard_files
+from transaction import Transaction
+
+
+class IntegrityReport:
+    """
+    Resultado de una verificación de integridad.
+
+    Atributos:
+        missing_hotel (list): IDs de reservaciones cuyo hotel no existe.
+        missing_customer (list): IDs de reservaciones cuyo cliente no existe.
+        counter_mismatches (list): Tuplas (hotel_id, guardado, esperado)
+            de rooms_available.
+        repaired (int): Contadores reconstruidos.
+        checked (int): Registros revisados en los tres archivos.
+    """
+
+    def __init__(self):
+        """Inicializa un reporte vacío."""
+        self.missing_hotel = []
+        self.missing_customer = []
+        self.counter_mismatches = []
+        self.repaired = 0
+        self.checked = 0
+
+    @property
+    def ok(self):
+        """bool: True si no se encontró ningún problema."""
+        return not (self.missing_hotel or self.missing_customer
+                    or self.counter_mismatches)
+
+    def __repr__(self):
+        return (f"IntegrityReport(missing_hotel={len(self.missing_hotel)}, "
+                f"missing_customer={len(self.missing_customer)}, "
+                f"counter_mismatches={len(self.counter_mismatches)}, "
+                f"repaired={self.repaired})")
+
+
+def expected_available(occupancy, hotel):
+    """
+    Calcula el contador rooms_available que corresponde a un hotel.
+
+    Args:
+        occupancy (AvailabilityIndex): Ocupación por noche de todas las
+            reservaciones.
+        hotel (Hotel): Hotel revisado.
+
+    Returns:
+        int: Habitaciones libres en la noche más ocupada del hotel (ver
+            AvailabilityIndex.rooms_available).
+    """
+    return occupancy.rooms_available(hotel.hotel_id)
+
+
+def check_integrity(hotel_file, cust_file, res_file, repair=False):
+    """
+    Verifica la integridad referencial de los tres archivos en O(N).
+
+    Args:
+        hotel_file (str): Archivo de hoteles.
+        cust_file (str): Archivo de clientes.
+        res_file (str): Archivo (o manifiesto de particiones) de reservaciones.
+        repair (bool, optional): Reconstruir rooms_available a partir
+            de las reservaciones.
+
+    Returns:
+        IntegrityReport: Problemas encontrados y contadores reparados.
+    """
+    hotels = Hotel.table(hotel_file)
+    customers = Customer.table(cust_file)
+    reservations = [Reservation.table(shard)
+                    for shard in shard_files(res_file)]
+    report = IntegrityReport()
+
+    with Transaction(hotels, customers, *reservations):
+        occupancy = AvailabilityIndex()
+        occupancy.capacity = {h.hotel_id: h.rooms for h in hotels.values()}
+        for table in reservations:
+            for res in table.values():
+                if res.hotel_id not in hotels:
+                    report.missing_hotel.append(res.reservation_id)
+                else:
+                    try:
+                        occupancy.add_nights(res.hotel_id, *res.nights())
+                    except ValueError:
+                        pass
+                if res.customer_id not in customers:
+                    report.missing_customer.append(res.reservation_id)
+            report.checked += len(table)
+
+        for hotel in hotels.values():
+            expected = expected_available(occupancy, hotel)
+            if hotel.rooms_available != expected:
+                report.counter_mismatches.append(
+                    (hotel.hotel_id, hotel.rooms_available, expected))
+        report.checked += len(hotels) + len(customers)
+
+        if repair:
+            for hotel_id, _, expected in report.counter_mismatches:
+                fixed = copy.copy(hotels.get(hotel_id))
+                fixed.rooms_available = expected
+                hotels.update(fixed)
+            report.repaired = len(report.counter_mismatches)
+    return report
+
+
+def main():
+    """Punto de entrada del verificador."""
+    parser = argparse.ArgumentParser(
+        description="Verifica la integridad de los datos")
+    parser.add_argument("--hotels", default="data/hotels_data.txt")
+    parser.add_argument("--customers", default="data/customers_data.txt")
+    parser.add_argument("--reservations", default="data/reservations_data.txt")
+    parser.add_argument("--repair", action="store_true",
+                        help="reconstruir rooms_available a partir de las "
+                             "reservaciones")
+    args = parser.parse_args()
+
+    report = check_integrity(args.hotels, args.customers, args.reservations,
+                             args.repair)
+    for reservation_id in report.missing_hotel:
+        print(f"[Error] La reservación {reservation_id} apunta a un hotel "
+              "inexistente.")
+    for reservation_id in report.missing_customer:
+        print(f"[Error] La reservación {reservation_id} apunta a un cliente "
+              "inexistente.")
+    for hotel_id, stored, expected in report.counter_mismatches:
+        print(f"[Aviso] Hotel {hotel_id}: rooms_available={stored}, "
+              f"esperado {expected}.")
+    print(f"{report.checked} registros revisados, {report.repaired} "
+          "contadores reparados.")
+    if report.missing_hotel or report.missing_customer or \
+            (report.counter_mismatches and not report.repaired):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Módulo que define la clase Journal, un registro de solo anexado
+(write-ahead log) para los archivos de datos delimitados por '|'.
+
+Cada línea del registro tiene el formato operacion|contenido, donde la
+operación es I (alta), U (modificación) o D (baja). Para I y U el
+contenido es la línea completa del registro; para D es solo su ID.
+"""
+
+import os
+
+import metrics
+
+INSERT = 'I'
+UPDATE = 'U'
+DELETE = 'D'
+
+
+def operation_line(operation, payload):
+    """
+    Da formato a una operación del registro.
+
+    Args:
+        operation (str): INSERT, UPDATE o DELETE.
+        payload (str): Línea del registro o ID a eliminar.
+
+    Returns:
+        str: Línea operacion|contenido, sin salto de línea.
+    """
+    return f"{operation}|{payload}"
+
+
+def journal_path(filename):
+    """
+    Obtiene la ruta del registro asociado a un archivo de datos.
+
+    Args:
+        filename (str): Ruta del archivo de datos.
+
+    Returns:
+        str: Ruta del registro (mismo nombre con sufijo .log).
+    """
+    return f"{filename}.log"
+
+
+class Journal:
+    """
+    Registro de solo anexado junto a un archivo de datos.
+
+    Atributos:
+        path (str): Ruta del archivo de registro.
+        durable (bool): Si es True, cada anexado se sincroniza con os.fsync.
+        entries (int): Número de operaciones en el registro.
+    """
+
+    def __init__(self, path, durable=True):
+        """
+        Inicializa el registro, creando el archivo si no existe.
+
+        Args:
+            path (str): Ruta del archivo de registro.
+            durable (bool, optional): Sincronizar cada escritura al disco.
+        """
+        self.path = path
+        self.durable = durable
+        self.entries = 0
+        if not os.path.exists(path):
+            with open(path, 'w', encoding='utf-8'):
+                pass
+
+    def append(self, operation, payload):
+        """
+        Anexa una operación al final del registro en O(1).
+
+        Args:
+            operation (str): INSERT, UPDATE o DELETE.
+            payload (str): Línea del registro o ID a eliminar.
+        """
+        self.append_many([(operation, payload)])
+
+    def append_many(self, operations):
+        """
+        Anexa varias operaciones con una sola escritura. Si el registro
+        termina en una línea incompleta (escritura interrumpida), se
+        recorta antes de anexar para no unirla a la primera operación.
+
+        Args:
+            operations (list): Lista de tuplas (operacion, contenido).
+        """
+        if not operations:
+            return
+        data = ''.join(f"{operation_line(op, payload)}\n"
+                       for op, payload in operations)
+        data = data.encode('utf-8')
+        with open(self.path, 'ab+') as file:
+            self._trim_torn_tail(file)
+            file.write(data)
+            if self.durable:
+                file.flush()
+                os.fsync(file.fileno())
+        if metrics.ENABLED:
+            metrics.increment('bytes_written_total', len(data),
+                              file=os.path.basename(self.path))
+        self.entries += len(operations)
+
+    def _trim_torn_tail(self, file):
+        """
+        Recorta una última línea sin salto de línea.
+
+        Args:
+            file (io.BufferedRandom): Registro abierto en modo binario.
+
+        Returns:
+            int: Tamaño del registro después de recortarlo.
+        """
+        end = file.seek(0, os.SEEK_END)
+        if end == 0:
+            return end
+        file.seek(end - 1)
+        if file.read(1) == b'\n':
+            return end
+        position = end
+        while position > 0:
+            size = min(4096, position)
+            position -= size
+            file.seek(position)
+            last = file.read(size).rfind(b'\n')
+            if last >= 0:
+                position += last + 1
+                break
+        file.truncate(position)
+        print(f"[Aviso] Se descartó una escritura incompleta al final de "
+              f"'{self.path}'.")
+        return position
+
+    def read(self):
+        """
+        Lee las operaciones completas del registro. Una última línea sin
+        salto de línea (escritura interrumpida) se ignora y se recorta.
+
+        Returns:
+            list: Lista de tuplas (operacion, contenido).
+        """
+        operations = []
+        torn = False
+        with open(self.path, 'r', encoding='utf-8') as file:
+            for line in file:
+                if not line.endswith('\n'):
+                    torn = True
+                    break
+                operation, sep, payload = line.rstrip('\n').partition('|')
+                if sep and operation in (INSERT, UPDATE, DELETE):
+                    operations.append((operation, payload))
+                else:
+                    print("[Error] Operación inválida en el registro: "
+                          f"'{line.strip()}'")
+        if torn:
+            with open(self.path, 'rb+') as file:
+                self._trim_torn_tail(file)
+        self.entries = len(operations)
+        return operations
+
+    def truncate(self):
+        """Vacía el registro después de una compactación."""
+        with open(self.path, 'w', encoding='utf-8'):
+            pass
+        self.entries = 0
+
+    def remove(self):
+        """Elimina el archivo de registro."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self.entries = 0
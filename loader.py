@@ -0,0 +1,289 @@
+"""
+Módulo de carga en paralelo de los archivos de datos.
+
+El archivo se divide en rangos de bytes alineados a saltos de línea, cada
+rango se analiza en un proceso de un ProcessPoolExecutor y los resultados
+se unen en el orden del archivo. Las líneas inválidas no se imprimen una
+por una: se reúnen en un reporte (LoadReport) con su número de línea,
+desplazamiento en bytes y error.
+
+Uso:
+    python loader.py hotel data/hotels_data.txt --workers 4
+        --report reporte.json
+"""
+
+import argparse
+import importlib
+import json
+import os
+import time
+from collections import namedtuple
+from itertools import accumulate
+
+PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+BLOCK_BYTES = 1024 * 1024
+
+# Clase de cada tipo de registro para la línea de comandos. Se importa por
+# nombre al usarla, porque los modelos cargan sus archivos con este módulo.
+MODELS = {
+    'hotel': 'hotel.Hotel',
+    'customer': 'customer.Customer',
+    'reservation': 'reservation.Reservation',
+}
+
+Diagnostic = namedtuple('Diagnostic',
+                        ['line_number', 'offset', 'line', 'error'])
+
+
+class LoadReport:
+    """
+    Reporte de la carga de un archivo.
+
+    Atributos:
+        filename (str): Archivo cargado.
+        records (int): Registros válidos.
+        lines (int): Líneas leídas (incluidas las vacías).
+        diagnostics (list): Diagnostic de cada línea inválida.
+        chunks (int): Rangos analizados.
+        seconds (float): Duración de la carga.
+    """
+
+    def __init__(self, filename, records=0, lines=0, diagnostics=None,
+                 chunks=1, seconds=0.0):
+        """
+        Inicializa el reporte.
+
+        Args:
+            filename (str): Archivo cargado.
+            records (int, optional): Registros válidos.
+            lines (int, optional): Líneas leídas.
+            diagnostics (list, optional): Líneas inválidas.
+            chunks (int, optional): Rangos analizados.
+            seconds (float, optional): Duración en segundos.
+        """
+        self.filename = filename
+        self.records = records
+        self.lines = lines
+        self.diagnostics = diagnostics if diagnostics is not None else []
+        self.chunks = chunks
+        self.seconds = seconds
+
+    @property
+    def ok(self):
+        """bool: True si no hubo líneas inválidas."""
+        return not self.diagnostics
+
+    def summary(self):
+        """
+        Resume el reporte en una línea.
+
+        Returns:
+            str: Mensaje con el número de líneas inválidas y la primera de
+                ellas.
+        """
+        if self.ok:
+            return f"{self.records} registros cargados de '{self.filename}'."
+        first = self.diagnostics[0]
+        return (f"[Error] {len(self.diagnostics)} línea(s) inválida(s) en "
+                f"'{self.filename}'; primera en la línea {first.line_number}: "
+                f"'{first.line}'. Error: {first.error}")
+
+    def to_dict(self):
+        """
+        Convierte el reporte a tipos serializables en JSON.
+
+        Returns:
+            dict: Contenido del reporte.
+        """
+        return {
+            "filename": self.filename,
+            "records": self.records,
+            "lines": self.lines,
+            "chunks": self.chunks,
+            "seconds": self.seconds,
+            "diagnostics": [d._asdict() for d in self.diagnostics],
+        }
+
+    def __repr__(self):
+        return (f"LoadReport(records={self.records}, "
+                f"invalid={len(self.diagnostics)}, chunks={self.chunks})")
+
+
+def line_ranges(filename, chunks):
+    """
+    Divide un archivo en rangos de bytes que empiezan y terminan en un
+    límite de línea.
+
+    Args:
+        filename (str): Ruta del archivo.
+        chunks (int): Número de rangos deseado.
+
+    Returns:
+        list: Tuplas (inicio, fin) contiguas que cubren el archivo.
+    """
+    size = os.path.getsize(filename)
+    bounds = [0]
+    with open(filename, 'rb') as file:
+        for i in range(1, chunks):
+            position = size * i // chunks
+            if position <= bounds[-1]:
+                continue
+            file.seek(position - 1)
+            file.readline()
+            position = file.tell()
+            if bounds[-1] < position < size:
+                bounds.append(position)
+    bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
+def _parse_block(data, parse, records):
+    """
+    Analiza un bloque de líneas completas decodificándolo de una vez.
+
+    Args:
+        data (bytes): Bloque que termina en un límite de línea.
+        parse (callable): Convierte una línea en un registro.
+        records (list): Lista a la que se agregan los registros válidos.
+
+    Returns:
+        tuple: (líneas del bloque, lista de (índice, línea, error)).
+    """
+    try:
+        lines = data.decode('utf-8').split('\n')
+        invalid = ()
+    except UnicodeDecodeError:
+        lines = []
+        invalid = {}
+        for index, raw in enumerate(data.split(b'\n')):
+            try:
+                lines.append(raw.decode('utf-8'))
+            except UnicodeDecodeError as err:
+                lines.append(raw.decode('utf-8', 'replace'))
+                invalid[index] = str(err)
+    if data.endswith(b'\n'):
+        lines.pop()
+
+    failures = []
+    append = records.append
+    for index, line in enumerate(lines):
+        line = line.strip()
+        if not line:
+            continue
+        if index in invalid:
+            failures.append((index, line, invalid[index]))
+            continue
+        try:
+            append(parse(line))
+        except ValueError as err:
+            failures.append((index, line, str(err)))
+    return len(lines), failures
+
+
+def parse_range(filename, start, end, parse):
+    """
+    Analiza las líneas de un rango de bytes. El rango se lee por bloques
+    de BLOCK_BYTES que se decodifican de una sola vez.
+
+    Args:
+        filename (str): Ruta del archivo.
+        start (int): Primer byte (inicio de una línea).
+        end (int): Byte siguiente al último del rango.
+        parse (callable): Convierte una línea en un registro; lanza
+            ValueError si la línea es inválida.
+
+    Returns:
+        tuple: (registros, diagnósticos con número de línea relativo al
+            rango, líneas leídas).
+    """
+    records = []
+    diagnostics = []
+    lines = 0
+    position = start
+    with open(filename, 'rb') as file:
+        file.seek(start)
+        while position < end:
+            data = file.read(min(BLOCK_BYTES, end - position))
+            if not data:
+                break
+            if not data.endswith(b'\n') and position + len(data) < end:
+                data += file.readline()
+            count, failures = _parse_block(data, parse, records)
+            if failures:
+                sizes = (len(raw) + 1 for raw in data.split(b'\n'))
+                offsets = list(accumulate(sizes, initial=position))
+                diagnostics.extend(
+                    Diagnostic(lines + index + 1, offsets[index], line, error)
+                    for index, line, error in failures)
+            lines += count
+            position += len(data)
+    return records, diagnostics, lines
+
+
+def load_file(filename, parse, workers=None):
+    """
+    Carga y valida un archivo de datos. Con workers y un archivo de al
+    menos PARALLEL_MIN_BYTES, los rangos se analizan en paralelo.
+
+    Args:
+        filename (str): Ruta del archivo.
+        parse (callable): Función de nivel de módulo (o método estático)
+            que convierte una línea en un registro.
+        workers (int, optional): Procesos; None o 1 carga en este proceso.
+
+    Returns:
+        tuple: (lista de registros en el orden del archivo, LoadReport).
+    """
+    start = time.perf_counter()
+    size = os.path.getsize(filename)
+    if not workers or workers < 2 or size < PARALLEL_MIN_BYTES:
+        ranges = [(0, size)]
+        results = [parse_range(filename, 0, size, parse)]
+    else:
+        ranges = line_ranges(filename, workers * 4)
+        # Importado aquí: concurrent.futures.process arrastra multiprocessing
+        # y encarece el arranque de quien sólo carga archivos pequeños.
+        # pylint: disable-next=import-outside-toplevel
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(parse_range, [filename] * len(ranges),
+                                    [s for s, _ in ranges],
+                                    [e for _, e in ranges],
+                                    [parse] * len(ranges)))
+
+    records = []
+    report = LoadReport(filename, chunks=len(ranges))
+    for chunk_records, diagnostics, lines in results:
+        records.extend(chunk_records)
+        report.diagnostics.extend(
+            d._replace(line_number=d.line_number + report.lines)
+            for d in diagnostics)
+        report.lines += lines
+    report.records = len(records)
+    report.seconds = time.perf_counter() - start
+    return records, report
+
+
+def main():
+    """Punto de entrada del validador."""
+    parser = argparse.ArgumentParser(
+        description="Carga y valida un archivo de datos")
+    parser.add_argument("kind", choices=sorted(MODELS))
+    parser.add_argument("filename")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--report", help="guardar el reporte en JSON")
+    args = parser.parse_args()
+
+    module, _, name = MODELS[args.kind].rpartition('.')
+    model = getattr(importlib.import_module(module), name)
+    _, report = load_file(args.filename, model.from_line, args.workers)
+    print(report.summary())
+    print(f"{report.lines} líneas en {report.chunks} rangos, "
+          f"{report.seconds:.2f} s")
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as file:
+            json.dump(report.to_dict(), file, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,42 @@
 # main.py
 """
-Módulo principal para ejecutar el sistema de reservaciones.
+Módulo principal: línea de comandos del sistema de reservaciones.
+
+Cada subcomando importa sólo los módulos que necesita y abre sólo los
+archivos de datos que usa (show busca sin cargar el archivo completo).
+El modo batch lee un comando por línea de la entrada estándar y los
+ejecuta en el mismo proceso, con las tablas cargadas una sola vez.
+
+Uso:
+    python main.py
+    python main.py hotel create H1 "Hotel Central" Ciudad 5
+    python main.py hotel modify H1 --rooms 8
+    python main.py customer show C1
+    python main.py reservation book R1 H1 C1 2025-03-10 2025-03-12 --waitlist
+    python main.py reservation cancel R1
+    python main.py search "Ciudad X" 2025-03-10 2025-03-12 --rooms 2 --page 1
+    python main.py batch --commit-every 100 < comandos.txt
 """
+# pylint: disable=import-outside-toplevel
 
-from hotel import Hotel
-from customer import Customer
-from reservation import Reservation
+import argparse
+import shlex
+import sys
+import time
 
 
-def main():
+def demo(hotel_file, cust_file, res_file):
     """
     Ejecuta una demostración de las operaciones principales del sistema de reservaciones.
+
+    Args:
+        hotel_file (str): Archivo de hoteles.
+        cust_file (str): Archivo de clientes.
+        res_file (str): Archivo de reservaciones.
     """
-    hotel_file = "data/hotels_data.txt"
-    cust_file = "data/customers_data.txt"
-    res_file = "data/reservations_data.txt"
+    from hotel import Hotel
+    from customer import Customer
+    from reservation import Reservation
 
     print("=== DEMO: Creación de Hotel ===")
     h1 = Hotel("H100", "Hotel Central", "Ciudad", 5)
@@ -36,10 +58,9 @@ def main():
         print("Reservación creada con éxito.\n")
 
     print("=== Mostrar información Hotel (H100) ===")
-    hoteles = Hotel.load_hotels(hotel_file)
-    for h in hoteles:
-        if h.hotel_id == "H100":
-            h.display_info()
+    hotel = Hotel.find_hotel(hotel_file, "H100")
+    if hotel:
+        hotel.display_info()
 
     print("=== Cancelar la reservación 'R300' ===")
     cancelado = Reservation.cancel_reservation(res_file, hotel_file, "R300")
@@ -49,5 +70,280 @@ def main():
     print("=== FIN DEMO ===")
 
 
+def _show(record, missing):
+    """Imprime un registro con el formato del archivo, o avisa si no existe."""
+    if record is None:
+        print(f"[Aviso] No se encontró {missing}.")
+        return False
+    print(record.to_line())
+    return True
+
+
+def hotel_create(args):
+    """Crea un hotel."""
+    from hotel import Hotel
+    return Hotel.create_hotel(args.hotels, Hotel(args.id, args.name,
+                                                 args.location, args.rooms))
+
+
+def hotel_show(args):
+    """Muestra un hotel."""
+    from hotel import Hotel
+    return _show(Hotel.find_hotel(args.hotels, args.id),
+                 f"el Hotel con ID '{args.id}'")
+
+
+def hotel_modify(args):
+    """Modifica el nombre, la ubicación o las habitaciones de un hotel."""
+    from hotel import Hotel
+    hotel = Hotel.find_hotel(args.hotels, args.id)
+    if hotel is None:
+        return _show(None, f"el Hotel con ID '{args.id}'")
+    hotel.modify_info(args.name, args.location, args.rooms)
+    return Hotel.update_hotel(args.hotels, hotel)
+
+
+def hotel_delete(args):
+    """Elimina un hotel."""
+    from hotel import Hotel
+    return Hotel.delete_hotel(args.hotels, args.id)
+
+
+def customer_create(args):
+    """Crea un cliente."""
+    from customer import Customer
+    return Customer.create_customer(
+        args.customers, Customer(args.id, args.name, args.phone, args.email))
+
+
+def customer_show(args):
+    """Muestra un cliente."""
+    from customer import Customer
+    return _show(Customer.find_customer(args.customers, args.id),
+                 f"el Cliente con ID '{args.id}'")
+
+
+def customer_modify(args):
+    """Modifica el nombre, el teléfono o el email de un cliente."""
+    from customer import Customer
+    customer = Customer.find_customer(args.customers, args.id)
+    if customer is None:
+        return _show(None, f"el Cliente con ID '{args.id}'")
+    customer.modify_customer_info(args.name, args.phone, args.email)
+    return Customer.update_customer(args.customers, customer)
+
+
+def customer_delete(args):
+    """Elimina un cliente."""
+    from customer import Customer
+    return Customer.delete_customer(args.customers, args.id)
+
+
+def reservation_book(args):
+    """Crea una reservación."""
+    from reservation import Reservation
+    reservation = Reservation(args.id, args.hotel_id, args.customer_id,
+                              (args.check_in, args.check_out))
+    return Reservation.create_reservation(args.reservations, args.hotels,
+                                          args.customers, reservation,
+                                          args.waitlist, args.priority)
+
+
+def reservation_show(args):
+    """Muestra una reservación."""
+    from reservation import Reservation
+    return _show(Reservation.find_reservation(args.reservations, args.id),
+                 f"la reservación '{args.id}'")
+
+
+def reservation_cancel(args):
+    """Cancela una reservación."""
+    from reservation import Reservation
+    return Reservation.cancel_reservation(args.reservations, args.hotels,
+                                          args.id)
+
+
+def search(args):
+    """Muestra una página de hoteles con habitaciones libres."""
+    from search import search_hotels
+    try:
+        page = search_hotels(args.hotels, args.reservations, args.location,
+                             args.check_in, args.check_out, args.rooms,
+                             args.page, args.page_size)
+    except ValueError as err:
+        print(f"[Error] Búsqueda inválida: {err}")
+        return False
+    for match in page.results:
+        print(f"{match.hotel_id}|{match.name}|{match.location}|"
+              f"{match.free_rooms} de {match.rooms} libres")
+    pages = max((page.total + page.page_size - 1) // page.page_size, 1)
+    print(f"Página {page.page} de {pages} ({page.total} hoteles).")
+    return True
+
+
+def run_demo(args):
+    """Ejecuta la demostración."""
+    demo(args.hotels, args.customers, args.reservations)
+    return True
+
+
+def run_batch(args):
+    """
+    Ejecuta los comandos de la entrada estándar, uno por línea (sin
+    'python main.py'). Las líneas vacías y las que empiezan con # se
+    ignoran. Cada bloque de commit_every comandos se ejecuta dentro de
+    una transacción (con el candado del directorio tomado) y se escribe
+    con una sola confirmación.
+    """
+    from repository import Repository
+    from transaction import Transaction
+    parser = build_parser()
+    start = time.perf_counter()
+    total = failed = 0
+    lines = (line for line in sys.stdin
+             if line.strip() and not line.lstrip().startswith('#'))
+    done = False
+    while not done:
+        done = True
+        with Repository(args.hotels, args.customers, args.reservations,
+                        flush_every=None) as repo, Transaction(*repo.tables()):
+            for line in lines:
+                total += 1
+                try:
+                    command = parser.parse_args(
+                        ['--hotels', args.hotels,
+                         '--customers', args.customers,
+                         '--reservations', args.reservations,
+                         *shlex.split(line)])
+                    ok = (command.handler not in (run_batch, run_demo)
+                          and command.handler(command))
+                except (SystemExit, ValueError):
+                    # argparse ya explicó el error en stderr; shlex lanza
+                    # ValueError si las comillas no cierran.
+                    print(f"[Error] Comando inválido: '{line.strip()}'.")
+                    ok = False
+                failed += not ok
+                if total % args.commit_every == 0:
+                    done = False
+                    break
+            repo.flush()
+    seconds = time.perf_counter() - start
+    print(f"{total} comandos, {failed} con error, {seconds:.2f} s",
+          file=sys.stderr)
+    return failed == 0
+
+
+# Campos de cada entidad (nombre, tipo) y manejadores de create, show,
+# modify y delete; los subcomandos de hotel y customer se construyen de aquí.
+ENTITIES = {
+    "hotel": ("hoteles",
+              (("name", str), ("location", str), ("rooms", int)),
+              (hotel_create, hotel_show, hotel_modify, hotel_delete)),
+    "customer": ("clientes",
+                 (("name", str), ("phone", str), ("email", str)),
+                 (customer_create, customer_show, customer_modify,
+                  customer_delete)),
+}
+
+
+def _add_entity(entities, name, help_text, fields, handlers):
+    """
+    Agrega los subcomandos create, show, modify y delete de una entidad.
+
+    Args:
+        entities: Subanalizadores de entidades del analizador principal.
+        name (str): Nombre de la entidad en la línea de comandos.
+        help_text (str): Ayuda de la entidad.
+        fields (tuple): Pares (campo, tipo) en el orden de create.
+        handlers (tuple): Manejadores de create, show, modify y delete.
+    """
+    actions = entities.add_parser(name, help=help_text).add_subparsers(
+        dest="action", required=True)
+    prefixes = (("create", ""), ("show", None), ("modify", "--"),
+                ("delete", None))
+    for (action, prefix), handler in zip(prefixes, handlers):
+        command = actions.add_parser(action)
+        command.add_argument("id")
+        for field, kind in fields if prefix is not None else ():
+            command.add_argument(prefix + field, type=kind)
+        command.set_defaults(handler=handler)
+
+
+def build_parser():
+    """
+    Construye el analizador de la línea de comandos.
+
+    Returns:
+        argparse.ArgumentParser: Analizador con todos los subcomandos.
+    """
+    parser = argparse.ArgumentParser(description="Sistema de reservaciones")
+    parser.add_argument("--hotels", default="data/hotels_data.txt")
+    parser.add_argument("--customers", default="data/customers_data.txt")
+    parser.add_argument("--reservations", default="data/reservations_data.txt")
+    parser.set_defaults(handler=run_demo)
+    entities = parser.add_subparsers(dest="entity")
+
+    for name, (help_text, fields, handlers) in ENTITIES.items():
+        _add_entity(entities, name, help_text, fields, handlers)
+
+    parent = entities.add_parser("reservation", help="reservaciones")
+    reservation = parent.add_subparsers(dest="action", required=True)
+    command = reservation.add_parser("book")
+    command.add_argument("id")
+    command.add_argument("hotel_id")
+    command.add_argument("customer_id")
+    command.add_argument("check_in")
+    command.add_argument("check_out")
+    command.add_argument("--waitlist", action="store_true",
+                         help="si no hay habitaciones, quedar en la lista "
+                              "de espera")
+    command.add_argument("--priority", type=int, default=0,
+                         help="prioridad en la lista de espera (mayor "
+                              "primero)")
+    command.set_defaults(handler=reservation_book)
+    command = reservation.add_parser("show")
+    command.add_argument("id")
+    command.set_defaults(handler=reservation_show)
+    command = reservation.add_parser("cancel")
+    command.add_argument("id")
+    command.set_defaults(handler=reservation_cancel)
+
+    command = entities.add_parser("search",
+                                  help="hoteles con habitaciones libres")
+    command.add_argument("location")
+    command.add_argument("check_in")
+    command.add_argument("check_out")
+    command.add_argument("--rooms", type=int, default=1,
+                         help="habitaciones mínimas")
+    command.add_argument("--page", type=int, default=1)
+    command.add_argument("--page-size", type=int, default=20)
+    command.set_defaults(handler=search)
+
+    command = entities.add_parser(
+        "demo", help="demostración de las operaciones (por omisión)")
+    command.set_defaults(handler=run_demo)
+
+    command = entities.add_parser("batch",
+                                  help="comandos desde la entrada estándar")
+    command.add_argument("--commit-every", type=int, default=100,
+                         help="comandos entre escrituras a disco")
+    command.set_defaults(handler=run_batch)
+    return parser
+
+
+def main(argv=None):
+    """
+    Punto de entrada de la línea de comandos.
+
+    Args:
+        argv (list, optional): Argumentos; por omisión sys.argv[1:].
+
+    Returns:
+        int: Código de salida (0 si el comando tuvo éxito).
+    """
+    args = build_parser().parse_args(argv)
+    return 0 if args.handler(args) else 1
+
+
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,281 @@
+"""
+Módulo de instrumentación opcional de las operaciones.
+
+Registra contadores (bytes leídos y escritos, registros analizados) e
+histogramas de duración (operaciones CRUD, cargas, confirmaciones y
+espera del candado). Está desactivado por omisión: cada punto de medición
+sólo consulta ENABLED, por lo que el costo es despreciable. Se activa con
+enable() o con la variable de entorno RESERVATIONS_METRICS=1.
+
+Uso:
+    import metrics
+    metrics.enable()
+    ...
+    metrics.dump("metricas.json")
+    metrics.write_prometheus("metricas.prom")
+"""
+
+import json
+import os
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import wraps
+
+PREFIX = 'reservations_'
+
+BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+BUCKET_LABELS = [*map(str, BUCKETS), "+Inf"]
+
+ENABLED = os.environ.get('RESERVATIONS_METRICS', '') not in ('', '0')
+
+_COUNTERS = {}
+_HISTOGRAMS = {}
+
+
+class Histogram:
+    """
+    Histograma de duraciones con cubetas fijas (en segundos).
+
+    Atributos:
+        counts (list): Observaciones por cubeta; la última es +Inf.
+        total (float): Suma de las observaciones.
+        count (int): Número de observaciones.
+    """
+
+    def __init__(self):
+        """Inicializa un histograma vacío."""
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        """
+        Registra una observación.
+
+        Args:
+            value (float): Duración en segundos.
+        """
+        self.counts[bisect_left(BUCKETS, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def quantile(self, q):
+        """
+        Estima un cuantil con el límite superior de su cubeta.
+
+        Args:
+            q (float): Cuantil entre 0 y 1.
+
+        Returns:
+            float: Límite de la cubeta (inf si cae en la última).
+        """
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(BUCKETS + (float('inf'),), self.counts):
+            seen += count
+            if seen >= target and seen > 0:
+                return bound
+        return 0.0
+
+
+def enable():
+    """Activa la instrumentación."""
+    global ENABLED  # pylint: disable=global-statement
+    ENABLED = True
+
+
+def disable():
+    """Desactiva la instrumentación (los valores registrados se conservan)."""
+    global ENABLED  # pylint: disable=global-statement
+    ENABLED = False
+
+
+def reset():
+    """Olvida todos los contadores e histogramas."""
+    _COUNTERS.clear()
+    _HISTOGRAMS.clear()
+
+
+def _key(name, labels):
+    """Clave de una serie: nombre y etiquetas ordenadas."""
+    return (name, tuple(sorted(labels.items())))
+
+
+def increment(name, value=1, **labels):
+    """
+    Suma a un contador si la instrumentación está activa.
+
+    Args:
+        name (str): Nombre del contador.
+        value (int, optional): Cantidad a sumar.
+        **labels (str): Etiquetas de la serie.
+    """
+    if ENABLED:
+        key = _key(name, labels)
+        _COUNTERS[key] = _COUNTERS.get(key, 0) + value
+
+
+def observe(name, value, **labels):
+    """
+    Registra una duración en un histograma si la instrumentación está activa.
+
+    Args:
+        name (str): Nombre del histograma.
+        value (float): Duración en segundos.
+        **labels (str): Etiquetas de la serie.
+    """
+    if ENABLED:
+        key = _key(name, labels)
+        series = _HISTOGRAMS.get(key)
+        if series is None:
+            series = _HISTOGRAMS[key] = Histogram()
+        series.observe(value)
+
+
+@contextmanager
+def timer(name, **labels):
+    """
+    Mide la duración de un bloque with en un histograma.
+
+    Args:
+        name (str): Nombre del histograma.
+        **labels (str): Etiquetas de la serie.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - start, **labels)
+
+
+def timed(operation):
+    """
+    Decorador que mide cada llamada en operation_seconds{op=operation}.
+    Desactivado, sólo agrega la consulta de ENABLED.
+
+    Args:
+        operation (str): Nombre de la operación.
+
+    Returns:
+        callable: Decorador.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not ENABLED:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                observe('operation_seconds', time.perf_counter() - start,
+                        op=operation)
+        return wrapper
+    return decorator
+
+
+def counter(name, **labels):
+    """
+    Obtiene el valor de un contador.
+
+    Args:
+        name (str): Nombre del contador.
+        **labels (str): Etiquetas de la serie.
+
+    Returns:
+        int: Valor acumulado (0 si no existe).
+    """
+    return _COUNTERS.get(_key(name, labels), 0)
+
+
+def histogram(name, **labels):
+    """
+    Obtiene un histograma.
+
+    Args:
+        name (str): Nombre del histograma.
+        **labels (str): Etiquetas de la serie.
+
+    Returns:
+        Histogram: El histograma, o None si no tiene observaciones.
+    """
+    return _HISTOGRAMS.get(_key(name, labels))
+
+
+def snapshot():
+    """
+    Obtiene todos los valores registrados.
+
+    Returns:
+        dict: {"counters": [...], "histograms": [...]} con nombre,
+            etiquetas y valores de cada serie.
+    """
+    return {
+        "counters": [{"name": name, "labels": dict(labels), "value": value}
+                     for (name, labels), value in sorted(_COUNTERS.items())],
+        "histograms": [{"name": name, "labels": dict(labels),
+                        "count": h.count, "sum": h.total,
+                        "p50": h.quantile(0.5), "p99": h.quantile(0.99),
+                        "buckets": dict(zip(BUCKET_LABELS, h.counts))}
+                       for (name, labels), h in sorted(_HISTOGRAMS.items())],
+    }
+
+
+def dump(path):
+    """
+    Guarda los valores registrados en JSON.
+
+    Args:
+        path (str): Archivo destino.
+    """
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(snapshot(), file, indent=2)
+
+
+def _labels_text(labels, extra=()):
+    """Etiquetas en el formato de texto de Prometheus."""
+    pairs = [*labels, *extra]
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{k}="{v}"' for k, v in pairs) + '}'
+
+
+def prometheus_text():
+    """
+    Convierte los valores registrados al formato de texto de Prometheus.
+
+    Returns:
+        str: Exposición de texto (versión 0.0.4).
+    """
+    lines = []
+    for name in sorted({name for name, _ in _COUNTERS}):
+        lines.append(f"# TYPE {PREFIX}{name} counter")
+        for (series, labels), value in sorted(_COUNTERS.items()):
+            if series == name:
+                lines.append(f"{PREFIX}{name}{_labels_text(labels)} {value}")
+    for name in sorted({name for name, _ in _HISTOGRAMS}):
+        lines.append(f"# TYPE {PREFIX}{name} histogram")
+        for (series, labels), h in sorted(_HISTOGRAMS.items()):
+            if series != name:
+                continue
+            cumulative = 0
+            text = _labels_text(labels)
+            for bound, count in zip(BUCKET_LABELS, h.counts):
+                cumulative += count
+                bucket = _labels_text(labels, [('le', bound)])
+                lines.append(f"{PREFIX}{name}_bucket{bucket} {cumulative}")
+            lines.append(f"{PREFIX}{name}_sum{text} {h.total}")
+            lines.append(f"{PREFIX}{name}_count{text} {h.count}")
+    return '\n'.join(lines) + '\n'
+
+
+def write_prometheus(path):
+    """
+    Guarda los valores registrados en el formato de texto de Prometheus.
+
+    Args:
+        path (str): Archivo destino.
+    """
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(prometheus_text())
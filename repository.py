@@ -0,0 +1,122 @@
+"""
+Módulo que define la clase Repository, un almacén de larga vida que
+carga los archivos de hoteles, clientes y reservaciones una sola vez.
+"""
+
+from hotel import Hotel
+from customer import Customer
+from reservation import Reservation
+from shards import open_manifest, shard_files
+from transaction import Transaction, commit_tables
+
+
+class Repository:
+    """
+    Agrupa las tablas en memoria de los tres archivos de datos.
+
+    Los métodos estáticos de Hotel, Customer y Reservation comparten las
+    mismas tablas, por lo que pueden usarse libremente mientras el
+    repositorio está abierto.
+
+    Atributos:
+        hotels (RecordTable): Hoteles indexados por hotel_id.
+        customers (RecordTable): Clientes indexados por customer_id.
+        reservations (RecordTable): Reservaciones indexadas por
+            reservation_id, o None si el archivo de reservaciones es un
+            manifiesto de particiones.
+        reservation_shards (tuple): Tablas de reservaciones (una por
+            partición).
+    """
+
+    def __init__(self, hotel_file, cust_file, res_file, flush_every=None):
+        """
+        Abre (o reutiliza) las tablas de los tres archivos y las fija
+        en el caché para que nunca se descarten.
+
+        Args:
+            hotel_file (str): Archivo de hoteles.
+            cust_file (str): Archivo de clientes.
+            res_file (str): Archivo de reservaciones.
+            flush_every (int, optional): Cambios pendientes que disparan
+                una escritura automática. None solo escribe en flush().
+        """
+        self.hotel_file = hotel_file
+        self.cust_file = cust_file
+        self.res_file = res_file
+        self.hotels = Hotel.table(hotel_file)
+        self.customers = Customer.table(cust_file)
+        self.reservation_shards = tuple(Reservation.table(f)
+                                        for f in shard_files(res_file))
+        self.reservations = (None if open_manifest(res_file)
+                             else self.reservation_shards[0])
+        for table in self.tables():
+            table.pinned = True
+        self._previous_policy = None
+        self.flush_every = flush_every
+
+    def tables(self):
+        """
+        Obtiene las tablas del repositorio.
+
+        Returns:
+            tuple: (hotels, customers, reservaciones...), con una tabla de
+                reservaciones por partición.
+        """
+        return (self.hotels, self.customers) + self.reservation_shards
+
+    def __enter__(self):
+        """Aplica la política de escritura del repositorio."""
+        self._previous_policy = [t.flush_every for t in self.tables()]
+        for table in self.tables():
+            table.flush_every = self.flush_every
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        """Restaura la política anterior y escribe los cambios pendientes."""
+        for table, policy in zip(self.tables(), self._previous_policy):
+            table.flush_every = policy
+        self.flush()
+
+    def flush(self):
+        """
+        Escribe los cambios pendientes de las tres tablas en una sola
+        confirmación atómica, bajo el candado del directorio.
+        """
+        tables = self.tables()
+        with Transaction(*tables):
+            commit_tables([table for table in tables if table.dirty])
+
+    def create_hotel(self, hotel_obj):
+        """Equivalente a Hotel.create_hotel sobre el repositorio."""
+        return Hotel.create_hotel(self.hotel_file, hotel_obj)
+
+    def delete_hotel(self, hotel_id):
+        """Equivalente a Hotel.delete_hotel sobre el repositorio."""
+        return Hotel.delete_hotel(self.hotel_file, hotel_id)
+
+    def create_customer(self, customer_obj):
+        """Equivalente a Customer.create_customer sobre el repositorio."""
+        return Customer.create_customer(self.cust_file, customer_obj)
+
+    def delete_customer(self, customer_id):
+        """Equivalente a Customer.delete_customer sobre el repositorio."""
+        return Customer.delete_customer(self.cust_file, customer_id)
+
+    def create_reservation(self, reservation_obj, waitlist=False, priority=0):
+        """Equivalente a Reservation.create_reservation en el repositorio."""
+        return Reservation.create_reservation(
+            self.res_file, self.hotel_file, self.cust_file, reservation_obj,
+            waitlist, priority
+        )
+
+    def create_group_booking(self, reservations):
+        """Equivalente a Reservation.create_group_booking en el repositorio."""
+        return Reservation.create_group_booking(
+            self.res_file, self.hotel_file, self.cust_file, reservations
+        )
+
+    def cancel_reservation(self, reservation_id):
+        """Equivalente a Reservation.cancel_reservation en el repositorio."""
+        return Reservation.cancel_reservation(
+            self.res_file, self.hotel_file, reservation_id
+        )
@@ -4,9 +4,25 @@ Módulo que define la clase Reservation y sus métodos
 para CRUD y manejo de archivos.
 """
 
+import copy
+import heapq
 import os
+from operator import attrgetter
+
+from aggregates import hotel_aggregates
+from availability import (availability_index, format_date, parse_date,
+                          stay_nights)
+from bulk import bulk_delete, bulk_insert, export_table, merge_results
+from indexes import secondary_index
+from metrics import timed
 from hotel import Hotel
 from customer import Customer
+from shards import (ShardEntry, open_id_index, open_manifest,
+                    register_shards, shard_files, shard_for)
+from storage import intern_text, iter_records, open_table
+from transaction import Transaction
+from waitlist import (WaitlistEntry, overbooking_limit, waitlist_queue,
+                      waitlist_table)
 
 
 class Reservation:
@@ -19,8 +35,14 @@ class Reservation:
         customer_id (str): ID del cliente.
         check_in (str): Fecha de llegada.
         check_out (str): Fecha de salida.
+
+    Las fechas ISO válidas se guardan como ordinales (int) y se exponen
+    como texto; cualquier otro valor se conserva tal cual.
     """
 
+    __slots__ = ('reservation_id', 'hotel_id', 'customer_id',
+                 '_check_in', '_check_out')
+
     def __init__(self, reservation_id, hotel_id, customer_id, dates):
         """
         Inicializa una reservación.
@@ -32,139 +54,911 @@ class Reservation:
             dates (tuple): Tupla que contiene (check_in, check_out).
         """
         self.reservation_id = reservation_id
-        self.hotel_id = hotel_id
-        self.customer_id = customer_id
+        self.hotel_id = intern_text(hotel_id)
+        self.customer_id = intern_text(customer_id)
         self.check_in, self.check_out = dates
 
     @staticmethod
-    def load_reservations(filename):
+    def _store_date(value):
+        """Convierte una fecha ISO a ordinal si se puede reconstruir."""
+        try:
+            ordinal = parse_date(value)
+        except (TypeError, ValueError):
+            return value
+        return ordinal if format_date(ordinal) == value else value
+
+    @staticmethod
+    def _show_date(value):
+        """Convierte un ordinal guardado de vuelta a texto ISO."""
+        return format_date(value) if isinstance(value, int) else value
+
+    @property
+    def check_in(self):
+        """str: Fecha de llegada."""
+        return Reservation._show_date(self._check_in)
+
+    @check_in.setter
+    def check_in(self, value):
+        self._check_in = Reservation._store_date(value)
+
+    @property
+    def check_out(self):
+        """str: Fecha de salida."""
+        return Reservation._show_date(self._check_out)
+
+    @check_out.setter
+    def check_out(self, value):
+        self._check_out = Reservation._store_date(value)
+
+    def nights(self):
         """
-        Carga las reservaciones desde un archivo de texto.
-        Formato: reservation_id|hotel_id|customer_id|check_in|check_out
+        Obtiene el rango de noches [llegada, salida) como ordinales.
+
+        Returns:
+            tuple: (ordinal de la primera noche, ordinal de la salida).
+
+        Raises:
+            ValueError: Si las fechas son inválidas o la salida no es
+                posterior a la llegada.
+        """
+        start, end = self._check_in, self._check_out
+        if isinstance(start, int) and isinstance(end, int) and end > start:
+            return start, end
+        return stay_nights(self.check_in, self.check_out)
+
+    def to_line(self):
+        """
+        Convierte la reservación a una línea del archivo de datos.
+
+        Returns:
+            str: Línea con formato
+                reservation_id|hotel_id|customer_id|check_in|check_out
+        """
+        return (f"{self.reservation_id}|{self.hotel_id}|{self.customer_id}|"
+                f"{self.check_in}|{self.check_out}")
+
+    @staticmethod
+    def from_line(line):
+        """
+        Crea una reservación a partir de una línea del archivo de datos.
+
+        Args:
+            line (str): Línea sin salto de línea.
+
+        Returns:
+            Reservation: Objeto Reservation.
+
+        Raises:
+            ValueError: Si la línea no tiene el formato esperado.
+        """
+        return Reservation.from_fields(line.split('|'))
+
+    @staticmethod
+    def from_fields(fields):
+        """
+        Crea una reservación a partir de los campos de una línea.
+
+        Args:
+            fields (list): Campos en el orden del archivo de datos.
+
+        Returns:
+            Reservation: Objeto Reservation.
+
+        Raises:
+            ValueError: Si los campos no tienen el formato esperado.
+        """
+        rid, hid, cid, cin, cout = fields
+        return Reservation(rid, hid, cid, (cin, cout))
+
+    @staticmethod
+    def table(filename, workers=None):
+        """
+        Obtiene la tabla en memoria del archivo de reservaciones.
 
         Args:
             filename (str): Ruta del archivo.
+            workers (int, optional): Procesos para cargar el archivo en
+                paralelo (ver loader.py).
+
+        Returns:
+            RecordTable: Tabla indexada por reservation_id.
+        """
+        return open_table(filename, Reservation.from_line,
+                          attrgetter('reservation_id'),
+                          from_fields=Reservation.from_fields, workers=workers,
+                          kind='reservation')
+
+    @staticmethod
+    def availability(filename_res, filename_hotels):
+        """
+        Obtiene el índice de disponibilidad por noche de los archivos dados.
+
+        Args:
+            filename_res (str): Archivo de reservaciones (o una partición).
+            filename_hotels (str): Archivo de hoteles.
+
+        Returns:
+            AvailabilityIndex: Índice mantenido al día con ambos archivos.
+        """
+        return availability_index(Hotel.table(filename_hotels),
+                                  Reservation.table(filename_res))
+
+    @staticmethod
+    def aggregates(filename_res, filename_hotels):
+        """
+        Obtiene los agregados de ocupación (reservaciones y noches vendidas
+        por hotel, mes y ubicación), consultables en O(1).
+
+        Args:
+            filename_res (str): Archivo de reservaciones o manifiesto de
+                particiones.
+            filename_hotels (str): Archivo de hoteles.
+
+        Returns:
+            HotelAggregates: Agregados mantenidos al día con los archivos.
+        """
+        return hotel_aggregates(Hotel.table(filename_hotels),
+                                [Reservation.table(shard)
+                                 for shard in shard_files(filename_res)])
+
+    @staticmethod
+    def iter_reservations(filename, predicate=None):
+        """
+        Itera los reservaciones del archivo de forma perezosa, sin cargar
+        la lista completa. El llamador puede detenerse en cualquier momento.
+
+        Args:
+            filename (str): Ruta del archivo o manifiesto de particiones.
+            predicate (callable, optional): Filtro; recibe un Reservation.
+
+        Yields:
+            Reservation: Objetos Reservation que cumplen el filtro.
+        """
+        for shard in shard_files(filename):
+            yield from iter_records(shard, Reservation.from_line,
+                                    attrgetter('reservation_id'), predicate,
+                                    from_fields=Reservation.from_fields)
+
+    @staticmethod
+    @timed('find_reservation')
+    def find_reservation(filename, reservation_id):
+        """
+        Busca la reservación por su ID, deteniéndose en la primera
+        coincidencia. Con un manifiesto sólo se lee la partición que
+        indica el índice global de IDs.
+
+        Args:
+            filename (str): Ruta del archivo o manifiesto de particiones.
+            reservation_id (str): ID buscado.
+
+        Returns:
+            Reservation: Objeto Reservation, o None si no existe.
+        """
+        shard = Reservation.locate(filename, reservation_id)
+        if shard is None:
+            return None
+        return next(iter_records(shard, Reservation.from_line,
+                                 attrgetter('reservation_id'),
+                                 record_id=reservation_id,
+                                 from_fields=Reservation.from_fields), None)
+
+    @staticmethod
+    def id_index(filename):
+        """
+        Obtiene el índice global de IDs de un manifiesto de particiones
+        (ver shards.open_id_index).
+
+        Args:
+            filename (str): Archivo de reservaciones o manifiesto de
+                particiones.
+
+        Returns:
+            RecordTable: Objetos ShardEntry indexados por reservation_id, o
+                None si filename no es un manifiesto.
+        """
+        manifest = open_manifest(filename)
+        if manifest is None:
+            return None
+        return open_id_index(manifest, lambda shard: [
+            res.reservation_id
+            for res in Reservation.iter_reservations(shard)])
+
+    @staticmethod
+    def index_ids(ids, reservations, reservation_ids):
+        """
+        Actualiza el índice global de IDs con reservaciones creadas o
+        canceladas en una partición: agrega las que la partición guarda y
+        quita las que ya no están. Se llama dentro de la transacción que
+        modifica la partición, con el índice entre sus tablas.
+
+        Args:
+            ids (RecordTable): Índice global de IDs (id_index()), o None
+                si el archivo no es un manifiesto.
+            reservations (RecordTable): Tabla de la partición.
+            reservation_ids (iterable): IDs afectados.
+        """
+        if ids is None:
+            return
+        name = os.path.basename(reservations.filename)
+        for reservation_id in reservation_ids:
+            entry = ids.get(reservation_id)
+            if reservation_id in reservations:
+                if entry is None:
+                    ids.insert(ShardEntry(reservation_id, name))
+            elif entry is not None and entry.shard == name:
+                ids.delete(reservation_id)
+
+    @staticmethod
+    def locate(filename, reservation_id):
+        """
+        Obtiene el archivo que guarda una reservación.
+
+        Args:
+            filename (str): Archivo de reservaciones o manifiesto de
+                particiones.
+            reservation_id (str): ID buscado.
+
+        Returns:
+            str: filename si no es un manifiesto; si lo es, la partición
+                que contiene la reservación según el índice global de IDs,
+                o None si no está en ninguna.
+        """
+        manifest = open_manifest(filename)
+        if manifest is None:
+            return filename
+        return manifest.locate(Reservation.id_index(filename)
+                               .get(reservation_id))
+
+    @staticmethod
+    def _stored_elsewhere(filename, shard, reservation_id):
+        """
+        Indica si el ID ya está en otra partición del manifiesto, para
+        que reservation_id siga siendo único en todas las particiones.
+
+        Args:
+            filename (str): Archivo de reservaciones o manifiesto.
+            shard (str): Partición donde se va a guardar la reservación.
+            reservation_id (str): ID de la reservación.
+
+        Returns:
+            bool: True (e imprime el error) si otra partición ya lo tiene.
+        """
+        found = Reservation.locate(filename, reservation_id)
+        if found is None or found == shard:
+            return False
+        print(f"[Error] La reservación {reservation_id} ya existe.")
+        return True
+
+    @staticmethod
+    def find_by_hotel(filename, hotel_id):
+        """
+        Busca las reservaciones de un hotel usando el índice secundario.
+
+        Args:
+            filename (str): Archivo de reservaciones o manifiesto de
+                particiones.
+            hotel_id (str): ID del hotel.
 
         Returns:
             list: Lista de objetos Reservation.
         """
-        reservations = []
-        if not os.path.exists(filename):
-            return reservations
+        table = Reservation.table(shard_for(filename, hotel_id))
+        return secondary_index(table, 'hotel_id').lookup(hotel_id)
+
+    @staticmethod
+    def find_by_customer(filename, customer_id):
+        """
+        Busca las reservaciones de un cliente usando el índice secundario.
+
+        Args:
+            filename (str): Archivo de reservaciones o manifiesto de
+                particiones.
+            customer_id (str): ID del cliente.
+
+        Returns:
+            list: Lista de objetos Reservation.
+        """
+        return [r for shard in shard_files(filename)
+                for r in secondary_index(Reservation.table(shard),
+                                         'customer_id').lookup(customer_id)]
+
+    @staticmethod
+    def find_by_check_in(filename, start, end=None):
+        """
+        Busca las reservaciones con fecha de llegada en [start, end]
+        usando un índice ordenado.
+
+        Args:
+            filename (str): Archivo de reservaciones o manifiesto de
+                particiones.
+            start (str): Primera fecha de llegada (AAAA-MM-DD).
+            end (str, optional): Última fecha de llegada; por omisión start.
+
+        Returns:
+            list: Lista de objetos Reservation ordenada por llegada.
+        """
+        end = start if end is None else end
+        indexes = (secondary_index(Reservation.table(shard), 'check_in',
+                                   ordered=True)
+                   for shard in shard_files(filename))
+        return list(heapq.merge(
+            *(index.lookup_range(start, end) for index in indexes),
+            key=attrgetter('check_in')))
 
-        with open(filename, 'r', encoding='utf-8') as file:
-            for line in file:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    rid, hid, cid, cin, cout = line.split('|')
-                    r = Reservation(rid, hid, cid, (cin, cout))
-                    reservations.append(r)
-                except ValueError as err:
-                    print(f"[Error] Datos inválidos: '{line}'. {err}")
-        return reservations
+    @staticmethod
+    @timed('load_reservations')
+    def load_reservations(filename, workers=None):
+        """
+        Carga las reservaciones desde un archivo de texto.
+        Formato: reservation_id|hotel_id|customer_id|check_in|check_out
+
+        Args:
+            filename (str): Ruta del archivo o manifiesto de particiones.
+            workers (int, optional): Procesos para cargar en paralelo un
+                archivo grande; las líneas inválidas quedan en
+                table(filename).load_report.
+
+        Returns:
+            list: Lista de objetos Reservation.
+        """
+        return [r for shard in shard_files(filename)
+                for r in Reservation.table(shard, workers).snapshot()]
 
     @staticmethod
+    @timed('save_reservations')
     def save_reservations(filename, reservations_list):
         """
         Guarda la lista de reservaciones en un archivo de texto.
         Sobrescribe el contenido anterior.
 
         Args:
-            filename (str): Ruta del archivo.
+            filename (str): Ruta del archivo o manifiesto de particiones.
             reservations_list (list): Lista de objetos Reservation.
         """
-        with open(filename, 'w', encoding='utf-8') as file:
-            for r in reservations_list:
-                line = f"{r.reservation_id}|{r.hotel_id}|{r.customer_id}|"
-                line += f"{r.check_in}|{r.check_out}\n"
-                file.write(line)
+        groups = {shard: [] for shard in shard_files(filename)}
+        for res in reservations_list:
+            shard = shard_for(filename, res.hotel_id)
+            groups.setdefault(shard, []).append(res)
+        tables = [Reservation.table(shard) for shard in groups]
+        ids = Reservation.id_index(filename)
+        extra = () if ids is None else (ids,)
+        with Transaction(*tables, *extra):
+            for table, group in zip(tables, groups.values()):
+                table.replace(group)
+            if ids is not None:
+                ids.replace(ShardEntry(res.reservation_id,
+                                       os.path.basename(shard))
+                            for shard, group in groups.items()
+                            for res in group)
+        for table in tables:
+            table.flush()
+        register_shards(filename, *{res.hotel_id for res in reservations_list})
 
     @staticmethod
-    def create_reservation(filename_res, filename_hotels, filename_cust, reservation_obj):
+    @timed('create_reservation')
+    def create_reservation(filename_res, filename_hotels, filename_cust,
+                           reservation_obj, waitlist=False, priority=0):
         """
-        Crea una reservación si el Hotel y el Cliente existen y hay habitaciones disponibles.
-        Actualiza la disponibilidad del hotel y guarda la reservación.
+        Crea una reservación si el Hotel y el Cliente existen y hay
+        habitaciones disponibles todas las noches entre check_in y
+        check_out (más la sobreventa permitida, ver
+        waitlist.set_overbooking).
+        Guarda la reservación y actualiza rooms_available del hotel.
 
         Args:
-            filename_res (str): Archivo de reservaciones.
+            filename_res (str): Archivo de reservaciones o manifiesto de
+                particiones; con un manifiesto sólo se reescribe la
+                partición del hotel.
             filename_hotels (str): Archivo de hoteles.
             filename_cust (str): Archivo de clientes.
             reservation_obj (Reservation): Objeto Reservation a crear.
+            waitlist (bool, optional): Si no hay habitaciones, guardar la
+                solicitud en la lista de espera del hotel; se reserva sola
+                cuando una cancelación libera lugar.
+            priority (int, optional): Prioridad en la lista de espera
+                (mayor primero; a igual prioridad, la más antigua).
 
         Returns:
-            bool: True si la operación es exitosa, False en caso de error.
+            bool: True si la operación es exitosa, False en caso de error
+                (también si la solicitud quedó en espera).
+        """
+        hotels = Hotel.table(filename_hotels)
+        customers = Customer.table(filename_cust)
+        shard = shard_for(filename_res, reservation_obj.hotel_id)
+        reservations = Reservation.table(shard)
+        queue = Reservation.waitlist(filename_res) if waitlist else None
+        ids = Reservation.id_index(filename_res)
+        tables = (hotels, customers, reservations)
+        if queue is not None:
+            tables += (queue.table,)
+        if ids is not None:
+            tables += (ids,)
+        with Transaction(*tables):
+            if Reservation._stored_elsewhere(filename_res, shard,
+                                             reservation_obj.reservation_id):
+                return False
+            created = Reservation.apply_reservation(
+                hotels, customers, reservations, reservation_obj, queue,
+                priority)
+            if created:
+                Reservation.index_ids(ids, reservations,
+                                      [reservation_obj.reservation_id])
+        if created:
+            register_shards(filename_res, reservation_obj.hotel_id)
+        return created
+
+    @staticmethod
+    def apply_reservation(hotels, customers, reservations, reservation_obj,
+                          waitlist=None, priority=0):
         """
-        hotels = Hotel.load_hotels(filename_hotels)
-        customers = Customer.load_customers(filename_cust)
+        Valida y aplica una reservación sobre las tablas dadas, sin escribir.
 
-        target_hotel = None
-        for h in hotels:
-            if h.hotel_id == reservation_obj.hotel_id:
-                target_hotel = h
-                break
-        if not target_hotel:
+        Args:
+            hotels (RecordTable): Tabla de hoteles.
+            customers (RecordTable): Tabla de clientes.
+            reservations (RecordTable): Tabla de reservaciones.
+            reservation_obj (Reservation): Objeto Reservation a crear.
+            waitlist (Waitlist, optional): Lista de espera donde guardar la
+                solicitud si no hay habitaciones.
+            priority (int, optional): Prioridad en la lista de espera.
+
+        Returns:
+            bool: True si la reservación se aplicó, False en caso de error.
+        """
+        stored_hotel = hotels.get(reservation_obj.hotel_id)
+        if stored_hotel is None:
             print(f"[Error] El hotel {reservation_obj.hotel_id} no existe.")
             return False
 
-        target_customer = None
-        for c in customers:
-            if c.customer_id == reservation_obj.customer_id:
-                target_customer = c
-                break
-        if not target_customer:
+        if reservation_obj.customer_id not in customers:
             print(f"[Error] El cliente {reservation_obj.customer_id} no existe.")
             return False
 
-        if not target_hotel.reserve_room():
-            print("[Error] No hay habitaciones disponibles.")
+        try:
+            reservation_obj.nights()
+        except ValueError as err:
+            print(f"[Error] Fechas inválidas: {err}")
             return False
 
-        existing_res = Reservation.load_reservations(filename_res)
-        for r in existing_res:
-            if r.reservation_id == reservation_obj.reservation_id:
-                print(f"[Error] La reservación {reservation_obj.reservation_id} ya existe.")
-                target_hotel.cancel_reservation()
-                return False
+        reservation_id = reservation_obj.reservation_id
+        if reservation_id in reservations:
+            print(f"[Error] La reservación {reservation_id} ya existe.")
+            return False
+
+        availability = availability_index(hotels, reservations)
+        hotel_id = reservation_obj.hotel_id
+        dates = (reservation_obj.check_in, reservation_obj.check_out)
+        if not availability.can_book(hotel_id, *dates,
+                                     overbooking=overbooking_limit(hotel_id)):
+            if waitlist is None:
+                print("[Error] No hay habitaciones disponibles.")
+            elif waitlist.table.insert(WaitlistEntry(
+                    reservation_id, hotel_id, reservation_obj.customer_id,
+                    dates, priority)):
+                print("[Aviso] No hay habitaciones disponibles; la "
+                      f"reservación {reservation_id} quedó en la lista de "
+                      f"espera (lugar {waitlist.position(reservation_id)}).")
+            else:
+                print(f"[Error] La reservación {reservation_id} ya está en la "
+                      "lista de espera.")
+            return False
 
-        existing_res.append(reservation_obj)
-        Reservation.save_reservations(filename_res, existing_res)
-        Hotel.save_hotels(filename_hotels, hotels)
+        reservations.insert(reservation_obj)
+        Reservation._sync_rooms(hotels, reservations, reservation_obj.hotel_id)
         return True
 
     @staticmethod
+    def _sync_rooms(hotels, reservations, hotel_id):
+        """
+        Actualiza rooms_available del hotel con las habitaciones libres en
+        su noche más ocupada (ver AvailabilityIndex.rooms_available).
+
+        Args:
+            hotels (RecordTable): Tabla de hoteles.
+            reservations (RecordTable): Tabla con las reservaciones del hotel.
+            hotel_id (str): ID del hotel.
+        """
+        stored_hotel = hotels.get(hotel_id)
+        index = availability_index(hotels, reservations)
+        available = index.rooms_available(hotel_id)
+        if stored_hotel is not None and \
+                stored_hotel.rooms_available != available:
+            target_hotel = copy.copy(stored_hotel)
+            target_hotel.rooms_available = available
+            hotels.update(target_hotel)
+
+    @staticmethod
+    def group(group_id, hotel_id, customer_id, dates, rooms):
+        """
+        Arma las reservaciones de un bloque de habitaciones, una por
+        habitación, con IDs group_id-001, group_id-002, ...
+
+        Args:
+            group_id (str): Prefijo de los IDs.
+            hotel_id (str): ID del hotel.
+            customer_id (str): ID del cliente.
+            dates (tuple): Tupla que contiene (check_in, check_out).
+            rooms (int): Número de habitaciones.
+
+        Returns:
+            list: Objetos Reservation.
+        """
+        return [Reservation(f"{group_id}-{number:03d}", hotel_id,
+                            customer_id, dates)
+                for number in range(1, rooms + 1)]
+
+    @staticmethod
+    @timed('create_group_booking')
+    def create_group_booking(filename_res, filename_hotels, filename_cust,
+                             reservations):
+        """
+        Crea varias reservaciones (por ejemplo un bloque de habitaciones en
+        uno o varios hoteles) como una sola unidad: se validan y aplican
+        en una pasada dentro de una transacción y se escriben con una sola
+        confirmación. Si alguna falla no se guarda ninguna.
+
+        Args:
+            filename_res (str): Archivo de reservaciones o manifiesto de
+                particiones; las particiones de todos los hoteles del
+                grupo se confirman juntas.
+            filename_hotels (str): Archivo de hoteles.
+            filename_cust (str): Archivo de clientes.
+            reservations (iterable): Objetos Reservation, uno por habitación
+                (ver group()).
+
+        Returns:
+            bool: True si se crearon todas, False si no se creó ninguna.
+        """
+        reservations = list(reservations)
+        if not reservations:
+            return True
+        hotels = Hotel.table(filename_hotels)
+        customers = Customer.table(filename_cust)
+        shards = [shard_for(filename_res, res.hotel_id)
+                  for res in reservations]
+        tables = {shard: Reservation.table(shard) for shard in shards}
+        ids = Reservation.id_index(filename_res)
+        extra = () if ids is None else (ids,)
+        with Transaction(hotels, customers, *tables.values(),
+                         *extra) as transaction:
+            seen = set()
+            for res, shard in zip(reservations, shards):
+                if res.reservation_id in seen:
+                    print(f"[Error] La reservación {res.reservation_id} "
+                          "está repetida en el grupo.")
+                    transaction.rollback()
+                    return False
+                seen.add(res.reservation_id)
+                if Reservation._stored_elsewhere(filename_res, shard,
+                                                 res.reservation_id) or \
+                        not Reservation.apply_reservation(hotels, customers,
+                                                          tables[shard], res):
+                    transaction.rollback()
+                    return False
+                Reservation.index_ids(ids, tables[shard], [res.reservation_id])
+        register_shards(filename_res, *{res.hotel_id for res in reservations})
+        return True
+
+    @staticmethod
+    @timed('cancel_reservation')
     def cancel_reservation(filename_res, filename_hotels, reservation_id):
         """
         Cancela una reservación dada por su ID.
-        Restaura la habitación en el hotel correspondiente y guarda los cambios.
+        Actualiza rooms_available del hotel y guarda los cambios.
 
         Args:
-            filename_res (str): Archivo de reservaciones.
+            filename_res (str): Archivo de reservaciones o manifiesto de
+                particiones.
             filename_hotels (str): Archivo de hoteles.
             reservation_id (str): ID de la reservación a cancelar.
 
+        Si el hotel tiene lista de espera, se reservan en orden de
+        prioridad las solicitudes que caben en las noches liberadas; una
+        reservación que todavía está en espera sólo sale de la lista.
+
         Returns:
             bool: True si se canceló, False si no se encontró la reservación.
         """
-        res_list = Reservation.load_reservations(filename_res)
-        to_cancel = None
-        for r in res_list:
-            if r.reservation_id == reservation_id:
-                to_cancel = r
-                break
-
-        if not to_cancel:
+        table = waitlist_table(filename_res, create=False)
+        queue = waitlist_queue(table) if table is not None else None
+        shard = Reservation.locate(filename_res, reservation_id)
+        if queue is not None and reservation_id in queue.table and \
+                (shard is None
+                 or reservation_id not in Reservation.table(shard)):
+            with Transaction(queue.table):
+                queue.table.delete(reservation_id)
+            print(f"[Aviso] La reservación '{reservation_id}' salió de la "
+                  "lista de espera.")
+            return True
+        if shard is None:
             print(f"[Aviso] No se encontró la reservación '{reservation_id}'.")
             return False
+        hotels = Hotel.table(filename_hotels)
+        reservations = Reservation.table(shard)
+        ids = Reservation.id_index(filename_res)
+        tables = (hotels, reservations)
+        if queue is not None:
+            tables += (queue.table,)
+        if ids is not None:
+            tables += (ids,)
+        with Transaction(*tables):
+            canceled = Reservation.apply_cancellation(
+                hotels, reservations, reservation_id, queue, ids)
+        return canceled is not None
+
+    @staticmethod
+    def apply_cancellation(hotels, reservations, reservation_id,
+                           waitlist=None, ids=None):
+        """
+        Elimina una reservación y actualiza rooms_available, sin escribir.
 
-        hotels = Hotel.load_hotels(filename_hotels)
-        for h in hotels:
-            if h.hotel_id == to_cancel.hotel_id:
-                h.cancel_reservation()
-                break
+        Args:
+            hotels (RecordTable): Tabla de hoteles.
+            reservations (RecordTable): Tabla de reservaciones.
+            reservation_id (str): ID de la reservación a cancelar.
+            waitlist (Waitlist, optional): Lista de espera de la que se
+                promueven las solicitudes que caben en las noches liberadas.
+            ids (RecordTable, optional): Índice global de IDs del manifiesto
+                al que pertenece la partición (ver index_ids()).
 
-        new_res_list = [r for r in res_list if r.reservation_id != reservation_id]
-        Reservation.save_reservations(filename_res, new_res_list)
-        Hotel.save_hotels(filename_hotels, hotels)
-        return True
+        Returns:
+            Reservation: La reservación cancelada, o None si no existe.
+        """
+        to_cancel = reservations.delete(reservation_id)
+        if to_cancel is None:
+            print(f"[Aviso] No se encontró la reservación '{reservation_id}'.")
+            return None
+
+        Reservation._sync_rooms(hotels, reservations, to_cancel.hotel_id)
+        promoted = []
+        if waitlist is not None:
+            try:
+                nights = to_cancel.nights()
+            except ValueError:
+                nights = None
+            if nights is not None:
+                promoted = Reservation.apply_promotion(
+                    hotels, reservations, waitlist, to_cancel.hotel_id, nights)
+        Reservation.index_ids(ids, reservations, [
+            reservation_id, *(res.reservation_id for res in promoted)])
+        return to_cancel
+
+    @staticmethod
+    def waitlist(filename_res):
+        """
+        Obtiene la lista de espera de un archivo de reservaciones.
+
+        Args:
+            filename_res (str): Archivo de reservaciones o manifiesto de
+                particiones.
+
+        Returns:
+            Waitlist: Solicitudes en espera por hotel (entries(), position()).
+        """
+        return waitlist_queue(waitlist_table(filename_res))
+
+    @staticmethod
+    def promote_waitlist(filename_res, filename_hotels, hotel_id):
+        """
+        Reserva las solicitudes en espera de un hotel que ya caben, por
+        ejemplo después de aumentar sus habitaciones o su sobreventa.
+
+        Args:
+            filename_res (str): Archivo de reservaciones o manifiesto de
+                particiones.
+            filename_hotels (str): Archivo de hoteles.
+            hotel_id (str): ID del hotel.
+
+        Returns:
+            list: Objetos Reservation creados, en orden de prioridad.
+        """
+        table = waitlist_table(filename_res, create=False)
+        if table is None:
+            return []
+        queue = waitlist_queue(table)
+        hotels = Hotel.table(filename_hotels)
+        reservations = Reservation.table(shard_for(filename_res, hotel_id))
+        ids = Reservation.id_index(filename_res)
+        extra = () if ids is None else (ids,)
+        with Transaction(hotels, reservations, table, *extra):
+            promoted = Reservation.apply_promotion(hotels, reservations, queue,
+                                                   hotel_id)
+            Reservation.index_ids(ids, reservations,
+                                  [res.reservation_id for res in promoted])
+        if promoted:
+            register_shards(filename_res, hotel_id)
+        return promoted
+
+    @staticmethod
+    def apply_promotion(hotels, reservations, waitlist, hotel_id, nights=None):
+        """
+        Reserva, en orden de prioridad, las solicitudes en espera de un
+        hotel que caben, sin escribir.
+
+        Args:
+            hotels (RecordTable): Tabla de hoteles.
+            reservations (RecordTable): Tabla de reservaciones del hotel.
+            waitlist (Waitlist): Lista de espera.
+            hotel_id (str): ID del hotel.
+            nights (tuple, optional): Noches liberadas (inicio, fin) como
+                ordinales; el recorrido termina cuando vuelven a estar
+                llenas. Por omisión se revisa toda la lista.
+
+        Returns:
+            list: Objetos Reservation creados.
+        """
+        availability = availability_index(hotels, reservations)
+        overbooking = overbooking_limit(hotel_id)
+        is_full = None if nights is None else \
+            (lambda: availability.is_full(hotel_id, *nights, overbooking))
+
+        def book(entry):
+            if entry.reservation_id in reservations:
+                print(f"[Aviso] La reservación {entry.reservation_id} ya "
+                      "existe; sale de la lista de espera.")
+                waitlist.table.delete(entry.reservation_id)
+                return False
+            try:
+                if not availability.can_book(hotel_id, entry.check_in,
+                                             entry.check_out,
+                                             overbooking=overbooking):
+                    return False
+            except ValueError:
+                waitlist.table.delete(entry.reservation_id)
+                return False
+            reservations.insert(Reservation(
+                entry.reservation_id, entry.hotel_id, entry.customer_id,
+                (entry.check_in, entry.check_out)))
+            Reservation._sync_rooms(hotels, reservations, hotel_id)
+            return True
+
+        promoted = waitlist.promote(hotel_id, book, is_full)
+        for entry in promoted:
+            print(f"[Aviso] La reservación {entry.reservation_id} salió de "
+                  "la lista de espera y quedó confirmada.")
+        return [copy.copy(reservations.get(entry.reservation_id))
+                for entry in promoted]
+
+    @staticmethod
+    @timed('bulk_create_reservations')
+    def bulk_create_reservations(filename_res, filename_hotels, filename_cust,
+                                 reservations):
+        """
+        Crea muchas reservaciones con una sola escritura de cada archivo.
+        Cada reservación se valida igual que en create_reservation; las
+        inválidas se rechazan sin detener el lote.
+
+        Args:
+            filename_res (str): Archivo de reservaciones o manifiesto de
+                particiones; con un manifiesto se procesa cada partición
+                por separado.
+            filename_hotels (str): Archivo de hoteles.
+            filename_cust (str): Archivo de clientes.
+            reservations (iterable): Objetos Reservation a crear.
+
+        Returns:
+            BulkResult: Reservaciones creadas, IDs rechazados y
+                registros/segundo.
+        """
+        manifest = open_manifest(filename_res)
+        if manifest is not None:
+            hotels = Hotel.table(filename_hotels)
+            customers = Customer.table(filename_cust)
+            ids = Reservation.id_index(filename_res)
+            groups = {}
+            owners = {}
+            rejected = []
+            for res in reservations:
+                shard = manifest.shard_for(res.hotel_id)
+                if owners.setdefault(res.reservation_id, shard) != shard \
+                        or manifest.locate(ids.get(res.reservation_id)) \
+                        not in (None, shard):
+                    rejected.append(res.reservation_id)
+                else:
+                    groups.setdefault(shard, []).append(res)
+            with Transaction(hotels, customers, ids,
+                             *map(Reservation.table, groups)):
+                results = [
+                    Reservation.bulk_create_reservations(
+                        shard, filename_hotels, filename_cust, group)
+                    for shard, group in groups.items()]
+                for shard in groups:
+                    Reservation.index_ids(
+                        ids, Reservation.table(shard),
+                        [res.reservation_id for res in groups[shard]])
+            register_shards(filename_res, *{
+                group[0].hotel_id for group, result in zip(groups.values(),
+                                                           results)
+                if result.processed})
+            return merge_results(results, rejected)
+
+        hotels = Hotel.table(filename_hotels)
+        customers = Customer.table(filename_cust)
+        availability = Reservation.availability(filename_res, filename_hotels)
+
+        touched = set()
+
+        def accept(res):
+            if res.hotel_id not in hotels or res.customer_id not in customers:
+                return False
+            try:
+                limit = overbooking_limit(res.hotel_id)
+                if not availability.can_book(res.hotel_id, res.check_in,
+                                             res.check_out, overbooking=limit):
+                    return False
+            except ValueError:
+                return False
+            touched.add(res.hotel_id)
+            return True
+
+        res_table = Reservation.table(filename_res)
+        with Transaction(hotels, customers, res_table):
+            result = bulk_insert(res_table, reservations, accept)
+            for hotel_id in touched:
+                Reservation._sync_rooms(hotels, res_table, hotel_id)
+        return result
+
+    @staticmethod
+    @timed('bulk_delete_reservations')
+    def bulk_delete_reservations(filename_res, filename_hotels,
+                                 reservation_ids):
+        """
+        Cancela muchas reservaciones con una sola escritura de cada archivo.
+
+        Args:
+            filename_res (str): Archivo de reservaciones o manifiesto de
+                particiones.
+            filename_hotels (str): Archivo de hoteles.
+            reservation_ids (iterable): IDs de las reservaciones a cancelar.
+
+        Returns:
+            BulkResult: Reservaciones canceladas, IDs no encontrados y
+                registros/segundo.
+        """
+        manifest = open_manifest(filename_res)
+        if manifest is not None:
+            ids = Reservation.id_index(filename_res)
+            groups = {}
+            missing = []
+            for reservation_id in reservation_ids:
+                shard = manifest.locate(ids.get(reservation_id))
+                if shard is None:
+                    missing.append(reservation_id)
+                else:
+                    groups.setdefault(shard, []).append(reservation_id)
+            with Transaction(Hotel.table(filename_hotels), ids,
+                             *map(Reservation.table, groups)):
+                results = [Reservation.bulk_delete_reservations(
+                    shard, filename_hotels, group)
+                    for shard, group in groups.items()]
+                for shard in groups:
+                    Reservation.index_ids(ids, Reservation.table(shard),
+                                          groups[shard])
+            return merge_results(results, missing)
+
+        hotels = Hotel.table(filename_hotels)
+        touched = set()
+
+        res_table = Reservation.table(filename_res)
+        with Transaction(hotels, res_table):
+            result = bulk_delete(res_table, reservation_ids,
+                                 lambda res: touched.add(res.hotel_id))
+            for hotel_id in touched:
+                Reservation._sync_rooms(hotels, res_table, hotel_id)
+        return result
+
+    @staticmethod
+    def export_reservations(filename, out):
+        """
+        Exporta las reservaciones a un flujo de texto en el formato del
+        archivo.
+
+        Args:
+            filename (str): Ruta del archivo o manifiesto de particiones.
+            out (io.TextIOBase): Flujo de salida.
+
+        Returns:
+            BulkResult: Reservaciones exportadas y registros/segundo.
+        """
+        return merge_results([export_table(Reservation.table(shard), out)
+                              for shard in shard_files(filename)])
@@ -0,0 +1,105 @@
+"""
+Módulo de búsqueda de disponibilidad entre hoteles.
+
+Responde consultas de ubicación + fechas + habitaciones mínimas sin
+recorrer las reservaciones: los candidatos salen del índice secundario
+por ubicación y las habitaciones libres del índice de ocupación por
+noche (availability.py), que se mantienen al día con las tablas. Los
+resultados se ordenan por habitaciones libres y se paginan.
+"""
+
+from collections import namedtuple
+
+from availability import availability_index, stay_nights
+from hotel import Hotel
+from indexes import secondary_index
+from reservation import Reservation
+from shards import open_manifest
+
+Match = namedtuple('Match',
+                   ['hotel_id', 'name', 'location', 'rooms', 'free_rooms'])
+
+Page = namedtuple('Page', ['results', 'total', 'page', 'page_size'])
+
+
+def _free_rooms_lookup(hotels, res_file, hotel_file):
+    """
+    Prepara la consulta de habitaciones libres de cada hotel, usando el
+    índice de disponibilidad de la partición que guarda sus reservaciones.
+
+    Args:
+        hotels (RecordTable): Tabla de hoteles.
+        res_file (str): Archivo de reservaciones o manifiesto de particiones.
+        hotel_file (str): Archivo de hoteles.
+
+    Returns:
+        callable: Recibe (hotel, inicio, fin) en ordinales y devuelve
+            las habitaciones libres.
+    """
+    manifest = open_manifest(res_file)
+    if manifest is None:
+        index = availability_index(hotels, Reservation.table(res_file))
+        return lambda hotel, start, end: index.free_nights(
+            hotel.hotel_id, start, end)
+
+    indexes = {}
+
+    def free_rooms(hotel, start, end):
+        shard = manifest.shards.get(manifest.key_for(hotel.hotel_id))
+        if shard is None:
+            return hotel.rooms
+        index = indexes.get(shard)
+        if index is None:
+            index = Reservation.availability(shard, hotel_file)
+            indexes[shard] = index
+        return index.free_nights(hotel.hotel_id, start, end)
+    return free_rooms
+
+
+def search_hotels(hotel_file, res_file, location, check_in, check_out,
+                  min_rooms=1, page=1, page_size=20):
+    """
+    Busca hoteles con habitaciones libres en una ubicación y fechas.
+
+    Args:
+        hotel_file (str): Archivo de hoteles.
+        res_file (str): Archivo de reservaciones o manifiesto de particiones.
+        location (str): Ubicación exacta; None busca en todas.
+        check_in (str): Fecha de llegada (AAAA-MM-DD).
+        check_out (str): Fecha de salida.
+        min_rooms (int, optional): Habitaciones libres requeridas todas las
+            noches.
+        page (int, optional): Número de página, desde 1.
+        page_size (int, optional): Resultados por página.
+
+    Returns:
+        Page: Resultados de la página (Match ordenados por habitaciones
+            libres, de más a menos, y luego por hotel_id) y total de
+            coincidencias.
+
+    Raises:
+        ValueError: Si las fechas son inválidas o la página es menor que 1.
+    """
+    if page < 1 or page_size < 1:
+        raise ValueError("la página y su tamaño deben ser mayores que 0")
+    start, end = stay_nights(check_in, check_out)
+    hotels = Hotel.table(hotel_file)
+    if location is None:
+        candidates = hotels.values()
+    else:
+        index = secondary_index(hotels, 'location')
+        candidates = index.buckets.get(location, {}).values()
+    free_rooms = _free_rooms_lookup(hotels, res_file, hotel_file)
+
+    matches = []
+    for hotel in candidates:
+        free = free_rooms(hotel, start, end)
+        if free >= min_rooms:
+            matches.append((-free, hotel.hotel_id, hotel))
+    matches.sort(key=lambda match: match[:2])
+
+    first = (page - 1) * page_size
+    results = [Match(hotel.hotel_id, hotel.name, hotel.location, hotel.rooms,
+                     -free)
+               for free, _, hotel in matches[first:first + page_size]]
+    return Page(results, len(matches), page, page_size)
@@ -0,0 +1,267 @@
+"""
+Módulo que define el servicio asíncrono de reservaciones.
+
+Las solicitudes de reservación y cancelación se encolan y una sola tarea
+escritora las aplica por lotes sobre las tablas en memoria, confirmando
+cada lote con una sola escritura de los archivos (group commit). El
+servicio puede exponerse por TCP con un protocolo de una línea JSON por
+solicitud.
+
+Uso:
+    python service.py --port 8765
+"""
+
+import argparse
+import asyncio
+import json
+
+from hotel import Hotel
+from customer import Customer
+from reservation import Reservation
+from shards import register_shards, shard_for
+from transaction import Transaction
+from waitlist import waitlist_queue, waitlist_table
+
+BOOK = 'book'
+CANCEL = 'cancel'
+
+
+class BookingService:
+    """
+    Servicio de reservaciones con un único escritor y confirmación por lotes.
+
+    Atributos:
+        res_file (str): Archivo de reservaciones.
+        hotel_file (str): Archivo de hoteles.
+        cust_file (str): Archivo de clientes.
+        max_batch (int): Solicitudes máximas por lote.
+        batches (int): Lotes confirmados.
+        requests (int): Solicitudes atendidas.
+    """
+
+    def __init__(self, res_file, hotel_file, cust_file, max_batch=512):
+        """
+        Inicializa el servicio (sin arrancar la tarea escritora).
+
+        Args:
+            res_file (str): Archivo de reservaciones.
+            hotel_file (str): Archivo de hoteles.
+            cust_file (str): Archivo de clientes.
+            max_batch (int, optional): Solicitudes máximas por lote.
+        """
+        self.res_file = res_file
+        self.hotel_file = hotel_file
+        self.cust_file = cust_file
+        self.max_batch = max_batch
+        self.batches = 0
+        self.requests = 0
+        self._queue = None
+        self._writer = None
+
+    async def start(self):
+        """Arranca la tarea escritora."""
+        self._queue = asyncio.Queue()
+        self._writer = asyncio.create_task(self._write_loop())
+
+    async def stop(self):
+        """Atiende las solicitudes pendientes y detiene la tarea escritora."""
+        await self._queue.join()
+        self._writer.cancel()
+        try:
+            await self._writer
+        except asyncio.CancelledError:
+            pass
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback):
+        await self.stop()
+
+    async def book(self, reservation_obj):
+        """
+        Solicita una reservación.
+
+        Args:
+            reservation_obj (Reservation): Reservación a crear.
+
+        Returns:
+            bool: True si se creó, False en caso de error.
+        """
+        return await self._submit(BOOK, reservation_obj)
+
+    async def cancel(self, reservation_id):
+        """
+        Solicita la cancelación de una reservación.
+
+        Args:
+            reservation_id (str): ID de la reservación.
+
+        Returns:
+            bool: True si se canceló, False si no se encontró.
+        """
+        return await self._submit(CANCEL, reservation_id)
+
+    async def _submit(self, operation, payload):
+        """Encola una solicitud y espera a que su lote se confirme."""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((operation, payload, future))
+        return await future
+
+    async def _write_loop(self):
+        """Toma lotes de la cola y los aplica uno a la vez."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                results = await loop.run_in_executor(None, self._apply, batch)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(err)
+            else:
+                for (_, _, future), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
+            for _ in batch:
+                self._queue.task_done()
+
+    def _apply(self, batch):
+        """
+        Aplica un lote dentro de una sola transacción (un solo candado y
+        una sola escritura por archivo). Con un manifiesto de particiones
+        participan sólo las particiones de los hoteles reservados y las
+        que el índice global de IDs indica para las cancelaciones; el
+        índice, actualizado en orden, mantiene reservation_id único y
+        permite que una cancelación vea las reservaciones creadas antes
+        en el mismo lote.
+
+        Args:
+            batch (list): Lista de tuplas (operacion, contenido, future).
+
+        Returns:
+            list: Resultado (bool) de cada solicitud.
+        """
+        hotels = Hotel.table(self.hotel_file)
+        customers = Customer.table(self.cust_file)
+        shards = [shard_for(self.res_file, payload.hotel_id)
+                  if operation == BOOK
+                  else Reservation.locate(self.res_file, payload)
+                  for operation, payload, _ in batch]
+        tables = {shard: Reservation.table(shard)
+                  for shard in shards if shard is not None}
+        ids = Reservation.id_index(self.res_file)
+        waiting = waitlist_table(self.res_file, create=False)
+        queue = waitlist_queue(waiting) if waiting is not None else None
+        extra = tuple(table for table in (waiting, ids) if table is not None)
+        results = []
+        booked = set()
+        with Transaction(hotels, customers, *tables.values(), *extra):
+            for operation, payload, _ in batch:
+                if operation == BOOK:
+                    shard = shard_for(self.res_file, payload.hotel_id)
+                    if Reservation.locate(self.res_file,
+                                          payload.reservation_id) \
+                            not in (None, shard):
+                        print(f"[Error] La reservación "
+                              f"{payload.reservation_id} ya existe.")
+                        results.append(False)
+                        continue
+                    results.append(Reservation.apply_reservation(
+                        hotels, customers, tables[shard], payload))
+                    if results[-1]:
+                        booked.add(payload.hotel_id)
+                        Reservation.index_ids(ids, tables[shard],
+                                              [payload.reservation_id])
+                    continue
+                shard = Reservation.locate(self.res_file, payload)
+                if shard not in tables:
+                    print("[Aviso] No se encontró la reservación "
+                          f"'{payload}'.")
+                    results.append(False)
+                else:
+                    results.append(Reservation.apply_cancellation(
+                        hotels, tables[shard], payload, queue,
+                        ids) is not None)
+        register_shards(self.res_file, *booked)
+        self.batches += 1
+        self.requests += len(batch)
+        return results
+
+    async def handle_client(self, reader, writer):
+        """
+        Atiende una conexión TCP. Cada línea es un objeto JSON:
+        {"op": "book", "reservation_id": ..., "hotel_id": ...,
+        "customer_id": ..., "check_in": ..., "check_out": ...} o
+        {"op": "cancel", "reservation_id": ...}. Cada respuesta es una línea
+        {"ok": true|false} o {"ok": false, "error": ...}.
+
+        Args:
+            reader (asyncio.StreamReader): Flujo de entrada.
+            writer (asyncio.StreamWriter): Flujo de salida.
+        """
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                    if request["op"] == BOOK:
+                        reservation = Reservation(
+                            request["reservation_id"], request["hotel_id"],
+                            request["customer_id"],
+                            (request["check_in"], request["check_out"]))
+                        response = {"ok": await self.book(reservation)}
+                    elif request["op"] == CANCEL:
+                        cancelled = await self.cancel(
+                            request["reservation_id"])
+                        response = {"ok": cancelled}
+                    else:
+                        response = {"ok": False, "error": "operación "
+                                    f"desconocida: {request['op']}"}
+                except (ValueError, KeyError, TypeError) as err:
+                    response = {"ok": False,
+                                "error": f"solicitud inválida: {err}"}
+                writer.write((json.dumps(response) + "\n").encode('utf-8'))
+                await writer.drain()
+        finally:
+            writer.close()
+
+
+async def serve(service, host='127.0.0.1', port=8765):
+    """
+    Arranca el servicio y lo expone por TCP hasta que se cancele.
+
+    Args:
+        service (BookingService): Servicio a exponer.
+        host (str, optional): Dirección de escucha.
+        port (int, optional): Puerto de escucha.
+    """
+    async with service:
+        server = await asyncio.start_server(service.handle_client, host, port)
+        async with server:
+            print(f"Servicio de reservaciones en {host}:{port}")
+            await server.serve_forever()
+
+
+def main():
+    """Punto de entrada del servicio."""
+    parser = argparse.ArgumentParser(
+        description="Servicio asíncrono de reservaciones")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--hotels", default="data/hotels_data.txt")
+    parser.add_argument("--customers", default="data/customers_data.txt")
+    parser.add_argument("--reservations", default="data/reservations_data.txt")
+    args = parser.parse_args()
+
+    service = BookingService(args.reservations, args.hotels, args.customers)
+    try:
+        asyncio.run(serve(service, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,486 @@
+"""
+Módulo de particionamiento (sharding) de los archivos de datos.
+
+Un manifiesto reemplaza al archivo de reservaciones y reparte los
+registros en archivos más pequeños, uno por hotel o uno por cubeta de
+hash del hotel_id. Una reservación en H001 sólo reescribe su partición, y
+las particiones pueden procesarse en paralelo.
+
+Formato del manifiesto:
+    shards|<esquema>|<cubetas>
+    <clave>|<archivo de la partición>
+    ...
+
+Junto al manifiesto, el índice global de IDs (<manifiesto>.ids, en modo
+registro) guarda la partición de cada reservación, para comprobar que un
+ID es único y encontrar una reservación sin cargar todas las particiones:
+    <reservation_id>|<archivo de la partición>
+    ...
+
+Uso:
+    python shards.py split hash 16 data/reservations_data.txt
+        data/reservations.shards
+    python shards.py join data/reservations.shards data/reservations_data.txt
+"""
+
+import argparse
+import os
+import zlib
+from operator import attrgetter
+
+from journal import journal_path
+from storage import file_signature, intern_text, open_table
+from transaction import atomic_write, file_lock, lock_path
+
+HEADER = 'shards'
+HASH = 'hash'
+HOTEL = 'hotel'
+
+HOTEL_FIELD = 1
+
+
+def is_manifest(filename):
+    """
+    Indica si un archivo es un manifiesto de particiones.
+
+    Args:
+        filename (str): Ruta del archivo.
+
+    Returns:
+        bool: True si la primera línea es el encabezado del manifiesto.
+    """
+    try:
+        with open(filename, 'r', encoding='utf-8') as file:
+            return file.readline().startswith(f"{HEADER}|")
+    except (FileNotFoundError, UnicodeDecodeError):
+        return False
+
+
+class ShardManifest:
+    """
+    Manifiesto de un conjunto de particiones.
+
+    Atributos:
+        filename (str): Ruta del manifiesto.
+        scheme (str): HASH (cubetas fijas) o HOTEL (una partición por hotel).
+        buckets (int): Número de cubetas del esquema HASH.
+        shards (dict): Archivo de cada partición por clave.
+    """
+
+    def __init__(self, filename):
+        """
+        Lee un manifiesto existente.
+
+        Args:
+            filename (str): Ruta del manifiesto.
+
+        Raises:
+            ValueError: Si el archivo no es un manifiesto válido.
+        """
+        self.filename = os.path.abspath(filename)
+        self.scheme = None
+        self.buckets = 0
+        self.shards = {}
+        self._read()
+
+    def _read(self):
+        """Lee el manifiesto del disco."""
+        with open(self.filename, 'r', encoding='utf-8') as file:
+            header, scheme, buckets = file.readline().strip().split('|')
+            if header != HEADER or scheme not in (HASH, HOTEL):
+                raise ValueError(
+                    f"{self.filename} no es un manifiesto de particiones")
+            self.scheme = scheme
+            self.buckets = int(buckets)
+            directory = os.path.dirname(self.filename)
+            for line in file:
+                key, sep, name = line.strip().partition('|')
+                if sep:
+                    self.shards[key] = os.path.join(directory, name)
+
+    def register(self, *keys):
+        """
+        Agrega particiones al manifiesto bajo el candado del directorio,
+        conservando las que otro proceso haya registrado.
+
+        Args:
+            *keys (str): Claves de las particiones nuevas.
+        """
+        with file_lock(lock_path(self.filename)):
+            self._read()
+            for key in keys:
+                self.shards.setdefault(key, self.path_for(key))
+            lines = [f"{HEADER}|{self.scheme}|{self.buckets}"]
+            lines.extend(f"{key}|{os.path.basename(path)}"
+                         for key, path in self.shards.items())
+            atomic_write(self.filename, lines)
+
+    def key_for(self, hotel_id):
+        """
+        Obtiene la clave de partición de un hotel.
+
+        Args:
+            hotel_id (str): ID del hotel.
+
+        Returns:
+            str: Número de cubeta (HASH) o el propio hotel_id (HOTEL).
+        """
+        if self.scheme == HOTEL:
+            return hotel_id
+        return f"{zlib.crc32(hotel_id.encode('utf-8')) % self.buckets:04d}"
+
+    def path_for(self, key):
+        """
+        Obtiene la ruta que corresponde a una clave de partición.
+
+        Args:
+            key (str): Clave de la partición.
+
+        Returns:
+            str: Ruta registrada, o la que tendría al registrarse.
+        """
+        if key in self.shards:
+            return self.shards[key]
+        directory, name = os.path.split(self.filename)
+        return os.path.join(directory,
+                            f"{os.path.splitext(name)[0]}.{key}.txt")
+
+    def shard_for(self, hotel_id):
+        """
+        Obtiene el archivo de la partición de un hotel, sin modificar el
+        manifiesto. En el esquema HOTEL, la partición de un hotel nuevo
+        se registra con register() después de confirmar su primera
+        reservación.
+
+        Args:
+            hotel_id (str): ID del hotel.
+
+        Returns:
+            str: Ruta de la partición.
+        """
+        return self.path_for(self.key_for(hotel_id))
+
+    def locate(self, entry):
+        """
+        Obtiene la partición de una entrada del índice global de IDs.
+
+        Args:
+            entry (ShardEntry): Entrada del índice, o None.
+
+        Returns:
+            str: Ruta de la partición, o None si entry es None.
+        """
+        if entry is None:
+            return None
+        return os.path.join(os.path.dirname(self.filename), entry.shard)
+
+    def files(self):
+        """
+        Obtiene los archivos de todas las particiones.
+
+        Returns:
+            list: Rutas de las particiones, en orden de clave.
+        """
+        return [self.shards[key] for key in sorted(self.shards)]
+
+
+def create_manifest(filename, scheme=HASH, buckets=16):
+    """
+    Crea un manifiesto vacío, con su índice global de IDs vacío. En el
+    esquema HASH se registran de una vez todas las cubetas.
+
+    Args:
+        filename (str): Ruta del manifiesto.
+        scheme (str, optional): HASH o HOTEL.
+        buckets (int, optional): Número de cubetas del esquema HASH.
+
+    Returns:
+        ShardManifest: El manifiesto creado.
+    """
+    count = buckets if scheme == HASH else 0
+    if os.path.exists(journal_path(ids_path(filename))):
+        os.remove(journal_path(ids_path(filename)))
+    atomic_write(ids_path(filename), [])
+    atomic_write(filename, [f"{HEADER}|{scheme}|{count}"])
+    manifest = ShardManifest(filename)
+    if scheme == HASH:
+        manifest.register(*(f"{bucket:04d}" for bucket in range(buckets)))
+    return manifest
+
+
+_MANIFESTS = {}
+
+
+def open_manifest(filename):
+    """
+    Obtiene el manifiesto de un archivo, releyéndolo sólo si cambió.
+
+    Args:
+        filename (str): Ruta del manifiesto.
+
+    Returns:
+        ShardManifest: El manifiesto, o None si el archivo no es un manifiesto.
+    """
+    path = os.path.abspath(filename)
+    signature = file_signature(path)
+    if signature is None:
+        return None
+    cached = _MANIFESTS.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    manifest = ShardManifest(path) if is_manifest(path) else None
+    _MANIFESTS[path] = (signature, manifest)
+    return manifest
+
+
+def ids_path(filename):
+    """
+    Obtiene la ruta del índice global de IDs de un manifiesto.
+
+    Args:
+        filename (str): Ruta del manifiesto.
+
+    Returns:
+        str: Ruta del archivo .ids.
+    """
+    return f"{filename}.ids"
+
+
+class ShardEntry:
+    """
+    Entrada del índice global de IDs.
+
+    Atributos:
+        reservation_id (str): ID de la reservación.
+        shard (str): Archivo de la partición que la guarda, relativo al
+            directorio del manifiesto.
+    """
+
+    __slots__ = ('reservation_id', 'shard')
+
+    def __init__(self, reservation_id, shard):
+        """
+        Inicializa una entrada.
+
+        Args:
+            reservation_id (str): ID de la reservación.
+            shard (str): Archivo de la partición.
+        """
+        self.reservation_id = reservation_id
+        self.shard = intern_text(shard)
+
+    def to_line(self):
+        """
+        Convierte la entrada a una línea del índice.
+
+        Returns:
+            str: Línea con formato reservation_id|archivo
+        """
+        return f"{self.reservation_id}|{self.shard}"
+
+    @staticmethod
+    def from_line(line):
+        """
+        Crea una entrada a partir de una línea del índice.
+
+        Args:
+            line (str): Línea sin salto de línea.
+
+        Returns:
+            ShardEntry: Objeto ShardEntry.
+
+        Raises:
+            ValueError: Si la línea no tiene el formato esperado.
+        """
+        reservation_id, shard = line.split('|')
+        return ShardEntry(reservation_id, shard)
+
+
+def open_id_index(manifest, scan):
+    """
+    Obtiene la tabla del índice global de IDs de un manifiesto. Si el
+    manifiesto es anterior al índice, lo construye una vez recorriendo
+    las particiones. ShardManifest.locate() traduce una entrada a la
+    ruta de su partición.
+
+    Args:
+        manifest (ShardManifest): Manifiesto de particiones.
+        scan (callable): Recibe la ruta de una partición y devuelve los
+            IDs que guarda.
+
+    Returns:
+        RecordTable: Tabla de objetos ShardEntry indexada por
+            reservation_id.
+    """
+    path = ids_path(manifest.filename)
+    if not os.path.exists(path):
+        with file_lock(lock_path(path)):
+            if not os.path.exists(path):
+                entries = [ShardEntry(reservation_id, os.path.basename(shard))
+                           for shard in manifest.files()
+                           for reservation_id in scan(shard)]
+                atomic_write(path, [entry.to_line() for entry in entries])
+    table = open_table(path, ShardEntry.from_line,
+                       attrgetter('reservation_id'))
+    if table.journal is None:
+        table.enable_journal()
+    return table
+
+
+def shard_files(filename):
+    """
+    Obtiene los archivos de datos detrás de un nombre de archivo.
+
+    Args:
+        filename (str): Archivo de datos o manifiesto.
+
+    Returns:
+        list: Las particiones del manifiesto, o [filename] si no lo es.
+    """
+    manifest = open_manifest(filename)
+    return [filename] if manifest is None else manifest.files()
+
+
+def shard_for(filename, hotel_id):
+    """
+    Obtiene el archivo que guarda los registros de un hotel.
+
+    Args:
+        filename (str): Archivo de datos o manifiesto.
+        hotel_id (str): ID del hotel.
+
+    Returns:
+        str: La partición del hotel, o filename si no es un manifiesto.
+    """
+    manifest = open_manifest(filename)
+    return filename if manifest is None else manifest.shard_for(hotel_id)
+
+
+def register_shards(filename, *hotel_ids):
+    """
+    Registra en el manifiesto las particiones de los hoteles que aún no
+    la tienen (esquema HOTEL). Se llama después de confirmar los
+    registros, para que una operación fallida no deje particiones.
+
+    Args:
+        filename (str): Archivo de datos o manifiesto.
+        *hotel_ids (str): IDs de los hoteles.
+    """
+    manifest = open_manifest(filename)
+    if manifest is None:
+        return
+    keys = {manifest.key_for(hotel_id) for hotel_id in hotel_ids}
+    missing = sorted(keys - set(manifest.shards))
+    if missing:
+        manifest.register(*missing)
+
+
+def map_shards(filename, func, workers=None):
+    """
+    Aplica una función a cada partición en procesos paralelos.
+
+    Args:
+        filename (str): Archivo de datos o manifiesto.
+        func (callable): Función de nivel de módulo que recibe la ruta
+            de una partición (debe poder serializarse con pickle).
+        workers (int, optional): Procesos; por omisión uno por CPU.
+
+    Returns:
+        list: Resultado de cada partición, en el orden de shard_files().
+    """
+    files = shard_files(filename)
+    if len(files) == 1:
+        return [func(files[0])]
+    # pylint: disable-next=import-outside-toplevel
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(func, files))
+
+
+def split_file(source, manifest_file, scheme=HASH, buckets=16):
+    """
+    Reparte un archivo de reservaciones en particiones por hotel_id.
+
+    Args:
+        source (str): Archivo de texto origen.
+        manifest_file (str): Manifiesto a crear.
+        scheme (str, optional): HASH o HOTEL.
+        buckets (int, optional): Número de cubetas del esquema HASH.
+
+    Returns:
+        ShardManifest: El manifiesto creado.
+    """
+    manifest = create_manifest(manifest_file, scheme, buckets)
+    lines = {}
+    with open(source, 'r', encoding='utf-8') as file:
+        for line in file:
+            line = line.strip()
+            if not line:
+                continue
+            fields = line.split('|')
+            if len(fields) <= HOTEL_FIELD:
+                print(f"[Error] Datos inválidos en línea: '{line}'.")
+                continue
+            key = manifest.key_for(fields[HOTEL_FIELD])
+            lines.setdefault(key, []).append(line)
+    missing = sorted(set(lines) - set(manifest.shards))
+    if missing:
+        manifest.register(*missing)
+    for key, path in manifest.shards.items():
+        atomic_write(path, lines.get(key, []))
+    atomic_write(ids_path(manifest.filename), [
+        ShardEntry(line.split('|', 1)[0],
+                   os.path.basename(manifest.path_for(key))).to_line()
+        for key, group in lines.items() for line in group])
+    return manifest
+
+
+def join_file(manifest_file, target):
+    """
+    Une las particiones de un manifiesto en un solo archivo de texto.
+
+    Args:
+        manifest_file (str): Manifiesto origen.
+        target (str): Archivo de texto destino.
+
+    Returns:
+        int: Registros escritos.
+    """
+    count = 0
+    with open(target, 'w', encoding='utf-8') as out:
+        for path in ShardManifest(manifest_file).files():
+            if not os.path.exists(path):
+                continue
+            with open(path, 'r', encoding='utf-8') as file:
+                for line in file:
+                    if line.strip():
+                        out.write(line)
+                        count += 1
+    return count
+
+
+def main():
+    """Punto de entrada de las herramientas de particionamiento."""
+    parser = argparse.ArgumentParser(
+        description="Particiona archivos de reservaciones")
+    commands = parser.add_subparsers(dest="command", required=True)
+    split = commands.add_parser("split", help="archivo de texto a particiones")
+    split.add_argument("scheme", choices=[HASH, HOTEL])
+    split.add_argument("buckets", type=int)
+    split.add_argument("source")
+    split.add_argument("manifest")
+    join = commands.add_parser("join", help="particiones a archivo de texto")
+    join.add_argument("manifest")
+    join.add_argument("target")
+    args = parser.parse_args()
+
+    if args.command == "split":
+        manifest = split_file(args.source, args.manifest, args.scheme,
+                              args.buckets)
+        print(f"{len(manifest.shards)} particiones creadas.")
+    else:
+        print(f"{join_file(args.manifest, args.target)} registros unidos.")
+
+
+if __name__ == "__main__":
+    main()
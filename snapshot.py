@@ -0,0 +1,323 @@
+"""
+Módulo del formato binario columnar de instantáneas.
+
+Una instantánea guarda cada columna como un arreglo de enteros de 32 bits
+de ancho fijo: las columnas numéricas guardan el valor (con signo) y las
+de texto un índice a una tabla de cadenas sin repetidos. El archivo se
+abre con mmap y los campos se leen directamente del mapa de memoria, sin
+copiar ni separar líneas.
+
+Estructura:
+    encabezado | columna 0 | ... | columna n-1 | desplazamientos | cadenas
+
+Cada cadena termina en un byte nulo, lo que permite decodificar la tabla
+completa con una sola llamada; por eso las cadenas no pueden contenerlo.
+
+Uso:
+    python snapshot.py to-bin hotel data/hotels_data.txt data/hotels_data.bin
+    python snapshot.py to-text data/hotels_data.bin data/hotels_data.txt
+"""
+
+import argparse
+import mmap
+import os
+import struct
+from array import array
+
+MAGIC = b'HRSNAP1\0'
+HEADER = struct.Struct('<8sB3xII16s')
+SEPARATOR = b'\0'
+
+INT = 'i'
+STR = 's'
+
+TYPECODES = {INT: 'i', STR: 'I'}
+
+SCHEMAS = {
+    'hotel': STR * 3 + INT * 2,
+    'customer': STR * 4,
+    'reservation': STR * 5,
+}
+
+
+def is_snapshot(filename):
+    """
+    Indica si un archivo es una instantánea binaria.
+
+    Args:
+        filename (str): Ruta del archivo.
+
+    Returns:
+        bool: True si el archivo empieza con la firma del formato.
+    """
+    try:
+        with open(filename, 'rb') as file:
+            return file.read(len(MAGIC)) == MAGIC
+    except FileNotFoundError:
+        return False
+
+
+def write_snapshot(filename, types, rows):
+    """
+    Escribe una instantánea binaria.
+
+    Args:
+        filename (str): Ruta destino.
+        types (str): Tipo de cada columna (INT o STR).
+        rows (iterable): Filas, cada una una secuencia de campos.
+
+    Raises:
+        ValueError: Si una fila no tiene un campo por columna, un número
+            no cabe en 32 bits con signo o una cadena contiene un byte nulo.
+    """
+    columns = [array(TYPECODES[kind]) for kind in types]
+    strings = {}
+    for row in rows:
+        if len(row) != len(types):
+            raise ValueError(f"se esperaban {len(types)} campos: {row}")
+        for column, kind, value in zip(columns, types, row):
+            if kind == INT:
+                try:
+                    column.append(int(value))
+                except OverflowError as err:
+                    raise ValueError(
+                        f"{value} no cabe en 32 bits con signo") from err
+            elif SEPARATOR.decode('ascii') in value:
+                raise ValueError(f"cadena con byte nulo: {value!r}")
+            else:
+                column.append(strings.setdefault(value, len(strings)))
+
+    blobs = [s.encode('utf-8') + SEPARATOR for s in strings]
+    offsets = array('I', [0])
+    for blob in blobs:
+        offsets.append(offsets[-1] + len(blob))
+
+    count = len(columns[0]) if columns else 0
+    with open(filename, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, len(types), count, len(blobs),
+                               types.encode('ascii').ljust(16, b'\0')))
+        for column in columns:
+            column.tofile(file)
+        offsets.tofile(file)
+        file.write(b''.join(blobs))
+        file.flush()
+        os.fsync(file.fileno())
+
+
+class SnapshotView:
+    """
+    Acceso sin copia a una instantánea binaria abierta con mmap.
+
+    Atributos:
+        types (str): Tipo de cada columna.
+        count (int): Número de filas.
+    """
+
+    def __init__(self, filename):
+        """
+        Abre la instantánea.
+
+        Args:
+            filename (str): Ruta del archivo.
+
+        Raises:
+            ValueError: Si el archivo no es una instantánea válida o está
+                truncado.
+        """
+        if os.path.getsize(filename) < HEADER.size:
+            raise ValueError(f"{filename} no es una instantánea binaria")
+        with open(filename, 'rb') as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        header = HEADER.unpack_from(self._map)
+        magic, ncols, self.count, nstrings, types = header
+        self.types = types[:ncols].decode('ascii', 'replace')
+        if magic != MAGIC or any(kind not in TYPECODES
+                                 for kind in self.types):
+            self._map.close()
+            raise ValueError(f"{filename} no es una instantánea binaria")
+        if len(self._map) < HEADER.size + 4 * (ncols * self.count
+                                               + nstrings + 1):
+            self._map.close()
+            raise ValueError(f"la instantánea {filename} está truncada")
+        self._buffer = memoryview(self._map)
+        offset = HEADER.size
+        self._columns = []
+        for kind in self.types:
+            end = offset + 4 * self.count
+            self._columns.append(
+                self._buffer[offset:end].cast(TYPECODES[kind]))
+            offset = end
+        end = offset + 4 * (nstrings + 1)
+        self._offsets = self._buffer[offset:end].cast('I')
+        self._blob = end
+        if self._blob + self._offsets[-1] > len(self._map):
+            self.close()
+            raise ValueError(f"la instantánea {filename} está truncada")
+
+    def __len__(self):
+        return self.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+    def close(self):
+        """Libera el mapa de memoria."""
+        for column in self._columns:
+            column.release()
+        self._offsets.release()
+        self._buffer.release()
+        self._map.close()
+
+    def string(self, index):
+        """
+        Obtiene una cadena de la tabla de cadenas.
+
+        Args:
+            index (int): Índice de la cadena.
+
+        Returns:
+            str: La cadena decodificada.
+        """
+        start = self._blob + self._offsets[index]
+        end = self._blob + self._offsets[index + 1] - len(SEPARATOR)
+        return str(self._buffer[start:end], 'utf-8')
+
+    def column(self, position):
+        """
+        Obtiene una columna sin copiarla.
+
+        Args:
+            position (int): Posición de la columna.
+
+        Returns:
+            memoryview: Valores (o índices de cadena) de la columna.
+        """
+        return self._columns[position]
+
+    def field(self, row, position):
+        """
+        Lee un campo de una fila.
+
+        Args:
+            row (int): Número de fila.
+            position (int): Posición de la columna.
+
+        Returns:
+            object: int para columnas numéricas, str para las de texto.
+        """
+        value = self._columns[position][row]
+        return value if self.types[position] == INT else self.string(value)
+
+    def row(self, row):
+        """
+        Lee todos los campos de una fila.
+
+        Args:
+            row (int): Número de fila.
+
+        Returns:
+            list: Campos de la fila.
+        """
+        return [self.field(row, position)
+                for position in range(len(self.types))]
+
+    def strings(self):
+        """
+        Decodifica la tabla de cadenas completa.
+
+        Returns:
+            list: Cadenas en el orden de sus índices.
+        """
+        if len(self._offsets) == 1:
+            return []
+        end = self._blob + self._offsets[-1] - len(SEPARATOR)
+        blob = self._buffer[self._blob:end]
+        return str(blob, 'utf-8').split(SEPARATOR.decode('ascii'))
+
+    def rows(self):
+        """
+        Itera las filas. La tabla de cadenas se decodifica una sola vez y
+        cada columna se convierte completa antes de armar las filas.
+
+        Yields:
+            tuple: Campos de cada fila.
+        """
+        strings = self.strings()
+        columns = [column if kind == INT else map(strings.__getitem__, column)
+                   for column, kind in zip(self._columns, self.types)]
+        yield from zip(*columns)
+
+
+def text_to_snapshot(text_file, snapshot_file, kind):
+    """
+    Convierte un archivo delimitado por '|' a instantánea binaria.
+
+    Args:
+        text_file (str): Archivo de texto origen.
+        snapshot_file (str): Instantánea destino.
+        kind (str): 'hotel', 'customer' o 'reservation'.
+
+    Returns:
+        int: Filas convertidas.
+    """
+    types = SCHEMAS[kind]
+    rows = []
+    with open(text_file, 'r', encoding='utf-8') as file:
+        for line in file:
+            line = line.strip()
+            if not line:
+                continue
+            fields = line.split('|')
+            if len(fields) != len(types):
+                print(f"[Error] Datos inválidos en línea: '{line}'.")
+                continue
+            rows.append(fields)
+    write_snapshot(snapshot_file, types, rows)
+    return len(rows)
+
+
+def snapshot_to_text(snapshot_file, text_file):
+    """
+    Convierte una instantánea binaria al formato delimitado por '|'.
+
+    Args:
+        snapshot_file (str): Instantánea origen.
+        text_file (str): Archivo de texto destino.
+
+    Returns:
+        int: Filas convertidas.
+    """
+    with SnapshotView(snapshot_file) as view, \
+            open(text_file, 'w', encoding='utf-8') as file:
+        for fields in view.rows():
+            file.write('|'.join(str(f) for f in fields) + '\n')
+        return len(view)
+
+
+def main():
+    """Punto de entrada de los convertidores."""
+    parser = argparse.ArgumentParser(
+        description="Convierte entre texto e instantáneas")
+    commands = parser.add_subparsers(dest="command", required=True)
+    to_bin = commands.add_parser("to-bin", help="texto a instantánea binaria")
+    to_bin.add_argument("kind", choices=sorted(SCHEMAS))
+    to_bin.add_argument("source")
+    to_bin.add_argument("target")
+    to_text = commands.add_parser("to-text",
+                                  help="instantánea binaria a texto")
+    to_text.add_argument("source")
+    to_text.add_argument("target")
+    args = parser.parse_args()
+
+    if args.command == "to-bin":
+        count = text_to_snapshot(args.source, args.target, args.kind)
+    else:
+        count = snapshot_to_text(args.source, args.target)
+    print(f"{count} registros convertidos.")
+
+
+if __name__ == "__main__":
+    main()
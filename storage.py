@@ -0,0 +1,965 @@
+"""
+Módulo de almacenamiento en memoria para los archivos de datos.
+
+Cada archivo delimitado por '|' se carga una sola vez en una RecordTable,
+que mantiene un índice (dict) por ID y escribe los cambios al disco de
+forma explícita o según una política de vaciado (flush). En modo
+registro (journal) cada cambio se anexa a un archivo .log y el archivo
+de datos solo se reescribe al compactar.
+"""
+
+import copy
+import importlib
+import os
+import sys
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import metrics
+from journal import (Journal, journal_path, operation_line, INSERT, UPDATE,
+                     DELETE)
+from loader import load_file
+from snapshot import SnapshotView, is_snapshot, write_snapshot
+from transaction import atomic_write
+
+TEXT = 'text'
+SQLITE = 'sqlite'
+
+BACKEND = os.environ.get('RESERVATIONS_BACKEND', '') or TEXT
+
+SQLITE_MAGIC = b'SQLite format 3\0'
+
+# Clase de tabla de cada formato que no es de texto, como 'modulo.Clase'
+# mientras no se haya usado: se importa al abrir la primera tabla de ese
+# formato, para no cargar sqlite3 (database.py) con archivos de texto y
+# para que este módulo no dependa de los formatos (ver register_backend).
+_BACKENDS = {SQLITE: 'database.SQLiteTable'}
+
+
+def intern_text(value):
+    """
+    Comparte una sola copia en memoria de los textos repetidos (IDs,
+    ubicaciones) entre todos los registros.
+
+    Args:
+        value (object): Valor a compartir.
+
+    Returns:
+        object: El texto internado, o el valor sin cambios si no es str.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def file_signature(filename):
+    """
+    Obtiene la firma (inodo, tamaño, mtime) de un archivo.
+
+    Args:
+        filename (str): Ruta del archivo.
+
+    Returns:
+        tuple: Firma del archivo, o None si no existe.
+    """
+    try:
+        stat = os.stat(filename)
+    except FileNotFoundError:
+        return None
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+def generation_path(filename):
+    """
+    Obtiene la ruta del contador de generación de un archivo de datos.
+
+    Args:
+        filename (str): Ruta del archivo de datos.
+
+    Returns:
+        str: Ruta del archivo .gen.
+    """
+    return f"{filename}.gen"
+
+
+def read_generation(filename):
+    """
+    Lee el contador de generación de un archivo de datos. Cada escritura
+    lo incrementa, por lo que detecta cambios que la firma no ve (misma
+    marca de tiempo, mismo tamaño e inodo reutilizado).
+
+    Args:
+        filename (str): Ruta del archivo de datos.
+
+    Returns:
+        int: Generación actual, 0 si nunca se escribió, o -1 si el
+            contador está dañado.
+    """
+    try:
+        fd = os.open(generation_path(filename), os.O_RDONLY)
+    except FileNotFoundError:
+        return 0
+    try:
+        return int(os.read(fd, 32) or -1)
+    except ValueError:
+        return -1
+    finally:
+        os.close(fd)
+
+
+def bump_generation(filename):
+    """
+    Incrementa el contador de generación de un archivo de datos. Se
+    llama después de cada escritura, normalmente bajo el candado. El
+    contador se reemplaza de forma atómica, por lo que una falla nunca
+    lo deja a medio escribir.
+
+    Args:
+        filename (str): Ruta del archivo de datos.
+    """
+    generation = max(read_generation(filename), 0) + 1
+    atomic_write(generation_path(filename), [str(generation)])
+
+
+class RecordTable:
+    """
+    Tabla en memoria de registros indexados por ID.
+
+    Atributos:
+        filename (str): Ruta del archivo de datos.
+        flush_every (int): Número de cambios pendientes que disparan
+            una escritura automática. 1 escribe tras cada cambio;
+            0 o None solo escribe al llamar flush().
+        journal (Journal): Registro de cambios, o None si el modo
+            registro está desactivado.
+        compact_every (int): Operaciones en el registro que disparan
+            una compactación.
+        listeners (list): Objetos notificados de cada cambio mediante
+            on_insert(registro), on_delete(registro) y on_reset(registros),
+            y opcionalmente de cada escritura al disco con on_commit().
+        snapshot_types (str): Tipos de columna si el archivo es una
+            instantánea binaria (snapshot.py), o None si es de texto.
+        workers (int): Procesos para cargar archivos de texto grandes
+            (loader.py), o None para cargar en este proceso.
+        load_report (LoadReport): Reporte de la última carga de texto.
+        pinned (bool): Si es True la tabla nunca se descarta del caché.
+        closed (bool): True si la tabla ya se descartó del caché.
+        subscriptions (list): Grupos de observadores (Subscription) que
+            mantienen índices derivados de esta y otras tablas.
+    """
+
+    def __init__(self, filename, parse, key, flush_every=1, from_fields=None,
+                 workers=None):
+        """
+        Inicializa la tabla y carga el archivo.
+
+        Args:
+            filename (str): Ruta del archivo.
+            parse (callable): Convierte una línea en un registro;
+                lanza ValueError si la línea es inválida.
+            key (callable): Obtiene el ID de un registro.
+            flush_every (int, optional): Política de escritura.
+            from_fields (callable, optional): Crea un registro a partir
+                de sus campos ya separados (instantáneas binarias).
+            workers (int, optional): Procesos para la carga en paralelo.
+        """
+        self.filename = filename
+        self.parse = parse
+        self.key = key
+        self.from_fields = from_fields
+        self.snapshot_types = None
+        self.workers = workers
+        self.load_report = None
+        self.pinned = False
+        self.closed = False
+        self.subscriptions = []
+        self.flush_every = flush_every
+        self._records = {}
+        self._pending = 0
+        self._batch_depth = 0
+        self._journal_buffer = []
+        self._signature = None
+        self.journal = None
+        self.compact_every = 1000
+        self.listeners = []
+        if os.path.exists(journal_path(filename)):
+            self.journal = Journal(journal_path(filename))
+        self.reload()
+
+    def __len__(self):
+        return len(self._records)
+
+    def __contains__(self, record_id):
+        return record_id in self._records
+
+    @property
+    def held(self):
+        """bool: True dentro de hold()/release() (lote o transacción)."""
+        return self._batch_depth > 0
+
+    @property
+    def dirty(self):
+        """bool: True si hay cambios sin escribir."""
+        return self._pending > 0 or bool(self._journal_buffer)
+
+    @property
+    def rewrite_pending(self):
+        """bool: True si los cambios piden reescribir el archivo completo."""
+        return self._pending > 0
+
+    def reload(self):
+        """Descarta el estado en memoria y vuelve a leer el archivo."""
+        start = time.perf_counter()
+        records = {}
+        self._load(records)
+        if self.journal is not None:
+            self._replay(records)
+        self._records = records
+        self._pending = 0
+        self._journal_buffer = []
+        self._signature = self._current_signature()
+        self._notify_reset()
+        if metrics.ENABLED:
+            name = os.path.basename(self.filename)
+            metrics.observe('load_seconds', time.perf_counter() - start,
+                            file=name)
+            metrics.increment('records_parsed_total', len(records), file=name)
+            signature = file_signature(self.filename)
+            if signature is not None:
+                metrics.increment('bytes_read_total', signature[1], file=name)
+
+    def _load(self, records):
+        """
+        Lee los registros del archivo de texto o instantánea binaria.
+
+        Args:
+            records (dict): Registros indexados por ID.
+        """
+        self.snapshot_types = None
+        if is_snapshot(self.filename):
+            self._load_snapshot(records)
+        elif file_signature(self.filename) is not None:
+            parsed, self.load_report = load_file(self.filename, self.parse,
+                                                 self.workers)
+            if not self.load_report.ok:
+                print(self.load_report.summary())
+            for record in parsed:
+                records[self.key(record)] = record
+
+    def from_row(self, fields):
+        """
+        Crea un registro a partir de sus campos ya separados.
+
+        Args:
+            fields (sequence): Campos en el orden del archivo de datos.
+
+        Returns:
+            object: Registro nuevo.
+        """
+        if self.from_fields is not None:
+            return self.from_fields(fields)
+        return self.parse('|'.join(str(f) for f in fields))
+
+    def _load_snapshot(self, records):
+        """
+        Carga los registros de una instantánea binaria abierta con mmap.
+
+        Args:
+            records (dict): Registros indexados por ID.
+        """
+        with SnapshotView(self.filename) as view:
+            self.snapshot_types = view.types
+            for fields in view.rows():
+                record = self.from_row(fields)
+                records[self.key(record)] = record
+
+    def write_file(self, path):
+        """
+        Escribe el contenido completo de la tabla en path, en el mismo
+        formato (texto o instantánea binaria) del archivo original.
+
+        Args:
+            path (str): Ruta destino.
+        """
+        if self.snapshot_types is not None:
+            rows = (r.to_line().split('|') for r in self._records.values())
+            write_snapshot(path, self.snapshot_types, rows)
+        else:
+            with open(path, 'w', encoding='utf-8') as file:
+                file.writelines(f"{r.to_line()}\n"
+                                for r in self._records.values())
+                file.flush()
+                os.fsync(file.fileno())
+        if metrics.ENABLED:
+            metrics.increment('bytes_written_total', os.path.getsize(path),
+                              file=os.path.basename(self.filename))
+
+    def _replay(self, records):
+        """
+        Aplica las operaciones del registro sobre los registros leídos.
+        Las operaciones son idempotentes, por lo que repetir un registro
+        ya compactado no altera el resultado.
+
+        Args:
+            records (dict): Registros indexados por ID.
+        """
+        for operation, payload in self.journal.read():
+            if operation == DELETE:
+                records.pop(payload, None)
+                continue
+            try:
+                record = self.parse(payload)
+            except ValueError as err:
+                print(f"[Error] Datos inválidos en registro: '{payload}'. "
+                      f"Error: {err}")
+                continue
+            records[self.key(record)] = record
+
+    def _current_signature(self):
+        """
+        Obtiene la firma del archivo de datos y, si existe, del registro.
+
+        Returns:
+            tuple: Firma combinada.
+        """
+        if self.journal is None:
+            return (file_signature(self.filename),
+                    read_generation(self.filename))
+        return (file_signature(self.filename),
+                file_signature(self.journal.path),
+                read_generation(self.filename))
+
+    def refresh(self):
+        """
+        Recarga el archivo si cambió en disco desde la última lectura
+        o escritura. Los cambios pendientes no se descartan.
+
+        Returns:
+            bool: True si se recargó, False en caso contrario.
+        """
+        if self.dirty:
+            return False
+        if self.journal is None:
+            path = journal_path(self.filename)
+            if os.path.exists(path):
+                self.journal = Journal(path)
+        if self._current_signature() == self._signature:
+            return False
+        self.reload()
+        return True
+
+    def get(self, record_id):
+        """
+        Busca un registro por su ID en O(1).
+
+        Args:
+            record_id (str): ID del registro.
+
+        Returns:
+            object: El registro almacenado, o None si no existe.
+        """
+        return self._records.get(record_id)
+
+    def values(self):
+        """
+        Itera los registros en el orden del archivo.
+
+        Returns:
+            iterator: Registros almacenados.
+        """
+        return iter(self._records.values())
+
+    def snapshot(self):
+        """
+        Obtiene copias de todos los registros, que el llamador
+        puede modificar sin alterar la tabla.
+
+        Returns:
+            list: Lista de copias de los registros.
+        """
+        return [copy.copy(r) for r in self._records.values()]
+
+    def insert(self, record):
+        """
+        Agrega un registro nuevo (se guarda una copia).
+
+        Args:
+            record (object): Registro a agregar.
+
+        Returns:
+            bool: True si se agregó, False si el ID ya existe.
+        """
+        record_id = self.key(record)
+        if record_id in self._records:
+            return False
+        stored = copy.copy(record)
+        self._records[record_id] = stored
+        for listener in self.listeners:
+            listener.on_insert(stored)
+        self._mark_dirty(INSERT, record.to_line())
+        return True
+
+    def update(self, record):
+        """
+        Reemplaza un registro existente (se guarda una copia).
+
+        Args:
+            record (object): Registro con los datos nuevos.
+
+        Returns:
+            bool: True si se reemplazó, False si el ID no existe.
+        """
+        record_id = self.key(record)
+        if record_id not in self._records:
+            return False
+        stored = copy.copy(record)
+        previous = self._records[record_id]
+        self._records[record_id] = stored
+        for listener in self.listeners:
+            listener.on_delete(previous)
+            listener.on_insert(stored)
+        self._mark_dirty(UPDATE, record.to_line())
+        return True
+
+    def delete(self, record_id):
+        """
+        Elimina un registro por su ID.
+
+        Args:
+            record_id (str): ID del registro.
+
+        Returns:
+            object: El registro eliminado, o None si no existía.
+        """
+        record = self._records.pop(record_id, None)
+        if record is not None:
+            for listener in self.listeners:
+                listener.on_delete(record)
+            self._mark_dirty(DELETE, record_id)
+        return record
+
+    def replace(self, records):
+        """
+        Reemplaza todo el contenido de la tabla (se guardan copias). En
+        modo registro la tabla se compacta; dentro de hold() (lote o
+        transacción) la compactación se hace al confirmar.
+
+        Args:
+            records (iterable): Registros nuevos.
+        """
+        self._records = {self.key(r): copy.copy(r) for r in records}
+        self._notify_reset()
+        self._journal_buffer = []
+        if self.journal is not None and not self.held:
+            self.compact()
+        else:
+            self._mark_dirty()
+
+    def flush(self):
+        """Escribe el contenido de la tabla al archivo si hay cambios."""
+        if not self.dirty:
+            return
+        if self.journal is not None:
+            self.flush_journal()
+            return
+        atomic_write(self.filename, self.write_file)
+        self.mark_flushed()
+
+    def mark_flushed(self):
+        """Registra que el contenido actual ya está escrito en disco."""
+        bump_generation(self.filename)
+        self._pending = 0
+        self._signature = self._current_signature()
+        self._notify_commit()
+
+    def should_flush(self):
+        """
+        Indica si la política de escritura pide escribir los cambios.
+
+        Returns:
+            bool: True si hay cambios que deben escribirse ahora.
+        """
+        if self._batch_depth > 0:
+            return False
+        if self._journal_buffer:
+            return True
+        return bool(self.flush_every) and self._pending >= self.flush_every
+
+    def enable_journal(self, compact_every=1000, durable=True):
+        """
+        Activa el modo registro: cada cambio se anexa al archivo .log
+        en O(1) y el archivo de datos se reescribe al compactar.
+
+        Args:
+            compact_every (int, optional): Operaciones que disparan
+                una compactación.
+            durable (bool, optional): Sincronizar cada anexado al disco.
+        """
+        self.flush()
+        self.compact_every = compact_every
+        if self.journal is None:
+            self.journal = Journal(journal_path(self.filename), durable)
+        else:
+            self.journal.durable = durable
+        self._signature = self._current_signature()
+
+    def disable_journal(self):
+        """Compacta el registro, lo elimina y vuelve al modo normal."""
+        if self.journal is None:
+            return
+        self.compact()
+        self.journal.remove()
+        self.journal = None
+        self._signature = self._current_signature()
+
+    def compact(self):
+        """
+        Escribe una instantánea completa en el formato id|campo|... y
+        vacía el registro. La instantánea se escribe en un archivo
+        temporal que reemplaza al original, por lo que una falla a la
+        mitad deja intacto el archivo anterior y su registro.
+        """
+        atomic_write(self.filename, self.write_file)
+        self.mark_compacted()
+
+    def mark_compacted(self):
+        """
+        Registra que el archivo de datos ya tiene todo el contenido y
+        vacía el registro.
+        """
+        if self.journal is not None:
+            self.journal.truncate()
+        self._journal_buffer = []
+        self.mark_flushed()
+
+    def hold(self):
+        """Suspende la escritura automática hasta llamar release()."""
+        self._batch_depth += 1
+
+    def release(self):
+        """Reanuda la escritura automática suspendida con hold()."""
+        self._batch_depth -= 1
+
+    @contextmanager
+    def batch(self):
+        """
+        Suspende la escritura automática dentro del bloque y, si la
+        política lo pide, escribe una sola vez al salir (en modo
+        registro, un solo anexado).
+        """
+        self.hold()
+        try:
+            yield self
+        finally:
+            self.release()
+            if self.should_flush():
+                self.flush_journal()
+                self.flush()
+
+    def flush_journal(self):
+        """
+        Anexa al registro las operaciones acumuladas en un lote, o
+        compacta la tabla si el lote incluye un replace().
+        """
+        if self.journal is None or not self.dirty:
+            return
+        if self.rewrite_pending:
+            self.compact()
+            return
+        self.journal.append_many(self._journal_buffer)
+        self._journal_buffer = []
+        self._journal_flushed()
+
+    def journal_lines(self):
+        """
+        Obtiene las operaciones acumuladas en un lote como líneas del
+        registro, para anexarlas junto con otros archivos (ver
+        transaction.commit_tables).
+
+        Returns:
+            list: Líneas operacion|contenido sin salto de línea.
+        """
+        return [operation_line(op, payload)
+                for op, payload in self._journal_buffer]
+
+    def mark_journaled(self):
+        """Registra que las operaciones del lote ya están en el registro."""
+        if self.journal is None or not self._journal_buffer:
+            return
+        self.journal.entries += len(self._journal_buffer)
+        self._journal_buffer = []
+        self._journal_flushed()
+
+    def _journal_flushed(self):
+        """Compacta el registro si creció demasiado o publica el anexado."""
+        if self.journal.entries >= self.compact_every:
+            self.compact()
+        else:
+            bump_generation(self.filename)
+            self._signature = self._current_signature()
+            self._notify_commit()
+
+    def add_listener(self, listener):
+        """
+        Registra un objeto que se notifica de cada cambio de la tabla
+        y lo inicializa con el contenido actual.
+
+        Args:
+            listener (object): Objeto con on_insert, on_delete y on_reset.
+        """
+        self.listeners.append(listener)
+        listener.on_reset(self.values())
+
+    def remove_listener(self, listener):
+        """
+        Retira un observador registrado con add_listener().
+
+        Args:
+            listener (object): Observador a retirar.
+        """
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def close(self):
+        """
+        Marca la tabla como descartada del caché y cancela los grupos de
+        observadores que comparte con otras tablas, para que estas no la
+        retengan en memoria.
+        """
+        self.closed = True
+        for subscription in list(self.subscriptions):
+            subscription.cancel()
+
+    def _notify_reset(self):
+        """Notifica a los observadores que el contenido se reemplazó."""
+        for listener in self.listeners:
+            listener.on_reset(self.values())
+
+    def _notify_commit(self):
+        """Notifica a los observadores que los cambios ya están en disco."""
+        for listener in self.listeners:
+            on_commit = getattr(listener, 'on_commit', None)
+            if on_commit is not None:
+                on_commit()
+
+    def _mark_dirty(self, operation=None, payload=None):
+        """
+        Registra un cambio y aplica la política de escritura. En modo
+        registro el cambio se anexa al .log en lugar de marcarse pendiente.
+
+        Args:
+            operation (str, optional): Operación del registro.
+            payload (str, optional): Contenido de la operación.
+        """
+        if self.journal is not None and operation is not None:
+            if self._batch_depth > 0:
+                self._journal_buffer.append((operation, payload))
+                return
+            self.journal.append(operation, payload)
+            if self.journal.entries >= self.compact_every:
+                self.compact()
+            else:
+                self._signature = self._current_signature()
+                self._notify_commit()
+            return
+        self._pending += 1
+        if self._batch_depth == 0 and self.flush_every \
+                and self._pending >= self.flush_every:
+            self.flush()
+
+
+class Subscription:
+    """
+    Grupo de observadores que mantiene un mismo índice derivado de varias
+    tablas (por ejemplo, hoteles y reservaciones). Al cerrarse cualquiera
+    de ellas el grupo se retira de todas: el índice ya no puede seguir al
+    día y las demás tablas no deben retenerlo.
+
+    Atributos:
+        pairs (list): Pares (tabla, observador) suscritos.
+    """
+
+    def __init__(self, pairs):
+        """
+        Registra los observadores e inicializa cada uno con el contenido
+        de su tabla. Si alguna tabla ya estaba cerrada, el grupo se
+        cancela de inmediato y el índice queda como una copia fija.
+
+        Args:
+            pairs (iterable): Pares (tabla, observador).
+        """
+        self.pairs = list(pairs)
+        for table, listener in self.pairs:
+            table.add_listener(listener)
+            table.subscriptions.append(self)
+        if any(table.closed for table, _ in self.pairs):
+            self.cancel()
+
+    @property
+    def active(self):
+        """bool: True mientras los observadores sigan registrados."""
+        return bool(self.pairs)
+
+    def cancel(self):
+        """Retira los observadores del grupo de todas sus tablas."""
+        pairs, self.pairs = self.pairs, []
+        for table, listener in pairs:
+            table.remove_listener(listener)
+            if self in table.subscriptions:
+                table.subscriptions.remove(self)
+
+
+_TABLES = OrderedDict()
+
+MAX_TABLES = 64
+MAX_RECORDS = None
+
+
+def set_cache_limits(max_tables=64, max_records=None):
+    """
+    Fija el tamaño máximo del caché de tablas abiertas. Al excederlo se
+    descartan las tablas usadas hace más tiempo que no tengan cambios
+    pendientes ni estén dentro de una transacción o fijadas (pinned).
+
+    Args:
+        max_tables (int, optional): Tablas abiertas como máximo; None sin
+            límite.
+        max_records (int, optional): Registros en memoria como máximo,
+            sumando todas las tablas; None sin límite.
+    """
+    global MAX_TABLES, MAX_RECORDS  # pylint: disable=global-statement
+    MAX_TABLES = max_tables
+    MAX_RECORDS = max_records
+    _evict()
+
+
+def _evict(keep=None):
+    """
+    Descarta tablas en orden LRU hasta respetar los límites del caché.
+
+    Args:
+        keep (RecordTable, optional): Tabla que no debe descartarse.
+    """
+    def over_limit():
+        if MAX_TABLES is not None and len(_TABLES) > MAX_TABLES:
+            return True
+        return MAX_RECORDS is not None and \
+            sum(len(t) for t in _TABLES.values()) > MAX_RECORDS
+
+    for path, table in list(_TABLES.items()):
+        if not over_limit():
+            return
+        if table is keep or table.pinned or table.dirty or table.held:
+            continue
+        del _TABLES[path]
+        table.close()
+
+
+def set_backend(backend):
+    """
+    Elige el formato de los archivos de datos que se crean a partir de
+    ahora. Los archivos existentes conservan el suyo (ver database.py
+    para migrarlos).
+
+    Args:
+        backend (str): TEXT o SQLITE.
+
+    Raises:
+        ValueError: Si el formato no existe.
+    """
+    global BACKEND  # pylint: disable=global-statement
+    if backend not in (TEXT, *_BACKENDS):
+        raise ValueError(f"formato de almacenamiento desconocido: {backend}")
+    BACKEND = backend
+
+
+def register_backend(name, table_class):
+    """
+    Registra la clase de tabla de un formato de almacenamiento.
+
+    Args:
+        name (str): Formato, por ejemplo SQLITE.
+        table_class (object): Subclase de RecordTable que se crea con
+            (ruta, parse, key, kind, from_fields=...), o su nombre
+            'modulo.Clase' para importarla al usarla por primera vez.
+    """
+    _BACKENDS[name] = table_class
+
+
+def _backend_class(name):
+    """
+    Obtiene la clase de tabla de un formato, importándola si hace falta.
+
+    Args:
+        name (str): Formato registrado.
+
+    Returns:
+        type: Subclase de RecordTable.
+    """
+    table_class = _BACKENDS[name]
+    if isinstance(table_class, str):
+        module, _, attr = table_class.rpartition('.')
+        table_class = getattr(importlib.import_module(module), attr)
+        _BACKENDS[name] = table_class
+    return table_class
+
+
+def _is_database(path, kind):
+    """
+    Indica si un archivo debe abrirse como base de datos SQLite: lo es,
+    o no existe y BACKEND es SQLITE.
+
+    Args:
+        path (str): Ruta del archivo.
+        kind (str): Tipo de registro, o None si se desconoce.
+
+    Returns:
+        bool: True para usar una SQLiteTable.
+    """
+    # Se compara la firma aquí para no importar sqlite3 (database) al
+    # abrir archivos de texto (ver _BACKENDS).
+    try:
+        with open(path, 'rb') as file:
+            if file.read(len(SQLITE_MAGIC)) == SQLITE_MAGIC:
+                return True
+    except (FileNotFoundError, IsADirectoryError):
+        pass
+    return (BACKEND == SQLITE and kind is not None
+            and file_signature(path) is None)
+
+
+def open_table(filename, parse, key, from_fields=None, workers=None,
+               kind=None):
+    """
+    Obtiene la tabla compartida de un archivo, creándola la primera vez
+    y recargándola si el archivo cambió en disco.
+
+    Args:
+        filename (str): Ruta del archivo.
+        parse (callable): Convierte una línea en un registro.
+        key (callable): Obtiene el ID de un registro.
+        from_fields (callable, optional): Crea un registro a partir de
+            sus campos ya separados (instantáneas binarias).
+        workers (int, optional): Procesos para cargar el archivo en
+            paralelo; se conserva para las recargas siguientes.
+        kind (str, optional): 'hotel', 'customer' o 'reservation'; permite
+            crear la base de datos si BACKEND es SQLITE.
+
+    Returns:
+        RecordTable: Tabla asociada al archivo (SQLiteTable si es una
+            base de datos).
+    """
+    path = os.path.abspath(filename)
+    table = _TABLES.get(path)
+    if table is None:
+        if _is_database(path, kind):
+            table = _backend_class(SQLITE)(path, parse, key, kind,
+                                           from_fields=from_fields)
+        else:
+            table = RecordTable(path, parse, key, from_fields=from_fields,
+                                workers=workers)
+        _TABLES[path] = table
+        _evict(keep=table)
+    else:
+        _TABLES.move_to_end(path)
+        if workers is not None:
+            table.workers = workers
+        table.refresh()
+    return table
+
+
+def is_open(filename):
+    """
+    Indica si un archivo tiene una tabla abierta en el caché.
+
+    Args:
+        filename (str): Ruta del archivo.
+
+    Returns:
+        bool: True si open_table() ya creó su tabla y no se ha descartado.
+    """
+    return os.path.abspath(filename) in _TABLES
+
+
+def iter_records(filename, parse, key, predicate=None, record_id=None,
+                 from_fields=None):
+    """
+    Itera los registros de un archivo de forma perezosa y con memoria
+    constante. Si el archivo ya tiene una tabla abierta, un registro
+    .log que aplicar o es una instantánea binaria o una base de datos,
+    se itera la tabla en memoria.
+
+    Args:
+        filename (str): Ruta del archivo.
+        parse (callable): Convierte una línea en un registro.
+        key (callable): Obtiene el ID de un registro.
+        predicate (callable, optional): Filtro de registros.
+        record_id (str, optional): Solo se analizan las líneas con este
+            ID; la búsqueda termina en la primera coincidencia.
+        from_fields (callable, optional): Crea un registro a partir de
+            sus campos ya separados (instantáneas binarias).
+
+    Yields:
+        object: Copias de los registros que cumplen el filtro.
+    """
+    path = os.path.abspath(filename)
+    if path in _TABLES or os.path.exists(journal_path(path)) \
+            or is_snapshot(path) or _is_database(path, None):
+        table = open_table(path, parse, key, from_fields)
+        if record_id is not None:
+            records = [table.get(record_id)] if record_id in table else []
+        else:
+            records = table.values()
+        for record in records:
+            if predicate is None or predicate(record):
+                yield copy.copy(record)
+        return
+
+    if not os.path.exists(path):
+        return
+    prefix = None if record_id is None else f"{record_id}|"
+    with open(path, 'r', encoding='utf-8') as file:
+        for line in file:
+            if prefix is not None and not line.startswith(prefix):
+                continue
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = parse(line)
+            except ValueError as err:
+                print(f"[Error] Datos inválidos en línea: '{line}'. "
+                      f"Error: {err}")
+                continue
+            if predicate is None or predicate(record):
+                yield record
+                if prefix is not None:
+                    return
+
+
+def flush_all():
+    """Escribe los cambios pendientes de todas las tablas abiertas."""
+    for table in _TABLES.values():
+        table.flush()
+
+
+def close_all():
+    """Escribe los cambios pendientes y olvida todas las tablas abiertas."""
+    flush_all()
+    for table in _TABLES.values():
+        table.close()
+    _TABLES.clear()
+
+
+def remove_data_files(filenames):
+    """
+    Elimina archivos de datos junto con sus archivos auxiliares, el
+    contador de generación (.gen) y el registro (.log), si existen.
+
+    Args:
+        filenames (iterable): Rutas de los archivos.
+    """
+    for filename in filenames:
+        for path in (filename, generation_path(filename),
+                     journal_path(filename)):
+            if os.path.exists(path):
+                os.remove(path)
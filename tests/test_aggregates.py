@@ -0,0 +1,103 @@
+"""
+Módulo de pruebas para los agregados de ocupación (aggregates.py).
+"""
+
+import unittest
+from hotel import Hotel
+from customer import Customer
+from aggregates import month_nights
+from availability import parse_date
+from reservation import Reservation
+from storage import close_all, remove_data_files, set_cache_limits
+from transaction import lock_path
+
+
+class TestAggregates(unittest.TestCase):
+    """Clase de pruebas unitarias para HotelAggregates."""
+
+    def setUp(self):
+        """Configura el entorno de prueba para cada test."""
+        self.hotel_file = "data/test_agg_hotels_data.txt"
+        self.cust_file = "data/test_agg_customers_data.txt"
+        self.res_file = "data/test_agg_reservations_data.txt"
+        self.files = [self.hotel_file, self.cust_file, self.res_file]
+        self.tearDown()
+        Hotel.create_hotel(self.hotel_file, Hotel("H1", "Uno", "Ciudad X", 2))
+        Hotel.create_hotel(self.hotel_file, Hotel("H2", "Dos", "Ciudad Y", 1))
+        Customer.create_customer(self.cust_file,
+                                 Customer("C1", "N", "555", "c@m.com"))
+
+    def tearDown(self):
+        """Limpia el entorno de prueba después de cada test."""
+        close_all()
+        remove_data_files([*self.files, lock_path(self.files[0])])
+
+    def book(self, reservation_id, hotel_id, check_in, check_out):
+        """Crea una reservación de prueba."""
+        return Reservation.create_reservation(
+            self.res_file, self.hotel_file, self.cust_file,
+            Reservation(reservation_id, hotel_id, "C1", (check_in, check_out)))
+
+    def test_month_split(self):
+        """Prueba el reparto de noches entre meses."""
+        nights = month_nights(parse_date("2024-12-30"),
+                              parse_date("2025-01-02"))
+        self.assertEqual(list(nights), [("2024-12", 2), ("2025-01", 1)])
+
+    def test_incremental_updates(self):
+        """Prueba que reservar y cancelar actualizan los contadores."""
+        aggregates = Reservation.aggregates(self.res_file, self.hotel_file)
+        self.book("R1", "H1", "2025-01-30", "2025-02-02")
+        self.book("R2", "H1", "2025-02-10", "2025-02-12")
+        self.book("R3", "H2", "2025-02-01", "2025-02-08")
+        self.assertEqual(aggregates.bookings["H1"], 2)
+        self.assertEqual(aggregates.nights_sold("2025-02"), 1 + 2 + 7)
+        self.assertEqual(aggregates.nights_sold("2025-01", "H1"), 2)
+        self.assertEqual(aggregates.bookings_by_location("Ciudad X"), 2)
+        self.assertAlmostEqual(aggregates.occupancy_rate("H2", "2025-02"),
+                               7 / 28)
+
+        Reservation.cancel_reservation(self.res_file, self.hotel_file, "R2")
+        self.assertEqual(aggregates.nights_sold("2025-02", "H1"), 1)
+        self.assertEqual(aggregates.bookings_by_location("Ciudad X"), 1)
+        self.assertTrue(aggregates.verify())
+
+    def test_hotel_changes(self):
+        """Prueba que se reflejan los cambios de habitaciones y ubicación."""
+        aggregates = Reservation.aggregates(self.res_file, self.hotel_file)
+        self.book("R1", "H1", "2025-03-01", "2025-03-02")
+        hotel = Hotel.find_hotel(self.hotel_file, "H1")
+        hotel.modify_info(new_location="Ciudad Z", new_rooms=4)
+        Hotel.update_hotel(self.hotel_file, hotel)
+        self.assertEqual(aggregates.rooms["H1"], 4)
+        self.assertEqual(aggregates.bookings_by_location("Ciudad X"), 0)
+        self.assertEqual(aggregates.bookings_by_location("Ciudad Z"), 1)
+        self.assertTrue(aggregates.verify())
+
+    def test_reload_rebuilds(self):
+        """Prueba que una recarga desde disco recalcula los agregados."""
+        self.book("R1", "H1", "2025-03-01", "2025-03-03")
+        aggregates = Reservation.aggregates(self.res_file, self.hotel_file)
+        with open(self.res_file, 'a', encoding='utf-8') as file:
+            file.write("R9|H2|C1|2025-03-01|2025-03-02\n")
+        aggregates = Reservation.aggregates(self.res_file, self.hotel_file)
+        self.assertEqual(aggregates.nights_sold("2025-03"), 3)
+        self.assertTrue(aggregates.verify())
+
+    def test_detached_when_table_closes(self):
+        """Prueba que los agregados se retiran al descartar una tabla."""
+        aggregates = Reservation.aggregates(self.res_file, self.hotel_file)
+        self.assertIs(Reservation.aggregates(self.res_file, self.hotel_file),
+                      aggregates)
+        hotels = Hotel.table(self.hotel_file)
+        set_cache_limits(max_tables=0)
+        set_cache_limits()
+        self.assertEqual((hotels.listeners, hotels.subscriptions), ([], []))
+        fresh = Reservation.aggregates(self.res_file, self.hotel_file)
+        self.assertIsNot(fresh, aggregates)
+        self.book("R1", "H1", "2025-03-01", "2025-03-03")
+        self.assertEqual(fresh.bookings["H1"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Módulo de pruebas para el análisis vectorizado (analytics.py).
+"""
+
+import unittest
+import os
+from analytics import NIGHTS, RESERVATIONS, ReservationArrays, np
+from reservation import Reservation
+from storage import close_all
+
+
+@unittest.skipIf(np is None, "NumPy no está instalado")
+class TestAnalytics(unittest.TestCase):
+    """Clase de pruebas unitarias para ReservationArrays."""
+
+    def setUp(self):
+        """Configura el entorno de prueba para cada test."""
+        self.res_file = "data/test_analytics_reservations.txt"
+        self.tearDown()
+        self.reservations = [
+            Reservation("R1", "H1", "C1", ("2025-03-01", "2025-03-04")),
+            Reservation("R2", "H2", "C2", ("2025-03-02", "2025-03-03")),
+            Reservation("R3", "H1", "C2", ("2025-03-03", "2025-03-05")),
+            Reservation("R4", "H1", "C3", ("2025-03-05", "2025-03-06")),
+            Reservation("R5", "H1", "C1", ("2025-03-09", "2025-03-01")),
+        ]
+        self.arrays = ReservationArrays(
+            self.reservations, {"R1": "2025-02-01", "R3": "2025-03-01"})
+
+    def tearDown(self):
+        """Limpia el entorno de prueba después de cada test."""
+        close_all()
+        for f in os.listdir("data"):
+            if f.startswith("test_analytics_"):
+                os.remove(f"data/{f}")
+
+    def test_stay_and_lead_time(self):
+        """Prueba la estancia promedio, fechas inválidas y anticipación."""
+        self.assertEqual((len(self.arrays), self.arrays.invalid), (4, 1))
+        self.assertEqual(self.arrays.average_stay(), 7 / 4)
+        self.assertEqual(self.arrays.lead_times().tolist(), [28, 2])
+        self.assertEqual(self.arrays.average_lead_time(), 15.0)
+        arrays = ReservationArrays(self.reservations)
+        self.assertIsNone(arrays.average_lead_time())
+
+    def test_occupancy_per_night(self):
+        """Prueba la ocupación por noche de todos los hoteles y de uno."""
+        nights, booked = self.arrays.occupancy_per_night()
+        self.assertEqual(str(nights[0]), "2025-03-01")
+        self.assertEqual(booked.tolist(), [1, 2, 2, 1, 1])
+        nights, booked = self.arrays.occupancy_per_night("H2")
+        self.assertEqual((str(nights[0]), booked.tolist()),
+                         ("2025-03-02", [1]))
+        self.assertEqual(len(self.arrays.occupancy_per_night("H9")[1]), 0)
+
+    def test_top_customers(self):
+        """Prueba los principales clientes por noches y por reservaciones."""
+        self.assertEqual(self.arrays.top_customers(2, NIGHTS),
+                         [("C1", 3), ("C2", 3)])
+        self.assertEqual(self.arrays.top_customers(by=RESERVATIONS),
+                         [("C2", 2), ("C1", 1), ("C3", 1)])
+        with self.assertRaises(ValueError):
+            self.arrays.top_customers(by="monto")
+
+    def test_load_from_file(self):
+        """Prueba la carga desde un archivo de reservaciones."""
+        with open(self.res_file, 'w', encoding='utf-8') as file:
+            file.writelines(f"{r.to_line()}\n" for r in self.reservations)
+        arrays = ReservationArrays.load(self.res_file)
+        self.assertEqual(sorted(arrays.ids), ["R1", "R2", "R3", "R4"])
+        self.assertEqual(arrays.average_stay(), 7 / 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
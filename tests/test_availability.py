@@ -0,0 +1,145 @@
+"""
+Módulo de pruebas para el motor de disponibilidad por noche.
+"""
+
+import gc
+import unittest
+import os
+import availability
+from availability import AvailabilityIndex, NightlyOccupancy, parse_date
+from reservation import Reservation
+from hotel import Hotel
+from customer import Customer
+from storage import close_all, remove_data_files, set_cache_limits
+from transaction import lock_path
+
+
+class TestNightlyOccupancy(unittest.TestCase):
+    """Clase de pruebas unitarias para NightlyOccupancy."""
+
+    def test_add_grows_in_both_directions(self):
+        """Prueba que el arreglo crece hacia atrás y hacia adelante."""
+        occ = NightlyOccupancy()
+        occ.add(10, 12, 1)
+        occ.add(8, 11, 1)
+        occ.add(11, 15, 1)
+        self.assertEqual(occ.base, 8)
+        self.assertEqual(list(occ.counts), [1, 1, 2, 2, 1, 1, 1])
+        self.assertEqual(occ.max_booked(8, 20), 2)
+        self.assertEqual(occ.booked(3), 0)
+
+
+class TestAvailabilityIndex(unittest.TestCase):
+    """Clase de pruebas unitarias para AvailabilityIndex."""
+
+    def test_range_queries(self):
+        """Prueba las consultas de habitaciones libres por rango."""
+        index = AvailabilityIndex()
+        index.capacity = {"H1": 2, "H2": 1}
+        index.add_stay("H1", "2025-03-01", "2025-03-05")
+        index.add_stay("H1", "2025-03-04", "2025-03-06")
+        index.add_stay("H2", "2025-03-02", "2025-03-03")
+
+        self.assertEqual(index.booked_on("H1", "2025-03-04"), 2)
+        self.assertEqual(index.free_rooms("H1", "2025-03-01", "2025-03-04"), 1)
+        self.assertFalse(index.can_book("H1", "2025-03-03", "2025-03-05"))
+        self.assertTrue(index.can_book("H1", "2025-03-06", "2025-03-09"))
+        self.assertIsNone(index.free_rooms("H9", "2025-03-01", "2025-03-02"))
+        self.assertEqual(
+            index.hotels_with_free_rooms("2025-03-02", "2025-03-04"),
+            [("H1", 1)]
+        )
+        index.remove_stay("H2", "2025-03-02", "2025-03-03")
+        self.assertEqual(index.free_rooms("H2", "2025-03-01", "2025-03-05"), 1)
+
+    def test_invalid_dates(self):
+        """Prueba que las fechas inválidas se rechazan."""
+        self.assertRaises(ValueError, parse_date, "2025-13-01")
+        index = AvailabilityIndex()
+        self.assertRaises(ValueError, index.add_stay,
+                          "H1", "2025-03-05", "2025-03-01")
+
+
+class TestDateAwareBooking(unittest.TestCase):
+    """Pruebas de create_reservation con disponibilidad por fecha."""
+
+    def setUp(self):
+        """Configura el entorno de prueba para cada test."""
+        self.res_file = "data/test_avail_reservations_data.txt"
+        self.hotel_file = "data/test_avail_hotels_data.txt"
+        self.cust_file = "data/test_avail_customers_data.txt"
+        self.files = [self.res_file, self.hotel_file, self.cust_file]
+        for f in self.files:
+            if os.path.exists(f):
+                os.remove(f)
+        Hotel.create_hotel(self.hotel_file, Hotel("H1", "Uno", "Loc", 1))
+        Customer.create_customer(
+            self.cust_file, Customer("C1", "Cliente", "555", "c@mail.com"))
+
+    def tearDown(self):
+        """Limpia el entorno de prueba después de cada test."""
+        remove_data_files([*self.files, lock_path(self.files[0])])
+
+    def _book(self, rid, check_in, check_out):
+        """Crea una reservación en H1 para C1."""
+        r = Reservation(rid, "H1", "C1", (check_in, check_out))
+        return Reservation.create_reservation(
+            self.res_file, self.hotel_file, self.cust_file, r
+        )
+
+    def test_non_overlapping_stays_share_room(self):
+        """Prueba que estancias sin traslape usan la misma habitación."""
+        self.assertTrue(self._book("R1", "2025-03-01", "2025-03-05"))
+        self.assertFalse(self._book("R2", "2025-03-04", "2025-03-06"))
+        self.assertTrue(self._book("R3", "2025-03-05", "2025-03-07"))
+
+        availability = Reservation.availability(self.res_file, self.hotel_file)
+        stay = ("2025-03-05", "2025-03-06")
+        self.assertEqual(availability.free_rooms("H1", *stay), 0)
+        Reservation.cancel_reservation(self.res_file, self.hotel_file, "R3")
+        self.assertEqual(availability.free_rooms("H1", *stay), 1)
+
+    def test_rooms_available_follows_busiest_night(self):
+        """Prueba que rooms_available sigue consistente al cancelar."""
+        self.assertTrue(self._book("R1", "2025-01-10", "2025-01-12"))
+        self.assertTrue(self._book("R2", "2025-02-10", "2025-02-12"))
+        Reservation.cancel_reservation(self.res_file, self.hotel_file, "R1")
+        hotel = Hotel.find_hotel(self.hotel_file, "H1")
+        self.assertEqual((hotel.rooms, hotel.rooms_available), (1, 0))
+        Reservation.cancel_reservation(self.res_file, self.hotel_file, "R2")
+        self.assertEqual(
+            Hotel.find_hotel(self.hotel_file, "H1").rooms_available, 1)
+
+    def test_index_released_with_tables(self):
+        """Prueba que el índice se libera al descartar sus tablas."""
+        indexes = availability._INDEXES  # pylint: disable=protected-access
+        close_all()
+        gc.collect()
+        before = len(indexes)
+        self._book("R1", "2025-03-01", "2025-03-05")
+        self.assertEqual(len(indexes), before + 1)
+        close_all()
+        gc.collect()
+        self.assertEqual(len(indexes), before)
+
+    def test_evicted_shards_leave_no_listeners(self):
+        """Prueba que los hoteles no acumulan observadores descartados."""
+        hotels = Hotel.table(self.hotel_file)
+        before = len(hotels.listeners)
+        set_cache_limits(max_tables=3)
+        try:
+            for i in range(20):
+                Reservation.availability(f"data/test_avail_shard_{i}.txt",
+                                         self.hotel_file)
+            self.assertLessEqual(len(hotels.listeners), before + 2)
+        finally:
+            set_cache_limits()
+
+    def test_invalid_dates_rejected(self):
+        """Prueba que una reservación con fechas inválidas se rechaza."""
+        self.assertFalse(self._book("R1", "2025-03-05", "2025-03-01"))
+        self.assertFalse(self._book("R2", "mañana", "2025-03-01"))
+
+
+if __name__ == '__main__':
+    unittest.main()
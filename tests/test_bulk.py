@@ -0,0 +1,95 @@
+"""
+Módulo de pruebas para las operaciones masivas.
+"""
+
+import io
+import unittest
+import os
+from hotel import Hotel
+from customer import Customer
+from reservation import Reservation
+from storage import remove_data_files
+from transaction import lock_path
+
+
+class TestBulk(unittest.TestCase):
+    """Clase de pruebas unitarias para las operaciones masivas."""
+
+    def setUp(self):
+        """Configura el entorno de prueba para cada test."""
+        self.res_file = "data/test_bulk_reservations_data.txt"
+        self.hotel_file = "data/test_bulk_hotels_data.txt"
+        self.cust_file = "data/test_bulk_customers_data.txt"
+        self.files = [self.res_file, self.hotel_file, self.cust_file]
+        for f in self.files:
+            if os.path.exists(f):
+                os.remove(f)
+
+    def tearDown(self):
+        """Limpia el entorno de prueba después de cada test."""
+        remove_data_files([*self.files, lock_path(self.files[0])])
+
+    def test_bulk_create_and_delete_hotels(self):
+        """Prueba la carga masiva con duplicados y la eliminación masiva."""
+        hotels = [Hotel(f"H{i}", f"Hotel {i}", "Loc", 2) for i in range(100)]
+        hotels.append(Hotel("H5", "Duplicado", "Loc", 1))
+        result = Hotel.bulk_create_hotels(self.hotel_file, iter(hotels))
+        self.assertEqual(result.processed, 100)
+        self.assertEqual(result.rejected, ["H5"])
+        self.assertGreater(result.records_per_second, 0)
+        self.assertEqual(len(Hotel.load_hotels(self.hotel_file)), 100)
+
+        result = Hotel.bulk_delete_hotels(self.hotel_file,
+                                          ["H1", "H2", "H999"])
+        self.assertEqual(result.processed, 2)
+        self.assertEqual(result.rejected, ["H999"])
+        self.assertEqual(len(Hotel.load_hotels(self.hotel_file)), 98)
+
+    def test_bulk_customers_and_export(self):
+        """Prueba la carga masiva de clientes y su exportación."""
+        customers = [Customer(f"C{i}", "N", "555", f"c{i}@mail.com")
+                     for i in range(3)]
+        Customer.bulk_create_customers(self.cust_file, customers)
+        out = io.StringIO()
+        result = Customer.export_customers(self.cust_file, out)
+        self.assertEqual(result.processed, 3)
+        with open(self.cust_file, 'r', encoding='utf-8') as file:
+            self.assertEqual(out.getvalue(), file.read())
+        self.assertEqual(
+            Customer.bulk_delete_customers(self.cust_file, ["C0"]).processed, 1
+        )
+
+    def test_bulk_reservations(self):
+        """Prueba la creación y cancelación masiva de reservaciones."""
+        Hotel.create_hotel(self.hotel_file, Hotel("H1", "Uno", "Loc", 2))
+        Customer.create_customer(self.cust_file,
+                                 Customer("C1", "N", "555", "c@m.com"))
+        reservations = [
+            Reservation("R1", "H1", "C1", ("2025-01-01", "2025-01-03")),
+            Reservation("R2", "H1", "C1", ("2025-01-02", "2025-01-04")),
+            Reservation("R3", "H1", "C1", ("2025-01-02", "2025-01-03")),
+            Reservation("R4", "H9", "C1", ("2025-01-01", "2025-01-03")),
+            Reservation("R5", "H1", "C1", ("2025-01-05", "2025-01-01")),
+        ]
+        result = Reservation.bulk_create_reservations(
+            self.res_file, self.hotel_file, self.cust_file, reservations
+        )
+        self.assertEqual(result.processed, 2)
+        self.assertEqual(result.rejected, ["R3", "R4", "R5"])
+        hotel = Hotel.load_hotels(self.hotel_file)[0]
+        self.assertEqual(hotel.rooms_available, 0)
+
+        out = io.StringIO()
+        Reservation.export_reservations(self.res_file, out)
+        self.assertEqual(len(out.getvalue().splitlines()), 2)
+
+        result = Reservation.bulk_delete_reservations(
+            self.res_file, self.hotel_file, ["R1", "R2"]
+        )
+        self.assertEqual(result.processed, 2)
+        hotel = Hotel.load_hotels(self.hotel_file)[0]
+        self.assertEqual(hotel.rooms_available, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+"""
+Módulo de pruebas para el caché de tablas (límites LRU y generaciones).
+"""
+
+import gc
+import glob
+import unittest
+import os
+import weakref
+import storage
+from hotel import Hotel
+from indexes import SecondaryIndex
+from reservation import Reservation
+from shards import create_manifest
+from storage import (Subscription, bump_generation, close_all,
+                     remove_data_files, set_cache_limits)
+from transaction import lock_path
+
+
+class TestCache(unittest.TestCase):
+    """Clase de pruebas unitarias para el caché de tablas abiertas."""
+
+    def setUp(self):
+        """Configura el entorno de prueba para cada test."""
+        self.files = [f"data/test_cache_hotels_{i}.txt" for i in range(4)]
+        self.tearDown()
+        for i, name in enumerate(self.files):
+            with open(name, 'w', encoding='utf-8') as file:
+                file.write(f"H{i}|Hotel|Loc|{i + 1}|{i + 1}\n")
+
+    def tearDown(self):
+        """Limpia el entorno de prueba después de cada test."""
+        close_all()
+        set_cache_limits()
+        for f in glob.glob("data/test_cache_*"):
+            os.remove(f)
+        remove_data_files([lock_path(self.files[0])])
+
+    def open_paths(self):
+        """Rutas de las tablas abiertas, de la menos a la más usada."""
+        # pylint: disable-next=protected-access
+        return [os.path.basename(p) for p in storage._TABLES]
+
+    def test_lru_eviction(self):
+        """Prueba que se descarta la tabla usada hace más tiempo."""
+        set_cache_limits(max_tables=2)
+        Hotel.table(self.files[0])
+        Hotel.table(self.files[1])
+        Hotel.table(self.files[0])
+        Hotel.table(self.files[2])
+        self.assertEqual(self.open_paths(), ["test_cache_hotels_0.txt",
+                                             "test_cache_hotels_2.txt"])
+
+    def test_record_budget(self):
+        """Prueba el límite por número total de registros."""
+        set_cache_limits(max_tables=None, max_records=2)
+        for name in self.files:
+            Hotel.table(name)
+        self.assertEqual(len(self.open_paths()), 2)
+
+    def test_dirty_and_pinned_tables_stay(self):
+        """Prueba que no se descartan tablas con cambios o fijadas."""
+        set_cache_limits(max_tables=1)
+        pinned = Hotel.table(self.files[0])
+        pinned.pinned = True
+        dirty = Hotel.table(self.files[1])
+        dirty.flush_every = None
+        dirty.insert(Hotel("HX", "Nuevo", "Loc", 1))
+        Hotel.table(self.files[2])
+        self.assertEqual(self.open_paths(), ["test_cache_hotels_0.txt",
+                                             "test_cache_hotels_1.txt",
+                                             "test_cache_hotels_2.txt"])
+
+    def test_evicted_table_is_released(self):
+        """Prueba que una tabla descartada (con índices) se libera."""
+        set_cache_limits(max_tables=1)
+        table = Hotel.table(self.files[0])
+        Reservation.availability("data/test_cache_res.txt", self.files[0])
+        ref = weakref.ref(table)
+        del table
+        Hotel.table(self.files[1])
+        Hotel.table(self.files[2])
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_evicted_shards_are_freed(self):
+        """Prueba que los agregados no retienen particiones descartadas."""
+        manifest = create_manifest("data/test_cache_res.shards", buckets=12)
+        hotels = Hotel.table(self.files[0])
+        hotels.pinned = True
+        set_cache_limits(max_tables=4)
+        Reservation.aggregates(manifest.filename, self.files[0])
+        refs = [weakref.ref(Reservation.table(shard))
+                for shard in manifest.files()]
+        Reservation.aggregates(manifest.filename, self.files[0])
+        gc.collect()
+        alive = [ref for ref in refs if ref() is not None]
+        self.assertLessEqual(len(alive), 4)
+        self.assertEqual(hotels.listeners, [])
+
+    def test_eviction_cancels_subscriptions(self):
+        """Prueba que al descartar una tabla se cancelan sus suscripciones."""
+        set_cache_limits(max_tables=2)
+        first = Hotel.table(self.files[0])
+        second = Hotel.table(self.files[1])
+        subscription = Subscription(
+            [(table, SecondaryIndex(table, 'location'))
+             for table in (first, second)])
+        self.assertEqual(len(second.listeners), 1)
+        Hotel.table(self.files[2])
+        self.assertTrue(first.closed)
+        self.assertFalse(subscription.active)
+        self.assertEqual((second.listeners, second.subscriptions), ([], []))
+        late = Subscription([(first, SecondaryIndex(first, 'location'))])
+        self.assertFalse(late.active)
+
+    def test_generation_detects_same_signature(self):
+        """Prueba que la generación detecta cambios que la firma no ve."""
+        name = self.files[0]
+        self.assertEqual(Hotel.table(name).get("H0").rooms, 1)
+        stat = os.stat(name)
+        with open(name, 'r+', encoding='utf-8') as file:
+            file.write("H0|Hotel|Loc|9|9\n")
+        os.utime(name, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertEqual(Hotel.table(name).get("H0").rooms, 1)
+        bump_generation(name)
+        self.assertEqual(Hotel.table(name).get("H0").rooms, 9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,8 @@ Módulo de pruebas para la clase Customer.
 import unittest
 import os
 from customer import Customer
+from storage import remove_data_files
+from transaction import lock_path
 
 
 class TestCustomer(unittest.TestCase):
@@ -19,8 +21,7 @@ class TestCustomer(unittest.TestCase):
 
     def tearDown(self):
         """Limpia el entorno de prueba después de cada test."""
-        if os.path.exists(self.test_file):
-            os.remove(self.test_file)
+        remove_data_files([self.test_file, lock_path(self.test_file)])
 
     def test_create_customer(self):
         """Prueba la creación de un cliente y la detección de duplicados."""
@@ -0,0 +1,143 @@
+"""
+Módulo de pruebas para el almacenamiento en SQLite (database.py).
+"""
+
+import sqlite3
+import unittest
+import os
+import storage
+from customer import Customer
+from database import (SQLiteTable, database_to_text, is_database,
+                      text_to_database)
+from hotel import Hotel
+from reservation import Reservation
+from storage import TEXT, SQLITE, close_all, remove_data_files, set_backend
+from transaction import Transaction, lock_path
+
+
+class TestDatabase(unittest.TestCase):
+    """Clase de pruebas unitarias para el formato SQLite."""
+
+    def setUp(self):
+        """Configura el entorno de prueba para cada test."""
+        self.text_file = "data/test_db_hotels_data.txt"
+        self.back_file = "data/test_db_hotels_back.txt"
+        self.hotel_file = "data/test_db_hotels.db"
+        self.cust_file = "data/test_db_customers.db"
+        self.res_file = "data/test_db_reservations.db"
+        self.files = [self.text_file, self.back_file, self.hotel_file,
+                      self.cust_file, self.res_file]
+        close_all()
+        self.remove_files()
+        with open(self.text_file, 'w', encoding='utf-8') as file:
+            file.write("H1|Uno|Ciudad X|3|3\n")
+            file.write("H2|Dos ñ|Ciudad Y|4|2\n")
+            file.write("H3|Tres|Ciudad X|5|5\n")
+
+    def tearDown(self):
+        """Limpia el entorno de prueba después de cada test."""
+        close_all()
+        set_backend(TEXT)
+        self.remove_files()
+
+    def remove_files(self):
+        """Elimina los archivos de prueba y los de la bitácora WAL."""
+        remove_data_files([*self.files, lock_path(self.files[0])])
+        for name in self.files:
+            for f in (f"{name}-wal", f"{name}-shm"):
+                if os.path.exists(f):
+                    os.remove(f)
+
+    def test_migration_round_trip(self):
+        """Prueba la migración texto -> SQLite -> texto."""
+        rows = text_to_database(self.text_file, self.hotel_file, 'hotel')
+        self.assertEqual(rows, 3)
+        self.assertTrue(is_database(self.hotel_file))
+        self.assertFalse(is_database(self.text_file))
+        self.assertEqual(database_to_text(self.hotel_file, self.back_file), 3)
+        with open(self.text_file, 'r', encoding='utf-8') as original, \
+                open(self.back_file, 'r', encoding='utf-8') as converted:
+            self.assertEqual(original.read(), converted.read())
+
+    def test_crud_on_database(self):
+        """Prueba que la API de Hotel funciona igual sobre SQLite."""
+        text_to_database(self.text_file, self.hotel_file, 'hotel')
+        self.assertIsInstance(Hotel.table(self.hotel_file), SQLiteTable)
+        self.assertEqual(Hotel.find_hotel(self.hotel_file, "H2").name, "Dos ñ")
+        self.assertTrue(Hotel.create_hotel(self.hotel_file,
+                                           Hotel("H4", "Cuatro", "Z", 1)))
+        self.assertFalse(Hotel.create_hotel(self.hotel_file,
+                                            Hotel("H4", "Otro", "Z", 1)))
+        hotel = Hotel.find_hotel(self.hotel_file, "H1")
+        hotel.modify_info(new_name="Uno bis")
+        self.assertTrue(Hotel.update_hotel(self.hotel_file, hotel))
+        self.assertTrue(Hotel.delete_hotel(self.hotel_file, "H3"))
+        close_all()
+
+        database_to_text(self.hotel_file, self.back_file)
+        with open(self.back_file, 'r', encoding='utf-8') as file:
+            self.assertEqual(file.read().splitlines(), [
+                "H1|Uno bis|Ciudad X|3|3", "H2|Dos ñ|Ciudad Y|4|2",
+                "H4|Cuatro|Z|1|1"])
+
+    def test_customer_lookups_use_indexes(self):
+        """Prueba que buscar clientes por email o teléfono use índices."""
+        set_backend(SQLITE)
+        Customer.create_customer(self.cust_file,
+                                 Customer("C1", "N", "555", "c@m.com"))
+        table = Customer.table(self.cust_file)
+        found = table.lookup('email', 'c@m.com')
+        self.assertEqual([c.customer_id for c in found], ["C1"])
+        for column in ('email', 'phone'):
+            plan = table.connection.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM customers "
+                f"WHERE {column} = ?", ('x',)).fetchall()
+            self.assertIn(f"customers_{column}", str(plan))
+
+    def test_backend_creates_databases(self):
+        """Prueba que BACKEND=SQLITE crea bases para archivos nuevos."""
+        set_backend(SQLITE)
+        Hotel.create_hotel(self.hotel_file, Hotel("H1", "Uno", "X", 2))
+        Customer.create_customer(self.cust_file,
+                                 Customer("C1", "Ana", "555", "a@x"))
+        res = Reservation("R1", "H1", "C1", ("2025-01-01", "2025-01-03"))
+        self.assertTrue(Reservation.create_reservation(
+            self.res_file, self.hotel_file, self.cust_file, res))
+        close_all()
+        for name in (self.hotel_file, self.cust_file, self.res_file):
+            self.assertTrue(is_database(name))
+        hotel = Hotel.find_hotel(self.hotel_file, "H1")
+        self.assertEqual(hotel.rooms_available, 1)
+        found = Reservation.find_reservation(self.res_file, "R1")
+        self.assertEqual(found.check_out, "2025-01-03")
+        with self.assertRaises(ValueError):
+            set_backend("csv")
+
+    def test_rollback_discards_batched_rows(self):
+        """Prueba que una transacción fallida no escribe sus filas."""
+        text_to_database(self.text_file, self.hotel_file, 'hotel')
+        table = Hotel.table(self.hotel_file)
+        with self.assertRaises(RuntimeError):
+            with Transaction(table):
+                table.insert(Hotel("H9", "Nueve", "Z", 1))
+                raise RuntimeError("falla")
+        self.assertNotIn("H9", table)
+        table.insert(Hotel("H8", "Ocho", "Z", 1))
+        self.assertEqual([h.hotel_id for h in table.lookup('location', 'Z')],
+                         ["H8"])
+
+    def test_refresh_sees_other_connections(self):
+        """Prueba que la tabla detecta los cambios de otra conexión."""
+        text_to_database(self.text_file, self.hotel_file, 'hotel')
+        self.assertEqual(len(Hotel.table(self.hotel_file)), 3)
+        other = sqlite3.connect(self.hotel_file)
+        with other:
+            other.execute("DELETE FROM hotels WHERE hotel_id = 'H2'")
+        other.close()
+        self.assertEqual(len(Hotel.table(self.hotel_file)), 2)
+        self.assertIsNone(storage.open_table(self.hotel_file, Hotel.from_line,
+                                             lambda h: h.hotel_id).get("H2"))
+
+
+if __name__ == "__main__":
+    unittest.main()
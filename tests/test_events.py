@@ -0,0 +1,122 @@
+"""
+Módulo de pruebas para el historial de eventos (events.py).
+"""
+
+import time
+import unittest
+import os
+import events
+from customer import Customer
+from hotel import Hotel
+from reservation import Reservation
+from storage import close_all, remove_data_files
+from transaction import Transaction, lock_path
+
+
+class TestEvents(unittest.TestCase):
+    """Clase de pruebas unitarias para el registro de eventos."""
+
+    def setUp(self):
+        """Configura el entorno de prueba para cada test."""
+        self.hotel_file = "data/test_events_hotels.txt"
+        self.cust_file = "data/test_events_customers.txt"
+        self.res_file = "data/test_events_reservations.txt"
+        self.log = "data/test_events.log"
+        self.tearDown()
+        with open(self.hotel_file, 'w', encoding='utf-8') as file:
+            file.write("H1|Uno|Ciudad X|3|3\n")
+        with open(self.cust_file, 'w', encoding='utf-8') as file:
+            file.write("C1|Ana|555|ana@mail.com\n")
+        self.store = events.record(self.hotel_file, self.cust_file,
+                                   self.res_file, self.log, snapshot_every=3)
+
+    def tearDown(self):
+        """Limpia el entorno de prueba después de cada test."""
+        close_all()
+        events._STORES.clear()  # pylint: disable=protected-access
+        names = [self.hotel_file, self.cust_file, self.res_file, self.log]
+        names += [f"data/{n}" for n in os.listdir("data")
+                  if n.startswith("test_events.log.")]
+        names.append(lock_path(self.log))
+        remove_data_files(names)
+
+    def book(self, reservation_id):
+        """Crea una reservación de una noche en H1."""
+        res = Reservation(reservation_id, "H1", "C1",
+                          ("2025-01-01", "2025-01-02"))
+        self.assertTrue(Reservation.create_reservation(
+            self.res_file, self.hotel_file, self.cust_file, res))
+
+    def test_event_types_and_history(self):
+        """Prueba los tipos de evento y la auditoría de un registro."""
+        self.book("R1")
+        hotel = Hotel.find_hotel(self.hotel_file, "H1")
+        hotel.modify_info(new_name="Uno bis")
+        Hotel.update_hotel(self.hotel_file, hotel)
+        Reservation.cancel_reservation(self.res_file, self.hotel_file, "R1")
+        self.assertEqual([e.type for e in events.history(self.log, "R1")],
+                         ["ReservationCreated", "ReservationCancelled"])
+        self.assertEqual([e.type for e in events.history(self.log, "H1")],
+                         ["RoomsChanged", "HotelModified", "RoomsChanged"])
+
+    def test_replay_current_and_past(self):
+        """Prueba la reconstrucción actual y en un momento pasado."""
+        self.book("R1")
+        middle = time.time()
+        time.sleep(0.01)
+        self.book("R2")
+        Customer.delete_customer(self.cust_file, "C1")
+
+        current = events.replay(self.log)
+        self.assertEqual(current.lines('reservation'), [
+            "R1|H1|C1|2025-01-01|2025-01-02",
+            "R2|H1|C1|2025-01-01|2025-01-02"])
+        self.assertEqual(current.lines('hotel'), ["H1|Uno|Ciudad X|3|1"])
+        self.assertEqual(current.lines('customer'), [])
+
+        past = events.replay(self.log, middle)
+        self.assertEqual(past.lines('reservation'),
+                         ["R1|H1|C1|2025-01-01|2025-01-02"])
+        self.assertEqual(past.lines('hotel'), ["H1|Uno|Ciudad X|3|2"])
+        self.assertEqual(past.lines('customer'), ["C1|Ana|555|ana@mail.com"])
+        earlier = events.replay(self.log, middle - 3600)
+        self.assertEqual(earlier.lines('hotel'), [])
+
+    def test_snapshots_bound_replay(self):
+        """Prueba que se guardan instantáneas y que el estado coincide."""
+        for number in range(3):
+            self.book(f"R{number}")
+        snapshots = events.snapshot_files(self.log)
+        self.assertEqual(len(snapshots), 3)
+        latest = events.read_snapshot(snapshots[-1])
+        tail = list(events.read_events(self.log, latest.offset))
+        self.assertLess(len(tail), self.store.snapshot_every)
+        self.assertEqual(len(tail), self.store.pending)
+        self.assertEqual(events.replay(self.log).lines('reservation'),
+                         [f"R{n}|H1|C1|2025-01-01|2025-01-02"
+                          for n in range(3)])
+
+    def test_rollback_records_nothing(self):
+        """Prueba que una transacción descartada no genera eventos."""
+        table = Hotel.table(self.hotel_file)
+        with Transaction(table) as transaction:
+            table.insert(Hotel("H2", "Dos", "Y", 1))
+            transaction.rollback()
+        self.book("R1")
+        self.assertEqual(events.history(self.log, "H2"), [])
+        self.assertEqual(len(events.history(self.log, "R1")), 1)
+
+    def test_events_from_other_processes(self):
+        """Prueba que los eventos de otro proceso no se repiten."""
+        with open(self.log, 'a', encoding='utf-8') as file:
+            file.write(f"{time.time():.6f}|HotelCreated|H2|Dos|Y|1|1\n")
+        with open(self.hotel_file, 'a', encoding='utf-8') as file:
+            file.write("H2|Dos|Y|1|1\n")
+        self.book("R1")
+        self.assertEqual(len(events.history(self.log, "H2")), 1)
+        self.assertEqual(events.replay(self.log).lines('hotel'),
+                         ["H1|Uno|Ciudad X|3|2", "H2|Dos|Y|1|1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Módulo de pruebas para el ordenamiento externo (external_sort.py).
+"""
+
+import unittest
+import os
+import random
+from external_sort import (BY_HOTEL, BY_ID, merge_reservations,
+                           sort_reservations)
+
+
+class TestExternalSort(unittest.TestCase):
+    """Pruebas unitarias para sort_reservations y merge_reservations."""
+
+    def setUp(self):
+        """Configura el entorno de prueba para cada test."""
+        self.first = "data/test_extsort_first.txt"
+        self.second = "data/test_extsort_second.txt"
+        self.target = "data/test_extsort_target.txt"
+        self.tearDown()
+
+    def tearDown(self):
+        """Limpia el entorno de prueba después de cada test."""
+        for f in os.listdir("data"):
+            if f.startswith("test_extsort_"):
+                os.remove(f"data/{f}")
+
+    @staticmethod
+    def write(filename, lines):
+        """Escribe las líneas dadas en un archivo."""
+        with open(filename, 'w', encoding='utf-8') as file:
+            file.writelines(f"{line}\n" for line in lines)
+
+    def read(self):
+        """Lee las líneas del archivo destino."""
+        with open(self.target, 'r', encoding='utf-8') as file:
+            return file.read().splitlines()
+
+    def test_sort_by_hotel_with_small_budget(self):
+        """Prueba el orden por hotel y llegada con varias pasadas."""
+        rng = random.Random(7)
+        lines = [f"R{i}|H{rng.randrange(20)}|C{i % 9}|"
+                 f"2025-03-{rng.randrange(1, 28):02d}|2025-03-28"
+                 for i in range(500)]
+        self.write(self.first, lines + [lines[3], "línea inválida"])
+        report = sort_reservations(self.first, self.target, BY_HOTEL,
+                                   memory=4096, fan_in=3)
+        self.assertGreater(report.runs, 10)
+        self.assertGreater(report.passes, 2)
+        self.assertEqual((report.records, report.duplicates), (500, 1))
+        self.assertEqual(len(report.diagnostics), 1)
+        self.assertEqual(report.diagnostics[0].line_number, 502)
+        self.assertEqual(self.read(), sorted(lines, key=lambda line: (
+            line.split('|')[1], line.split('|')[3], line.split('|')[0])))
+        leftovers = [f for f in os.listdir("data") if f.startswith(".sort_")]
+        self.assertEqual(leftovers, [])
+
+    def test_merge_flags_conflicts(self):
+        """Prueba la combinación: duplicados, conflictos y orden por ID."""
+        self.write(self.first, ["R2|H1|C1|2025-03-01|2025-03-02",
+                                "R1|H1|C1|2025-03-01|2025-03-03"])
+        self.write(self.second, ["R3|H2|C2|2025-04-01|2025-04-02",
+                                 "R1|H1|C1|2025-03-01|2025-03-03",
+                                 "R2|H9|C1|2025-03-01|2025-03-02"])
+        report = merge_reservations([self.first, self.second], self.first,
+                                    BY_ID, memory=64)
+        self.assertFalse(report.ok)
+        self.assertEqual(report.duplicates, 1)
+        conflicts = [(c.reservation_id, c.kept_source, c.source)
+                     for c in report.conflicts]
+        self.assertEqual(conflicts, [("R2", self.first, self.second)])
+        with open(self.first, 'r', encoding='utf-8') as file:
+            self.assertEqual(file.read().splitlines(),
+                             ["R1|H1|C1|2025-03-01|2025-03-03",
+                              "R2|H1|C1|2025-03-01|2025-03-02",
+                              "R3|H2|C2|2025-04-01|2025-04-02"])
+
+    def test_keep_duplicates_and_invalid_order(self):
+        """Prueba unique=False y un orden desconocido."""
+        self.write(self.first, ["R1|H1|C1|2025-03-01|2025-03-03"] * 2)
+        report = sort_reservations(self.first, self.target, BY_ID,
+                                   unique=False)
+        self.assertEqual(report.records, 2)
+        self.assertTrue(report.ok)
+        with self.assertRaises(ValueError):
+            sort_reservations(self.first, self.target, "fecha")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,8 @@ Módulo de pruebas para la clase Hotel.
 import unittest
 import os
 from hotel import Hotel
+from storage import remove_data_files
+from transaction import lock_path
 
 
 class TestHotel(unittest.TestCase):
@@ -19,8 +21,7 @@ class TestHotel(unittest.TestCase):
 
     def tearDown(self):
         """Limpia el entorno de prueba después de cada test."""
-        if os.path.exists(self.test_file):
-            os.remove(self.test_file)
+        remove_data_files([self.test_file, lock_path(self.test_file)])
 
     def test_create_hotel(self):
         """Prueba la creación de un hotel y la detección de duplicados."""
@@ -61,6 +62,13 @@ class TestHotel(unittest.TestCase):
         h.cancel_reservation()
         self.assertEqual(h.rooms_available, h.rooms)
 
+    def test_slots(self):
+        """Prueba que Hotel no tiene __dict__ por instancia."""
+        h = Hotel("H005", "Slots Hotel", "Loc", 1)
+        self.assertFalse(hasattr(h, "__dict__"))
+        with self.assertRaises(AttributeError):
+            setattr(h, "extra", 1)
+
 
 if __name__ == '__main__':
     unittest.main()
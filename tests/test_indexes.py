@@ -0,0 +1,105 @@
+"""
+Módulo de pruebas para los índices secundarios.
+"""
+
+import unittest
+import os
+from hotel import Hotel
+from customer import Customer
+from reservation import Reservation
+from storage import remove_data_files
+from transaction import lock_path
+
+
+class TestIndexes(unittest.TestCase):
+    """Clase de pruebas unitarias para los índices secundarios."""
+
+    def setUp(self):
+        """Configura el entorno de prueba para cada test."""
+        self.res_file = "data/test_idx_reservations_data.txt"
+        self.hotel_file = "data/test_idx_hotels_data.txt"
+        self.cust_file = "data/test_idx_customers_data.txt"
+        self.files = [self.res_file, self.hotel_file, self.cust_file]
+        for f in self.files:
+            if os.path.exists(f):
+                os.remove(f)
+        Hotel.bulk_create_hotels(self.hotel_file, [
+            Hotel("H1", "Uno", "Ciudad X", 5),
+            Hotel("H2", "Dos", "Ciudad Y", 5),
+            Hotel("H3", "Tres", "Ciudad X", 5),
+        ])
+        Customer.bulk_create_customers(self.cust_file, [
+            Customer("C1", "Ana", "555-1", "ana@mail.com"),
+            Customer("C2", "Luis", "555-2", "luis@mail.com"),
+        ])
+        for rid, hid, cid, dates in [
+            ("R1", "H1", "C1", ("2025-03-01", "2025-03-03")),
+            ("R2", "H1", "C2", ("2025-03-02", "2025-03-04")),
+            ("R3", "H2", "C1", ("2025-03-05", "2025-03-06")),
+        ]:
+            Reservation.create_reservation(self.res_file, self.hotel_file,
+                                           self.cust_file,
+                                           Reservation(rid, hid, cid, dates))
+
+    def tearDown(self):
+        """Limpia el entorno de prueba después de cada test."""
+        remove_data_files([*self.files, lock_path(self.files[0])])
+
+    @staticmethod
+    def _ids(records, attr):
+        """Obtiene los IDs ordenados de una lista de registros."""
+        return sorted(getattr(r, attr) for r in records)
+
+    def test_reservation_indexes(self):
+        """Prueba las consultas de reservaciones por hotel, cliente y fecha."""
+        found = Reservation.find_by_hotel(self.res_file, "H1")
+        self.assertEqual(self._ids(found, "reservation_id"), ["R1", "R2"])
+        found = Reservation.find_by_customer(self.res_file, "C1")
+        self.assertEqual(self._ids(found, "reservation_id"), ["R1", "R3"])
+        found = Reservation.find_by_check_in(self.res_file, "2025-03-02",
+                                             "2025-03-05")
+        self.assertEqual([r.reservation_id for r in found], ["R2", "R3"])
+        found = Reservation.find_by_check_in(self.res_file, "2025-03-04")
+        self.assertEqual(found, [])
+
+    def test_reservation_indexes_follow_changes(self):
+        """Prueba que los índices se actualizan al crear y cancelar."""
+        Reservation.find_by_hotel(self.res_file, "H2")
+        Reservation.cancel_reservation(self.res_file, self.hotel_file, "R3")
+        self.assertEqual(Reservation.find_by_hotel(self.res_file, "H2"), [])
+        found = Reservation.find_by_check_in(self.res_file, "2025-03-05")
+        self.assertEqual(found, [])
+        Reservation.create_reservation(
+            self.res_file, self.hotel_file, self.cust_file,
+            Reservation("R4", "H2", "C2", ("2025-03-05", "2025-03-07")))
+        found = Reservation.find_by_hotel(self.res_file, "H2")
+        self.assertEqual(self._ids(found, "reservation_id"), ["R4"])
+
+    def test_customer_indexes_follow_modify(self):
+        """Prueba las consultas de clientes tras modificar su email."""
+        found = Customer.find_by_phone(self.cust_file, "555-2")
+        self.assertEqual(self._ids(found, "customer_id"), ["C2"])
+        c = Customer.find_by_email(self.cust_file, "ana@mail.com")[0]
+        c.modify_customer_info(new_email="ana@nuevo.com")
+        self.assertTrue(Customer.update_customer(self.cust_file, c))
+        found = Customer.find_by_email(self.cust_file, "ana@mail.com")
+        self.assertEqual(found, [])
+        found = Customer.find_by_email(self.cust_file, "ana@nuevo.com")
+        self.assertEqual(self._ids(found, "customer_id"), ["C1"])
+
+    def test_hotel_location_index(self):
+        """Prueba la consulta de hoteles por ubicación."""
+        found = Hotel.find_by_location(self.hotel_file, "Ciudad X")
+        self.assertEqual(self._ids(found, "hotel_id"), ["H1", "H3"])
+        Hotel.delete_hotel(self.hotel_file, "H1")
+        h = Hotel.find_hotel(self.hotel_file, "H2")
+        h.modify_info(new_location="Ciudad X")
+        Hotel.update_hotel(self.hotel_file, h)
+        found = Hotel.find_by_location(self.hotel_file, "Ciudad X")
+        self.assertEqual(self._ids(found, "hotel_id"), ["H2", "H3"])
+        self.assertFalse(Hotel.update_hotel(self.hotel_file,
+                                            Hotel("H9", "N", "L", 1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Módulo de pruebas para la verificación de integridad (integrity.py).
+"""
+
+import unittest
+from hotel import Hotel
+from customer import Customer
+from integrity import check_integrity
+from reservation import Reservation
+from storage import close_all, remove_data_files
+from transaction import lock_path
+
+
+class TestIntegrity(unittest.TestCase):
+    """Clase de pruebas unitarias para check_integrity."""
+
+    def setUp(self):
+        """Configura el entorno de prueba para cada test."""
+        self.hotel_file = "data/test_integ_hotels_data.txt"
+        self.cust_file = "data/test_integ_customers_data.txt"
+        self.res_file = "data/test_integ_reservations_data.txt"
+        self.files = [self.hotel_file, self.cust_file, self.res_file]
+        self.tearDown()
+        Hotel.create_hotel(self.hotel_file, Hotel("H1", "Uno", "Loc", 5))
+        Hotel.create_hotel(self.hotel_file, Hotel("H2", "Dos", "Loc", 3))
+        Customer.create_customer(self.cust_file,
+                                 Customer("C1", "N", "555", "c@m.com"))
+        Customer.create_customer(self.cust_file,
+                                 Customer("C2", "M", "556", "d@m.com"))
+        stays = [("H1", "C1"), ("H1", "C2"), ("H2", "C2")]
+        for i, (hotel_id, customer_id) in enumerate(stays):
+            Reservation.create_reservation(
+                self.res_file, self.hotel_file, self.cust_file,
+                Reservation(f"R{i}", hotel_id, customer_id,
+                            ("2025-01-01", "2025-01-02")))
+
+    def tearDown(self):
+        """Limpia el entorno de prueba después de cada test."""
+        close_all()
+        remove_data_files([*self.files, lock_path(self.files[0])])
+
+    def _check(self, repair=False):
+        """Verifica los archivos de prueba."""
+        return check_integrity(self.hotel_file, self.cust_file,
+                               self.res_file, repair)
+
+    def test_consistent_files(self):
+        """Prueba que unos archivos consistentes no reportan problemas."""
+        report = self._check()
+        self.assertTrue(report.ok)
+        self.assertEqual(report.checked, 7)
+
+    def test_orphans(self):
+        """Prueba que se detectan reservaciones huérfanas tras una baja."""
+        Hotel.delete_hotel(self.hotel_file, "H2")
+        Customer.delete_customer(self.cust_file, "C2")
+        report = self._check()
+        self.assertEqual(report.missing_hotel, ["R2"])
+        self.assertEqual(report.missing_customer, ["R1", "R2"])
+        self.assertFalse(report.ok)
+
+    def test_counter_repair(self):
+        """Prueba la detección y reconstrucción de rooms_available."""
+        hotel = Hotel.find_hotel(self.hotel_file, "H1")
+        hotel.rooms_available = 5
+        Hotel.update_hotel(self.hotel_file, hotel)
+        report = self._check()
+        self.assertEqual(report.counter_mismatches, [("H1", 5, 3)])
+        self.assertEqual(report.repaired, 0)
+
+        report = self._check(repair=True)
+        self.assertEqual(report.repaired, 1)
+        close_all()
+        hotel = Hotel.find_hotel(self.hotel_file, "H1")
+        self.assertEqual(hotel.rooms_available, 3)
+        self.assertTrue(self._check().ok)
+
+    def test_consistent_after_cancel(self):
+        """Prueba que reservar y cancelar en otras fechas no deja problemas."""
+        Hotel.create_hotel(self.hotel_file, Hotel("H3", "Tres", "Loc", 2))
+        for rid, dates in (("R10", ("2025-01-10", "2025-01-12")),
+                           ("R11", ("2025-02-10", "2025-02-12")),
+                           ("R12", ("2025-02-11", "2025-02-13"))):
+            self.assertTrue(Reservation.create_reservation(
+                self.res_file, self.hotel_file, self.cust_file,
+                Reservation(rid, "H3", "C1", dates)))
+        Reservation.cancel_reservation(self.res_file, self.hotel_file, "R12")
+        self.assertEqual(
+            Hotel.find_hotel(self.hotel_file, "H3").rooms_available, 1)
+        report = self._check()
+        self.assertTrue(report.ok, report.counter_mismatches)
+
+
+if __name__ == "__main__":
+    unittest.main()
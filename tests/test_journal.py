@@ -0,0 +1,107 @@
+"""
+Módulo de pruebas para el modo registro (journal) de las tablas.
+"""
+
+import unittest
+import os
+from hotel import Hotel
+from journal import Journal, journal_path
+from storage import RecordTable, remove_data_files
+from transaction import Transaction, lock_path
+
+
+class TestJournal(unittest.TestCase):
+    """Clase de pruebas unitarias para Journal y el modo registro."""
+
+    def setUp(self):
+        """Configura el entorno de prueba para cada test."""
+        self.test_file = "data/test_journal_hotels_data.txt"
+        self.log_file = journal_path(self.test_file)
+        self._clean()
+        Hotel.create_hotel(self.test_file, Hotel("H1", "Uno", "Loc", 3))
+        self.table = Hotel.table(self.test_file)
+        self.table.enable_journal(compact_every=3, durable=False)
+
+    def tearDown(self):
+        """Limpia el entorno de prueba después de cada test."""
+        self.table.disable_journal()
+        self._clean()
+
+    def _clean(self):
+        """Elimina los archivos de prueba."""
+        remove_data_files([self.test_file, lock_path(self.test_file)])
+
+    def _fresh_table(self):
+        """Abre una tabla independiente sobre el mismo archivo."""
+        return RecordTable(self.test_file, Hotel.from_line,
+                           lambda h: h.hotel_id)
+
+    def test_mutations_append_to_log(self):
+        """Prueba que los cambios se anexan sin reescribir el archivo."""
+        Hotel.create_hotel(self.test_file, Hotel("H2", "Dos", "Loc", 4))
+        Hotel.delete_hotel(self.test_file, "H1")
+        with open(self.test_file, 'r', encoding='utf-8') as file:
+            self.assertEqual(file.read(), "H1|Uno|Loc|3|3\n")
+        with open(self.log_file, 'r', encoding='utf-8') as file:
+            self.assertEqual(file.read(), "I|H2|Dos|Loc|4|4\nD|H1\n")
+
+        replayed = self._fresh_table()
+        self.assertNotIn("H1", replayed)
+        self.assertEqual(replayed.get("H2").rooms, 4)
+
+    def test_compaction(self):
+        """Prueba que el registro se compacta al llegar al límite."""
+        for i in range(2, 5):
+            Hotel.create_hotel(self.test_file, Hotel(f"H{i}", "X", "Loc", 1))
+        self.assertEqual(self.table.journal.entries, 0)
+        self.assertEqual(os.path.getsize(self.log_file), 0)
+        self.assertEqual(len(self._fresh_table()), 4)
+
+    def test_replace_compacts_on_commit(self):
+        """Prueba que replace() en una transacción compacta al confirmar."""
+        with self.assertRaises(RuntimeError):
+            with Transaction(self.table):
+                self.table.replace([Hotel("H9", "Nueve", "Loc", 1)])
+                raise RuntimeError("falla")
+        self.assertEqual(sorted(h.hotel_id for h in self.table.values()),
+                         ["H1"])
+        with Transaction(self.table):
+            self.table.replace([Hotel("H9", "Nueve", "Loc", 1)])
+            with open(self.test_file, 'r', encoding='utf-8') as file:
+                self.assertEqual(file.read(), "H1|Uno|Loc|3|3\n")
+            self.table.insert(Hotel("H8", "Ocho", "Loc", 1))
+        self.assertEqual(os.path.getsize(self.log_file), 0)
+        replayed = self._fresh_table()
+        self.assertEqual(sorted(h.hotel_id for h in replayed.values()),
+                         ["H8", "H9"])
+
+    def test_torn_write_is_ignored(self):
+        """Prueba que una línea incompleta al final del registro se ignora."""
+        Hotel.create_hotel(self.test_file, Hotel("H2", "Dos", "Loc", 4))
+        with open(self.log_file, 'a', encoding='utf-8') as file:
+            file.write("I|H3|Tres|Lo")
+        replayed = self._fresh_table()
+        self.assertIn("H2", replayed)
+        self.assertNotIn("H3", replayed)
+
+    def test_append_after_torn_write(self):
+        """Prueba que anexar tras una línea incompleta no la une a la nueva."""
+        Hotel.create_hotel(self.test_file, Hotel("H2", "Dos", "Loc", 4))
+        with open(self.log_file, 'a', encoding='utf-8') as file:
+            file.write("I|H3|Tres|Lo")
+        Journal(self.log_file).append("I", "H4|Cuatro|Loc|1|1")
+        with open(self.log_file, 'r', encoding='utf-8') as file:
+            self.assertTrue(file.read().endswith("\nI|H4|Cuatro|Loc|1|1\n"))
+        replayed = self._fresh_table()
+        self.assertEqual((replayed.get("H4").name, "H3" in replayed),
+                         ("Cuatro", False))
+
+    def test_replay_is_idempotent(self):
+        """Prueba que repetir el registro sobre la instantánea no duplica."""
+        journal = Journal(self.log_file, durable=False)
+        journal.append("I", "H1|Uno|Loc|3|2")
+        self.assertEqual(self._fresh_table().get("H1").rooms_available, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+Módulo de pruebas para la carga en paralelo (loader.py).
+"""
+
+import unittest
+import os
+from unittest import mock
+import loader
+from hotel import Hotel
+from loader import line_ranges, load_file
+from storage import close_all
+
+
+class TestLoader(unittest.TestCase):
+    """Clase de pruebas unitarias para la carga por rangos de bytes."""
+
+    def setUp(self):
+        """Configura el entorno de prueba para cada test."""
+        self.hotel_file = "data/test_loader_hotels_data.txt"
+        if os.path.exists(self.hotel_file):
+            os.remove(self.hotel_file)
+        with open(self.hotel_file, 'wb') as file:
+            for i in range(200):
+                line = f"H{i}|Hotel ñ {i}|Ciudad|{i}|{i}\n"
+                file.write(line.encode('utf-8'))
+                if i == 50:
+                    file.write(b"linea invalida\n")
+                if i == 120:
+                    file.write(b"\n")
+                    file.write(b"H999|\xff|Ciudad|1|1\n")
+        close_all()
+
+    def tearDown(self):
+        """Limpia el entorno de prueba después de cada test."""
+        close_all()
+        if os.path.exists(self.hotel_file):
+            os.remove(self.hotel_file)
+
+    def test_ranges_on_line_boundaries(self):
+        """Prueba que los rangos cubren el archivo y empiezan en una línea."""
+        ranges = line_ranges(self.hotel_file, 7)
+        self.assertEqual(ranges[0][0], 0)
+        self.assertEqual(ranges[-1][1], os.path.getsize(self.hotel_file))
+        with open(self.hotel_file, 'rb') as file:
+            data = file.read()
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(end, start)
+            self.assertEqual(data[start - 1:start], b"\n")
+
+    def test_report(self):
+        """Prueba que las líneas inválidas quedan en el reporte."""
+        records, report = load_file(self.hotel_file, Hotel.from_line)
+        self.assertEqual(len(records), 200)
+        self.assertEqual(report.lines, 203)
+        self.assertEqual([d.line_number for d in report.diagnostics],
+                         [52, 124])
+        with open(self.hotel_file, 'rb') as file:
+            file.seek(report.diagnostics[0].offset)
+            self.assertEqual(file.readline(), b"linea invalida\n")
+        self.assertFalse(report.ok)
+        self.assertEqual(report.to_dict()["diagnostics"][0]["line"],
+                         "linea invalida")
+
+    def test_parallel_matches_sequential(self):
+        """Prueba que la carga en paralelo conserva orden y diagnósticos."""
+        records, report = load_file(self.hotel_file, Hotel.from_line)
+        with mock.patch.object(loader, "PARALLEL_MIN_BYTES", 0), \
+                mock.patch.object(loader, "BLOCK_BYTES", 256):
+            parallel, parallel_report = load_file(
+                self.hotel_file, Hotel.from_line, workers=2)
+        self.assertGreater(parallel_report.chunks, 1)
+        self.assertEqual([h.hotel_id for h in parallel],
+                         [h.hotel_id for h in records])
+        self.assertEqual(parallel_report.diagnostics, report.diagnostics)
+
+    def test_table_report(self):
+        """Prueba que la tabla guarda el reporte de su última carga."""
+        with mock.patch('builtins.print') as printed:
+            hotels = Hotel.load_hotels(self.hotel_file, workers=2)
+        self.assertEqual(len(hotels), 200)
+        self.assertEqual(printed.call_count, 1)
+        report = Hotel.table(self.hotel_file).load_report
+        self.assertEqual(len(report.diagnostics), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
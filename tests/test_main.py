@@ -0,0 +1,130 @@
+"""
+Módulo de pruebas para la línea de comandos (main.py).
+"""
+
+import unittest
+import io
+import os
+import subprocess
+import sys
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+from main import main
+from storage import close_all, remove_data_files
+from transaction import lock_path
+
+
+class TestMain(unittest.TestCase):
+    """Clase de pruebas unitarias para los subcomandos y el modo batch."""
+
+    def setUp(self):
+        """Configura el entorno de prueba para cada test."""
+        self.hotel_file = "data/test_main_hotels.txt"
+        self.cust_file = "data/test_main_customers.txt"
+        self.res_file = "data/test_main_reservations.txt"
+        self.tearDown()
+        with open(self.hotel_file, 'w', encoding='utf-8') as file:
+            file.write("H1|Uno|Ciudad X|2|2\n")
+        with open(self.cust_file, 'w', encoding='utf-8') as file:
+            file.write("C1|Ana|555|ana@mail.com\n")
+
+    def tearDown(self):
+        """Limpia el entorno de prueba después de cada test."""
+        close_all()
+        for f in os.listdir("data"):
+            if f.startswith("test_main_"):
+                os.remove(f"data/{f}")
+        remove_data_files([lock_path(self.res_file)])
+
+    def run_main(self, *argv, stdin=""):
+        """Ejecuta main() y devuelve el código de salida y lo impreso."""
+        out = io.StringIO()
+        files = ["--hotels", self.hotel_file, "--customers", self.cust_file,
+                 "--reservations", self.res_file]
+        with mock.patch("sys.stdin", io.StringIO(stdin)), \
+                redirect_stdout(out), redirect_stderr(io.StringIO()):
+            code = main([*files, *argv])
+        close_all()
+        return code, out.getvalue()
+
+    def test_subcommands(self):
+        """Prueba crear, modificar, mostrar, reservar, cancelar y eliminar."""
+        self.assertEqual(self.run_main("hotel", "create", "H2", "Dos",
+                                       "Ciudad Y", "3")[0], 0)
+        self.assertEqual(self.run_main("hotel", "modify", "H2",
+                                       "--rooms", "4")[0], 0)
+        self.assertEqual(self.run_main("hotel", "show", "H2"),
+                         (0, "H2|Dos|Ciudad Y|4|4\n"))
+        self.assertEqual(self.run_main("customer", "modify", "C1",
+                                       "--phone", "999")[0], 0)
+        self.assertEqual(self.run_main("customer", "show", "C1"),
+                         (0, "C1|Ana|999|ana@mail.com\n"))
+        self.assertEqual(self.run_main("reservation", "book", "R1", "H2", "C1",
+                                       "2025-03-01", "2025-03-03")[0], 0)
+        self.assertEqual(self.run_main("reservation", "show", "R1"),
+                         (0, "R1|H2|C1|2025-03-01|2025-03-03\n"))
+        code, out = self.run_main("search", "Ciudad Y", "2025-03-01",
+                                  "2025-03-02")
+        self.assertEqual(code, 0)
+        self.assertIn("H2|Dos|Ciudad Y|3 de 4 libres", out)
+        self.assertEqual(self.run_main("reservation", "cancel", "R1")[0], 0)
+        self.assertEqual(self.run_main("reservation", "show", "R1")[0], 1)
+        self.assertEqual(self.run_main("customer", "delete", "C1")[0], 0)
+        self.assertEqual(self.run_main("hotel", "show", "H9")[0], 1)
+
+    def test_batch(self):
+        """Prueba el modo batch: comandos válidos, inválidos y comentarios."""
+        commands = ("# reservaciones\n"
+                    "reservation book R1 H1 C1 2025-03-01 2025-03-03\n"
+                    "\n"
+                    "hotel bogus\n"
+                    "reservation book R2 H1 C1 2025-03-02 2025-03-04\n"
+                    "reservation book R3 H1 C1 2025-03-02 2025-03-03\n"
+                    "hotel show H1\n")
+        code, out = self.run_main("batch", "--commit-every", "2",
+                                  stdin=commands)
+        self.assertEqual(code, 1)
+        self.assertIn("H1|Uno|Ciudad X|2|0", out)
+        with open(self.res_file, 'r', encoding='utf-8') as file:
+            self.assertEqual([line.split('|')[0] for line in file],
+                             ["R1", "R2"])
+
+    def test_batch_holds_lock(self):
+        """Prueba que cada bloque del modo batch se ejecuta con el candado."""
+        probe = ("import fcntl, os; "
+                 "fd = os.open('data/.lock', os.O_RDWR | os.O_CREAT); "
+                 "fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)")
+        probes = []
+
+        def commands():
+            yield "hotel create H2 Dos Y 1\n"
+            probes.append(subprocess.run(
+                [sys.executable, "-c", probe], capture_output=True,
+                check=False).returncode)
+            yield "hotel show H2\n"
+
+        files = ["--hotels", self.hotel_file, "--customers", self.cust_file,
+                 "--reservations", self.res_file]
+        with mock.patch("sys.stdin", commands()), \
+                redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+            self.assertEqual(main([*files, "batch"]), 0)
+        close_all()
+        self.assertNotEqual(probes, [0])
+        with open(self.hotel_file, 'r', encoding='utf-8') as file:
+            self.assertIn("H2|Dos|Y|1|1\n", file.read())
+
+    def test_show_imports_only_its_module(self):
+        """Prueba que un subcomando de consulta no importe módulos ajenos."""
+        script = ("import sys, main; "
+                  "main.main(['--hotels', %r, 'hotel', 'show', 'H1']); "
+                  "print(sorted(m for m in ('reservation', 'customer', "
+                  "'database', 'multiprocessing', 'search') "
+                  "if m in sys.modules))" % self.hotel_file)
+        out = subprocess.run([sys.executable, "-c", script],
+                             capture_output=True, text=True,
+                             check=True).stdout
+        self.assertEqual(out.splitlines()[-1], "[]")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Módulo de pruebas para la instrumentación (metrics.py).
+"""
+
+import json
+import unittest
+import os
+import metrics
+from hotel import Hotel
+from customer import Customer
+from reservation import Reservation
+from storage import close_all, remove_data_files
+from transaction import lock_path
+
+
+class TestMetrics(unittest.TestCase):
+    """Clase de pruebas unitarias para los contadores e histogramas."""
+
+    def setUp(self):
+        """Configura el entorno de prueba para cada test."""
+        self.hotel_file = "data/test_metrics_hotels_data.txt"
+        self.cust_file = "data/test_metrics_customers_data.txt"
+        self.res_file = "data/test_metrics_reservations_data.txt"
+        self.out_file = "data/test_metrics_out.txt"
+        self.files = [self.hotel_file, self.cust_file, self.res_file,
+                      self.out_file]
+        self.tearDown()
+        Hotel.create_hotel(self.hotel_file, Hotel("H1", "Uno", "Loc", 5))
+        Customer.create_customer(self.cust_file,
+                                 Customer("C1", "N", "555", "c@m.com"))
+        close_all()
+        metrics.reset()
+
+    def tearDown(self):
+        """Limpia el entorno de prueba después de cada test."""
+        metrics.disable()
+        metrics.reset()
+        close_all()
+        remove_data_files([*self.files, lock_path(self.files[0])])
+
+    def book(self):
+        """Crea una reservación de prueba."""
+        return Reservation.create_reservation(
+            self.res_file, self.hotel_file, self.cust_file,
+            Reservation("R1", "H1", "C1", ("2025-01-01", "2025-01-02")))
+
+    def test_disabled_records_nothing(self):
+        """Prueba que sin activar no se registra nada."""
+        self.assertTrue(self.book())
+        self.assertEqual(metrics.snapshot(),
+                         {"counters": [], "histograms": []})
+
+    def test_create_reservation_breakdown(self):
+        """Prueba el desglose de tiempos y bytes de una reservación."""
+        metrics.enable()
+        self.assertTrue(self.book())
+        operation = metrics.histogram('operation_seconds',
+                                      op='create_reservation')
+        self.assertEqual(operation.count, 1)
+        for name in ("test_metrics_hotels_data.txt",
+                     "test_metrics_customers_data.txt"):
+            load = metrics.histogram('load_seconds', file=name)
+            self.assertEqual(load.count, 1)
+            self.assertEqual(
+                metrics.counter('records_parsed_total', file=name), 1)
+            self.assertGreater(
+                metrics.counter('bytes_read_total', file=name), 0)
+        self.assertEqual(metrics.histogram('lock_wait_seconds').count, 1)
+        self.assertEqual(metrics.histogram('commit_seconds').count, 1)
+        written = metrics.counter('bytes_written_total',
+                                  file="test_metrics_hotels_data.txt")
+        self.assertEqual(written, os.path.getsize(self.hotel_file))
+
+    def test_exports(self):
+        """Prueba la exportación en JSON y en texto de Prometheus."""
+        metrics.enable()
+        self.book()
+        metrics.dump(self.out_file)
+        with open(self.out_file, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+        self.assertIn("operation_seconds",
+                      [h["name"] for h in data["histograms"]])
+
+        metrics.write_prometheus(self.out_file)
+        with open(self.out_file, 'r', encoding='utf-8') as file:
+            text = file.read()
+        self.assertIn("# TYPE reservations_operation_seconds histogram", text)
+        self.assertIn('reservations_operation_seconds_bucket'
+                      '{op="create_reservation",le="+Inf"} 1', text)
+        self.assertIn('reservations_operation_seconds_count'
+                      '{op="create_reservation"} 1', text)
+
+
+if __name__ == "__main__":
+    unittest.main()
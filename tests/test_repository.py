@@ -0,0 +1,73 @@
+"""
+Módulo de pruebas para la clase Repository.
+"""
+
+import unittest
+import os
+from repository import Repository
+from hotel import Hotel
+from customer import Customer
+from reservation import Reservation
+from storage import remove_data_files
+from transaction import lock_path
+
+
+class TestRepository(unittest.TestCase):
+    """Clase de pruebas unitarias para Repository."""
+
+    def setUp(self):
+        """Configura el entorno de prueba para cada test."""
+        self.res_file = "data/test_repo_reservations_data.txt"
+        self.hotel_file = "data/test_repo_hotels_data.txt"
+        self.cust_file = "data/test_repo_customers_data.txt"
+        self.files = [self.res_file, self.hotel_file, self.cust_file]
+        for f in self.files:
+            if os.path.exists(f):
+                os.remove(f)
+
+    def tearDown(self):
+        """Limpia el entorno de prueba después de cada test."""
+        remove_data_files([*self.files, lock_path(self.files[0])])
+
+    def test_flush_on_exit(self):
+        """Prueba que los cambios se escriben solo al cerrar el repositorio."""
+        with Repository(self.hotel_file, self.cust_file,
+                        self.res_file) as repo:
+            self.assertTrue(repo.create_hotel(Hotel("H1", "Uno", "Loc", 3)))
+            self.assertTrue(repo.create_customer(
+                Customer("C1", "Cliente", "555", "c@mail.com")))
+            self.assertTrue(repo.create_reservation(
+                Reservation("R1", "H1", "C1", ("2025-01-01", "2025-01-02"))))
+            self.assertFalse(os.path.exists(self.res_file))
+            self.assertEqual(repo.hotels.get("H1").rooms_available, 2)
+
+        hotels = Hotel.load_hotels(self.hotel_file)
+        self.assertEqual(hotels[0].rooms_available, 2)
+        self.assertEqual(len(Reservation.load_reservations(self.res_file)), 1)
+
+    def test_flush_every(self):
+        """Prueba la política de escritura cada N cambios."""
+        with Repository(self.hotel_file, self.cust_file, self.res_file,
+                        flush_every=2) as repo:
+            repo.create_hotel(Hotel("H1", "Uno", "Loc", 3))
+            self.assertFalse(os.path.exists(self.hotel_file))
+            repo.create_hotel(Hotel("H2", "Dos", "Loc", 3))
+            self.assertTrue(os.path.exists(self.hotel_file))
+
+    def test_external_change_reloads(self):
+        """Prueba que un cambio externo al archivo se detecta."""
+        Hotel.create_hotel(self.hotel_file, Hotel("H1", "Uno", "Loc", 3))
+        with open(self.hotel_file, 'a', encoding='utf-8') as file:
+            file.write("H2|Dos|Loc|4|4\n")
+        self.assertIn("H2", Hotel.table(self.hotel_file))
+
+    def test_loaded_copies_are_independent(self):
+        """Prueba que modificar un objeto cargado no altera la tabla."""
+        Hotel.create_hotel(self.hotel_file, Hotel("H1", "Uno", "Loc", 3))
+        Hotel.load_hotels(self.hotel_file)[0].reserve_room()
+        hotel = Hotel.load_hotels(self.hotel_file)[0]
+        self.assertEqual(hotel.rooms_available, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,6 +9,8 @@ import os
 from reservation import Reservation
 from hotel import Hotel
 from customer import Customer
+from storage import remove_data_files
+from transaction import lock_path
 
 
 class TestReservation(unittest.TestCase):
@@ -32,9 +34,8 @@ class TestReservation(unittest.TestCase):
 
     def tearDown(self):
         """Limpia el entorno de prueba después de cada test."""
-        for f in [self.res_file, self.hotel_file, self.cust_file]:
-            if os.path.exists(f):
-                os.remove(f)
+        remove_data_files([self.res_file, self.hotel_file, self.cust_file,
+                           lock_path(self.res_file)])
 
     def test_create_reservation_ok(self):
         """Prueba la creación exitosa de una reservación."""
@@ -93,6 +94,49 @@ class TestReservation(unittest.TestCase):
             if h.hotel_id == "H10":
                 self.assertEqual(h.rooms_available, 2)
 
+    def test_dates_stored_as_ordinals(self):
+        """Prueba que las fechas ISO se guardan como ordinales."""
+        r = Reservation("R14", "H10", "C10", ("2025-01-01", "2025-01-05"))
+        self.assertEqual(r.check_in, "2025-01-01")
+        self.assertEqual(r.nights()[1] - r.nights()[0], 4)
+        self.assertFalse(hasattr(r, "__dict__"))
+
+        legacy = Reservation("R15", "H10", "C10", ("pendiente", "2025-01-05"))
+        self.assertEqual(legacy.to_line(), "R15|H10|C10|pendiente|2025-01-05")
+        self.assertRaises(ValueError, legacy.nights)
+
+    def test_group_booking_all_or_nothing(self):
+        """Prueba que un grupo se reserva completo o no se reserva."""
+        Hotel.create_hotel(self.hotel_file,
+                           Hotel("H11", "Otro", "TestCity", 3))
+        dates = ("2025-02-01", "2025-02-03")
+        too_many = Reservation.group("G1", "H10", "C10", dates, 2) + \
+            Reservation.group("G2", "H11", "C10", dates, 4)
+        self.assertFalse(Reservation.create_group_booking(
+            self.res_file, self.hotel_file, self.cust_file, too_many))
+        self.assertEqual(Reservation.load_reservations(self.res_file), [])
+        hotel = Hotel.find_hotel(self.hotel_file, "H10")
+        self.assertEqual(hotel.rooms_available, 2)
+
+        block = Reservation.group("G1", "H10", "C10", dates, 2) + \
+            Reservation.group("G2", "H11", "C10", dates, 3)
+        self.assertTrue(Reservation.create_group_booking(
+            self.res_file, self.hotel_file, self.cust_file, block))
+        self.assertEqual(len(Reservation.load_reservations(self.res_file)), 5)
+        hotel = Hotel.find_hotel(self.hotel_file, "H11")
+        self.assertEqual(hotel.rooms_available, 0)
+        found = Reservation.find_reservation(self.res_file, "G2-003")
+        self.assertEqual(found.hotel_id, "H11")
+
+    def test_group_booking_rejects_repeated_ids(self):
+        """Prueba que un grupo con IDs repetidos se rechaza completo."""
+        dates = ("2025-02-01", "2025-02-03")
+        block = [Reservation("G1", "H10", "C10", dates),
+                 Reservation("G1", "H10", "C10", dates)]
+        self.assertFalse(Reservation.create_group_booking(
+            self.res_file, self.hotel_file, self.cust_file, block))
+        self.assertIsNone(Reservation.find_reservation(self.res_file, "G1"))
+
 
 if __name__ == '__main__':
     unittest.main()
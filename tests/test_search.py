@@ -0,0 +1,85 @@
+"""
+Módulo de pruebas para la búsqueda de disponibilidad (search.py).
+"""
+
+import unittest
+import os
+from hotel import Hotel
+from reservation import Reservation
+from search import search_hotels
+from shards import split_file
+from storage import close_all, remove_data_files
+from transaction import lock_path
+
+
+class TestSearch(unittest.TestCase):
+    """Clase de pruebas unitarias para search_hotels."""
+
+    def setUp(self):
+        """Configura el entorno de prueba para cada test."""
+        self.hotel_file = "data/test_search_hotels.txt"
+        self.res_file = "data/test_search_reservations.txt"
+        self.manifest = "data/test_search_reservations.shards"
+        self.tearDown()
+        with open(self.hotel_file, 'w', encoding='utf-8') as file:
+            file.write("H1|Uno|Ciudad X|2|2\n")
+            file.write("H2|Dos|Ciudad X|3|3\n")
+            file.write("H3|Tres|Ciudad X|3|3\n")
+            file.write("H4|Cuatro|Ciudad Y|9|9\n")
+        with open(self.res_file, 'w', encoding='utf-8') as file:
+            file.write("R1|H1|C1|2025-03-01|2025-03-03\n")
+            file.write("R2|H2|C1|2025-03-02|2025-03-04\n")
+            file.write("R3|H2|C1|2025-03-02|2025-03-03\n")
+
+    def tearDown(self):
+        """Limpia el entorno de prueba después de cada test."""
+        close_all()
+        names = [self.hotel_file, self.res_file, self.manifest]
+        names += [f"data/{n}" for n in os.listdir("data")
+                  if n.startswith("test_search_reservations.")]
+        names.append(lock_path(self.hotel_file))
+        remove_data_files(names)
+
+    def test_ranked_by_free_rooms(self):
+        """Prueba el filtro por ubicación y habitaciones y el orden."""
+        page = search_hotels(self.hotel_file, self.res_file, "Ciudad X",
+                             "2025-03-02", "2025-03-04")
+        self.assertEqual([(m.hotel_id, m.free_rooms) for m in page.results],
+                         [("H3", 3), ("H1", 1), ("H2", 1)])
+        page = search_hotels(self.hotel_file, self.res_file, "Ciudad X",
+                             "2025-03-02", "2025-03-04", min_rooms=2)
+        self.assertEqual([m.hotel_id for m in page.results], ["H3"])
+        page = search_hotels(self.hotel_file, self.res_file, "Ciudad Z",
+                             "2025-03-02", "2025-03-04")
+        self.assertEqual((page.results, page.total), ([], 0))
+
+    def test_pagination(self):
+        """Prueba que las páginas parten los resultados ordenados."""
+        first = search_hotels(self.hotel_file, self.res_file, None,
+                              "2025-03-10", "2025-03-11", page_size=3)
+        second = search_hotels(self.hotel_file, self.res_file, None,
+                               "2025-03-10", "2025-03-11", page=2, page_size=3)
+        self.assertEqual(first.total, 4)
+        self.assertEqual([m.hotel_id for m in first.results + second.results],
+                         ["H4", "H2", "H3", "H1"])
+        with self.assertRaises(ValueError):
+            search_hotels(self.hotel_file, self.res_file, None, "2025-03-10",
+                          "2025-03-11", page=0)
+
+    def test_follows_bookings_and_shards(self):
+        """Prueba que la búsqueda ve reservaciones nuevas y particiones."""
+        split_file(self.res_file, self.manifest, buckets=2)
+        Hotel.create_hotel(self.hotel_file,
+                           Hotel("H5", "Cinco", "Ciudad X", 1))
+        reservations = Reservation.load_reservations(self.manifest)
+        reservations.append(
+            Reservation("R4", "H3", "C1", ("2025-03-03", "2025-03-04")))
+        Reservation.save_reservations(self.manifest, reservations)
+        page = search_hotels(self.hotel_file, self.manifest, "Ciudad X",
+                             "2025-03-02", "2025-03-04")
+        self.assertEqual([(m.hotel_id, m.free_rooms) for m in page.results],
+                         [("H3", 2), ("H1", 1), ("H2", 1), ("H5", 1)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Módulo de pruebas para el servicio asíncrono de reservaciones.
+"""
+
+import asyncio
+import json
+import unittest
+import os
+from hotel import Hotel
+from customer import Customer
+from reservation import Reservation
+from service import BookingService
+from storage import remove_data_files
+from transaction import lock_path
+
+
+class TestBookingService(unittest.TestCase):
+    """Clase de pruebas unitarias para BookingService."""
+
+    def setUp(self):
+        """Configura el entorno de prueba para cada test."""
+        self.res_file = "data/test_svc_reservations_data.txt"
+        self.hotel_file = "data/test_svc_hotels_data.txt"
+        self.cust_file = "data/test_svc_customers_data.txt"
+        self.files = [self.res_file, self.hotel_file, self.cust_file]
+        for f in self.files:
+            if os.path.exists(f):
+                os.remove(f)
+        Hotel.create_hotel(self.hotel_file, Hotel("H1", "Uno", "Loc", 50))
+        Customer.create_customer(self.cust_file,
+                                 Customer("C1", "N", "555", "c@m.com"))
+        self.service = BookingService(self.res_file, self.hotel_file,
+                                      self.cust_file)
+
+    def tearDown(self):
+        """Limpia el entorno de prueba después de cada test."""
+        remove_data_files([*self.files, lock_path(self.files[0])])
+
+    def test_concurrent_bookings_are_batched(self):
+        """Prueba que las solicitudes concurrentes se confirman por lotes."""
+        async def scenario():
+            async with self.service as service:
+                requests = [
+                    service.book(Reservation(f"R{i}", "H1", "C1",
+                                             ("2025-05-01", "2025-05-02")))
+                    for i in range(60)
+                ]
+                results = await asyncio.gather(*requests)
+                canceled = await service.cancel("R0")
+            return results, canceled
+
+        results, canceled = asyncio.run(scenario())
+        self.assertEqual(results.count(True), 50)
+        self.assertTrue(canceled)
+        self.assertEqual(self.service.requests, 61)
+        self.assertLess(self.service.batches, 61)
+        self.assertEqual(len(Reservation.load_reservations(self.res_file)), 49)
+
+    def test_tcp_protocol(self):
+        """Prueba el protocolo de líneas JSON por TCP."""
+        async def scenario():
+            async with self.service as service:
+                server = await asyncio.start_server(service.handle_client,
+                                                    "127.0.0.1", 0)
+                port = server.sockets[0].getsockname()[1]
+                async with server:
+                    reader, writer = await asyncio.open_connection(
+                        "127.0.0.1", port)
+                    lines = [
+                        {"op": "book", "reservation_id": "R1",
+                         "hotel_id": "H1", "customer_id": "C1",
+                         "check_in": "2025-05-01", "check_out": "2025-05-03"},
+                        {"op": "cancel", "reservation_id": "R9"},
+                        {"op": "book"},
+                    ]
+                    responses = []
+                    for line in lines:
+                        writer.write((json.dumps(line) + "\n").encode('utf-8'))
+                        await writer.drain()
+                        responses.append(json.loads(await reader.readline()))
+                    writer.close()
+                    await writer.wait_closed()
+            return responses
+
+        responses = asyncio.run(scenario())
+        self.assertEqual(responses[0], {"ok": True})
+        self.assertEqual(responses[1], {"ok": False})
+        self.assertFalse(responses[2]["ok"])
+        self.assertIn("error", responses[2])
+
+
+if __name__ == '__main__':
+    unittest.main()
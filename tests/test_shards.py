@@ -0,0 +1,188 @@
+"""
+Módulo de pruebas para las reservaciones particionadas (shards.py).
+"""
+
+import glob
+import unittest
+import os
+from hotel import Hotel
+from customer import Customer
+from reservation import Reservation
+from service import BookingService
+from shards import (HOTEL, ShardManifest, ids_path, join_file, map_shards,
+                    shard_for, split_file)
+from storage import close_all, is_open, remove_data_files
+from transaction import lock_path
+
+
+def count_lines(path):
+    """Cuenta las líneas de una partición (se ejecuta en otro proceso)."""
+    if not os.path.exists(path):
+        return 0
+    with open(path, 'r', encoding='utf-8') as file:
+        return sum(1 for line in file if line.strip())
+
+
+class TestShards(unittest.TestCase):
+    """Clase de pruebas unitarias para el particionamiento por hotel."""
+
+    def setUp(self):
+        """Configura el entorno de prueba para cada test."""
+        self.res_file = "data/test_shard_reservations_data.txt"
+        self.manifest = "data/test_shard_reservations.shards"
+        self.joined = "data/test_shard_joined.txt"
+        self.hotel_file = "data/test_shard_hotels_data.txt"
+        self.cust_file = "data/test_shard_customers_data.txt"
+        self.tearDown()
+        with open(self.res_file, 'w', encoding='utf-8') as file:
+            for i in range(12):
+                file.write(f"R{i}|H{i % 3}|C1|2025-01-01|2025-01-02\n")
+        for i in range(3):
+            Hotel.create_hotel(self.hotel_file,
+                               Hotel(f"H{i}", "Hotel", "Loc", 10))
+        Customer.create_customer(self.cust_file,
+                                 Customer("C1", "N", "555", "c@m.com"))
+
+    def tearDown(self):
+        """Limpia el entorno de prueba después de cada test."""
+        close_all()
+        for f in glob.glob("data/test_shard_*"):
+            os.remove(f)
+        remove_data_files([lock_path(self.res_file)])
+
+    def test_split_and_join(self):
+        """Prueba que repartir y unir conserva todos los registros."""
+        manifest = split_file(self.res_file, self.manifest, buckets=4)
+        self.assertEqual(len(manifest.files()), 4)
+        counts = map_shards(self.manifest, count_lines, workers=2)
+        self.assertEqual(sum(counts), 12)
+        self.assertEqual(join_file(self.manifest, self.joined), 12)
+        with open(self.joined, 'r', encoding='utf-8') as file:
+            self.assertEqual(len(file.readlines()), 12)
+
+    def test_booking_touches_one_shard(self):
+        """Prueba que una reservación sólo reescribe la partición del hotel."""
+        split_file(self.res_file, self.manifest, scheme=HOTEL)
+        before = {f: os.stat(f).st_mtime_ns
+                  for f in ShardManifest(self.manifest).files()}
+        new = Reservation("R100", "H1", "C1", ("2025-02-01", "2025-02-03"))
+        self.assertTrue(Reservation.create_reservation(
+            self.manifest, self.hotel_file, self.cust_file, new))
+        changed = [f for f, mtime in before.items()
+                   if os.stat(f).st_mtime_ns != mtime]
+        shard = os.path.abspath(shard_for(self.manifest, "H1"))
+        self.assertEqual(changed, [shard])
+        found = Reservation.find_by_hotel(self.manifest, "H1")
+        self.assertEqual(len(found), 5)
+
+    def test_queries_and_cancel(self):
+        """Prueba consultas y cancelación a través del manifiesto."""
+        split_file(self.res_file, self.manifest, buckets=4)
+        self.assertEqual(len(Reservation.load_reservations(self.manifest)), 12)
+        found = Reservation.find_by_customer(self.manifest, "C1")
+        self.assertEqual(len(found), 12)
+        found = Reservation.find_reservation(self.manifest, "R7")
+        self.assertEqual(found.hotel_id, "H1")
+        self.assertTrue(Reservation.cancel_reservation(
+            self.manifest, self.hotel_file, "R7"))
+        self.assertFalse(Reservation.cancel_reservation(
+            self.manifest, self.hotel_file, "R7"))
+        self.assertIsNone(Reservation.find_reservation(self.manifest, "R7"))
+
+    def test_bulk_across_shards(self):
+        """Prueba las operaciones masivas repartidas entre particiones."""
+        split_file(self.res_file, self.manifest, buckets=4)
+        new = [Reservation(f"N{i}", f"H{i % 3}", "C1",
+                           ("2025-03-01", "2025-03-02"))
+               for i in range(6)]
+        result = Reservation.bulk_create_reservations(
+            self.manifest, self.hotel_file, self.cust_file, new + [new[0]])
+        self.assertEqual(result.processed, 6)
+        self.assertEqual(result.rejected, ["N0"])
+        result = Reservation.bulk_delete_reservations(
+            self.manifest, self.hotel_file, ["N1", "R2", "X9"])
+        self.assertEqual(result.processed, 2)
+        self.assertEqual(result.rejected, ["X9"])
+        self.assertEqual(len(Reservation.load_reservations(self.manifest)), 16)
+
+    def test_ids_unique_across_shards(self):
+        """Prueba que un ID no se repita en particiones de otros hoteles."""
+        split_file(self.res_file, self.manifest, scheme=HOTEL)
+        self.assertTrue(Reservation.create_reservation(
+            self.manifest, self.hotel_file, self.cust_file,
+            Reservation("R100", "H1", "C1", ("2025-02-01", "2025-02-03"))))
+        self.assertFalse(Reservation.create_reservation(
+            self.manifest, self.hotel_file, self.cust_file,
+            Reservation("R100", "H2", "C1", ("2025-02-01", "2025-02-03"))))
+        self.assertEqual(
+            [r.hotel_id for r in Reservation.load_reservations(self.manifest)
+             if r.reservation_id == "R100"], ["H1"])
+        result = Reservation.bulk_create_reservations(
+            self.manifest, self.hotel_file, self.cust_file,
+            [Reservation("R1", "H2", "C1", ("2025-03-01", "2025-03-02")),
+             Reservation("N1", "H0", "C1", ("2025-03-01", "2025-03-02")),
+             Reservation("N1", "H2", "C1", ("2025-03-01", "2025-03-02"))])
+        self.assertEqual((result.processed, result.rejected),
+                         (1, ["R1", "N1"]))
+
+    def test_ids_index_opens_one_shard(self):
+        """Prueba que reservar y cancelar no carguen las demás particiones."""
+        split_file(self.res_file, self.manifest, scheme=HOTEL)
+        close_all()
+        self.assertFalse(Reservation.create_reservation(
+            self.manifest, self.hotel_file, self.cust_file,
+            Reservation("R1", "H2", "C1", ("2025-02-01", "2025-02-03"))))
+        self.assertTrue(Reservation.create_reservation(
+            self.manifest, self.hotel_file, self.cust_file,
+            Reservation("R100", "H2", "C1", ("2025-02-01", "2025-02-03"))))
+        self.assertTrue(Reservation.cancel_reservation(
+            self.manifest, self.hotel_file, "R4"))
+        opened = [f for f in ShardManifest(self.manifest).files()
+                  if is_open(f)]
+        self.assertEqual(opened, [shard_for(self.manifest, "H1"),
+                                  shard_for(self.manifest, "H2")])
+        self.assertEqual(Reservation.locate(self.manifest, "R100"),
+                         shard_for(self.manifest, "H2"))
+        self.assertIsNone(Reservation.locate(self.manifest, "R4"))
+
+    def test_ids_index_rebuilt(self):
+        """Prueba que un manifiesto sin índice de IDs lo reconstruya."""
+        split_file(self.res_file, self.manifest, buckets=4)
+        close_all()
+        os.remove(ids_path(self.manifest))
+        self.assertEqual(len(Reservation.id_index(self.manifest)), 12)
+        self.assertEqual(Reservation.locate(self.manifest, "R5"),
+                         shard_for(self.manifest, "H2"))
+
+    def test_failed_booking_registers_no_shard(self):
+        """Prueba que una reservación rechazada no agregue particiones."""
+        split_file(self.res_file, self.manifest, scheme=HOTEL)
+        self.assertFalse(Reservation.create_reservation(
+            self.manifest, self.hotel_file, self.cust_file,
+            Reservation("R100", "NOPE", "C1", ("2025-02-01", "2025-02-03"))))
+        self.assertNotIn("NOPE", ShardManifest(self.manifest).shards)
+        Hotel.create_hotel(self.hotel_file, Hotel("H3", "Hotel", "Loc", 10))
+        self.assertTrue(Reservation.create_reservation(
+            self.manifest, self.hotel_file, self.cust_file,
+            Reservation("R101", "H3", "C1", ("2025-02-01", "2025-02-03"))))
+        self.assertIn("H3", ShardManifest(self.manifest).shards)
+
+    def test_service_batch_in_order(self):
+        """Prueba que una cancelación vea la reservación creada en su lote."""
+        split_file(self.res_file, self.manifest, buckets=4)
+        service = BookingService(self.manifest, self.hotel_file,
+                                 self.cust_file)
+        batch = [("book", Reservation("R100", "H1", "C1",
+                                      ("2025-02-01", "2025-02-03")), None),
+                 ("cancel", "R100", None),
+                 ("book", Reservation("R1", "H2", "C1",
+                                      ("2025-02-01", "2025-02-03")), None)]
+        # pylint: disable-next=protected-access
+        self.assertEqual(service._apply(batch), [True, True, False])
+        self.assertIsNone(Reservation.find_reservation(self.manifest, "R100"))
+        self.assertEqual(
+            Reservation.find_reservation(self.manifest, "R1").hotel_id, "H1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+"""
+Módulo de pruebas para las instantáneas binarias (snapshot.py).
+"""
+
+import unittest
+import os
+from hotel import Hotel
+from reservation import Reservation
+from snapshot import (INT, STR, SnapshotView, is_snapshot, snapshot_to_text,
+                      text_to_snapshot, write_snapshot)
+from storage import close_all, remove_data_files
+from transaction import lock_path
+
+
+class TestSnapshot(unittest.TestCase):
+    """Clase de pruebas unitarias para el formato binario columnar."""
+
+    def setUp(self):
+        """Configura el entorno de prueba para cada test."""
+        self.text_file = "data/test_snap_hotels_data.txt"
+        self.bin_file = "data/test_snap_hotels_data.bin"
+        self.back_file = "data/test_snap_hotels_back.txt"
+        self.res_text = "data/test_snap_reservations_data.txt"
+        self.res_bin = "data/test_snap_reservations_data.bin"
+        self.files = [self.text_file, self.bin_file, self.back_file,
+                      self.res_text, self.res_bin]
+        for f in self.files:
+            if os.path.exists(f):
+                os.remove(f)
+        with open(self.text_file, 'w', encoding='utf-8') as file:
+            file.write("H1|Uno|Ciudad X|3|3\n")
+            file.write("H2|Dos ñ|Ciudad Y|4|2\n")
+            file.write("H3|Tres|Ciudad X|5|5\n")
+        with open(self.res_text, 'w', encoding='utf-8') as file:
+            file.write("R1|H1|C1|2025-01-01|2025-01-03\n")
+        close_all()
+
+    def tearDown(self):
+        """Limpia el entorno de prueba después de cada test."""
+        close_all()
+        remove_data_files([*self.files, lock_path(self.files[0])])
+
+    def test_round_trip(self):
+        """Prueba la conversión texto -> binario -> texto."""
+        rows = text_to_snapshot(self.text_file, self.bin_file, 'hotel')
+        self.assertEqual(rows, 3)
+        self.assertTrue(is_snapshot(self.bin_file))
+        self.assertFalse(is_snapshot(self.text_file))
+        self.assertEqual(snapshot_to_text(self.bin_file, self.back_file), 3)
+        with open(self.text_file, 'r', encoding='utf-8') as original, \
+                open(self.back_file, 'r', encoding='utf-8') as converted:
+            self.assertEqual(original.read(), converted.read())
+
+    def test_column_access(self):
+        """Prueba la lectura de columnas sin copia desde el mapa de memoria."""
+        text_to_snapshot(self.text_file, self.bin_file, 'hotel')
+        with SnapshotView(self.bin_file) as view:
+            self.assertEqual(len(view), 3)
+            self.assertEqual(view.types[3], INT)
+            self.assertEqual(sum(view.column(3)), 12)
+            self.assertEqual(view.field(1, 1), "Dos ñ")
+            self.assertEqual(view.row(2), ["H3", "Tres", "Ciudad X", 5, 5])
+
+    def test_negative_numbers(self):
+        """Prueba que las columnas numéricas guardan valores negativos."""
+        write_snapshot(self.bin_file, STR + INT, [("H1", -2), ("H2", 3)])
+        with SnapshotView(self.bin_file) as view:
+            self.assertEqual(list(view.rows()), [("H1", -2), ("H2", 3)])
+        with self.assertRaises(ValueError):
+            write_snapshot(self.bin_file, INT, [(2 ** 31,)])
+
+    def test_rejects_nul_in_strings(self):
+        """Prueba que una cadena con byte nulo no corrompe la instantánea."""
+        with self.assertRaises(ValueError):
+            write_snapshot(self.bin_file, STR * 2, [("H\0", "x")])
+
+    def test_truncated_file(self):
+        """Prueba que un archivo truncado lanza ValueError."""
+        text_to_snapshot(self.text_file, self.bin_file, 'hotel')
+        with open(self.bin_file, 'rb') as file:
+            data = file.read()
+        for size in (len(data) - 1, 40, 8):
+            with open(self.bin_file, 'wb') as file:
+                file.write(data[:size])
+            with self.assertRaises(ValueError):
+                SnapshotView(self.bin_file)
+
+    def test_load_and_find(self):
+        """Prueba que los modelos leen instantáneas binarias."""
+        text_to_snapshot(self.text_file, self.bin_file, 'hotel')
+        hotels = Hotel.load_hotels(self.bin_file)
+        self.assertEqual([h.hotel_id for h in hotels], ["H1", "H2", "H3"])
+        self.assertEqual(hotels[1].rooms_available, 2)
+        self.assertEqual(Hotel.find_hotel(self.bin_file, "H3").name, "Tres")
+
+    def test_writes_keep_format(self):
+        """Prueba que las altas y bajas conservan el formato binario."""
+        text_to_snapshot(self.text_file, self.bin_file, 'hotel')
+        self.assertTrue(Hotel.create_hotel(self.bin_file,
+                                           Hotel("H4", "Cuatro", "Z", 6)))
+        self.assertTrue(Hotel.delete_hotel(self.bin_file, "H1"))
+        self.assertTrue(is_snapshot(self.bin_file))
+        close_all()
+        ids = [h.hotel_id for h in Hotel.load_hotels(self.bin_file)]
+        self.assertEqual(ids, ["H2", "H3", "H4"])
+
+    def test_reservation_dates(self):
+        """Prueba que las fechas de una reservación sobreviven al binario."""
+        text_to_snapshot(self.res_text, self.res_bin, 'reservation')
+        loaded = Reservation.load_reservations(self.res_bin)
+        self.assertEqual(loaded[0].check_out, "2025-01-03")
+        start, end = loaded[0].nights()
+        self.assertEqual(end - start, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+Módulo de pruebas para los lectores perezosos (iter_* y find_*).
+"""
+
+import unittest
+import os
+from hotel import Hotel
+from customer import Customer
+from reservation import Reservation
+from storage import close_all, remove_data_files
+from transaction import lock_path
+
+
+class TestStreaming(unittest.TestCase):
+    """Clase de pruebas unitarias para la lectura en flujo."""
+
+    def setUp(self):
+        """Configura el entorno de prueba para cada test."""
+        self.hotel_file = "data/test_stream_hotels_data.txt"
+        self.res_file = "data/test_stream_reservations_data.txt"
+        self.cust_file = "data/test_stream_customers_data.txt"
+        self.files = [self.hotel_file, self.res_file, self.cust_file]
+        for f in self.files:
+            if os.path.exists(f):
+                os.remove(f)
+        with open(self.hotel_file, 'w', encoding='utf-8') as file:
+            file.write("H1|Uno|Ciudad X|3|3\n")
+            file.write("linea invalida\n")
+            file.write("H2|Dos|Ciudad Y|4|4\n")
+            file.write("H3|Tres|Ciudad X|5|5\n")
+        close_all()
+
+    def tearDown(self):
+        """Limpia el entorno de prueba después de cada test."""
+        remove_data_files([*self.files, lock_path(self.files[0])])
+
+    def test_iter_with_predicate(self):
+        """Prueba la lectura perezosa con filtro."""
+        found = Hotel.iter_hotels(self.hotel_file,
+                                  lambda h: h.location == "Ciudad X")
+        self.assertEqual([h.hotel_id for h in found], ["H1", "H3"])
+
+    def test_early_termination(self):
+        """Prueba que el generador puede detenerse antes del final."""
+        iterator = Hotel.iter_hotels(self.hotel_file)
+        self.assertEqual(next(iterator).hotel_id, "H1")
+        iterator.close()
+
+    def test_find_by_id(self):
+        """Prueba la búsqueda por ID en el archivo y en la tabla abierta."""
+        self.assertEqual(Hotel.find_hotel(self.hotel_file, "H2").rooms, 4)
+        self.assertIsNone(Hotel.find_hotel(self.hotel_file, "H9"))
+        Hotel.table(self.hotel_file)
+        self.assertEqual(Hotel.find_hotel(self.hotel_file, "H3").name, "Tres")
+        self.assertIsNone(Hotel.find_hotel(self.hotel_file, "H9"))
+
+    def test_missing_files(self):
+        """Prueba que un archivo inexistente no produce registros."""
+        self.assertEqual(list(Customer.iter_customers(self.cust_file)), [])
+        self.assertIsNone(Reservation.find_reservation(self.res_file, "R1"))
+
+
+if __name__ == '__main__':
+    unittest.main()
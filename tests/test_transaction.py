@@ -0,0 +1,145 @@
+"""
+Módulo de pruebas para las transacciones sobre archivos.
+"""
+
+import unittest
+import os
+from multiprocessing import Process
+from hotel import Hotel
+from customer import Customer
+from reservation import Reservation
+from storage import remove_data_files
+from transaction import (
+    INTENT_NAME, Transaction, atomic_write, commit_files, file_lock,
+    lock_path, recover
+)
+
+
+def _book_last_room(res_file, hotel_file, cust_file, rid):
+    """Intenta reservar desde otro proceso."""
+    r = Reservation(rid, "H1", "C1", ("2025-01-01", "2025-01-02"))
+    Reservation.create_reservation(res_file, hotel_file, cust_file, r)
+
+
+class TestTransaction(unittest.TestCase):
+    """Clase de pruebas unitarias para Transaction."""
+
+    def setUp(self):
+        """Configura el entorno de prueba para cada test."""
+        self.res_file = "data/test_tx_reservations_data.txt"
+        self.hotel_file = "data/test_tx_hotels_data.txt"
+        self.cust_file = "data/test_tx_customers_data.txt"
+        self.files = [self.res_file, self.hotel_file, self.cust_file]
+        for f in self.files:
+            if os.path.exists(f):
+                os.remove(f)
+        Hotel.create_hotel(self.hotel_file, Hotel("H1", "Uno", "Loc", 1))
+        Customer.create_customer(self.cust_file,
+                                 Customer("C1", "N", "555", "c@m.com"))
+
+    def tearDown(self):
+        """Limpia el entorno de prueba después de cada test."""
+        remove_data_files([*self.files, lock_path(self.files[0])])
+
+    def _read(self, filename):
+        """Lee el contenido de un archivo."""
+        with open(filename, 'r', encoding='utf-8') as file:
+            return file.read()
+
+    def test_atomic_write(self):
+        """Prueba el reemplazo atómico de un archivo."""
+        atomic_write(self.res_file, ["a", "b"])
+        self.assertEqual(self._read(self.res_file), "a\nb\n")
+        leftovers = [f for f in os.listdir("data") if f.endswith(".tmp")]
+        self.assertEqual(leftovers, [])
+
+    def test_recover_interrupted_commit(self):
+        """Prueba que una confirmación interrumpida se completa."""
+        tmp = f"{self.res_file}.pending.tmp"
+        with open(tmp, 'w', encoding='utf-8') as file:
+            file.write("R1|H1|C1|2025-01-01|2025-01-02\n")
+        intent = os.path.join("data", INTENT_NAME)
+        with open(intent, 'w', encoding='utf-8') as file:
+            file.write(f"{os.path.abspath(tmp)}|"
+                       f"{os.path.abspath(self.res_file)}\n")
+        self.assertTrue(recover("data"))
+        self.assertFalse(os.path.exists(intent))
+        self.assertEqual(len(Reservation.load_reservations(self.res_file)), 1)
+        self.assertFalse(recover("data"))
+
+    def test_commit_files(self):
+        """Prueba la confirmación conjunta de dos archivos."""
+        commit_files({self.res_file: ["x"], self.cust_file: ["y"]})
+        self.assertEqual(self._read(self.res_file), "x\n")
+        self.assertEqual(self._read(self.cust_file), "y\n")
+        self.assertFalse(os.path.exists(os.path.join("data", INTENT_NAME)))
+
+    def test_commit_files_with_appends(self):
+        """Prueba que los anexados se confirman y recuperan sin duplicarse."""
+        log = f"{self.res_file}.log"
+        atomic_write(log, ["I|a"])
+        commit_files({self.cust_file: ["y"]}, {log: ["I|b"]})
+        self.assertEqual(self._read(log), "I|a\nI|b\n")
+        self.assertEqual(self._read(self.cust_file), "y\n")
+        tmp = f"{log}.pending.tmp"
+        atomic_write(tmp, ["I|c"])
+        with open(os.path.join("data", INTENT_NAME), 'w',
+                  encoding='utf-8') as file:
+            file.write(f"{os.path.abspath(tmp)}|{os.path.abspath(log)}|4\n")
+        self.assertTrue(recover("data"))
+        self.assertEqual(self._read(log), "I|a\nI|c\n")
+        self.assertFalse(os.path.exists(tmp))
+
+    def test_nested_rollback_defers_to_outer(self):
+        """Prueba que una transacción anidada no recargue la exterior."""
+        hotels = Hotel.table(self.hotel_file)
+        customers = Customer.table(self.cust_file)
+        with Transaction(hotels) as outer:
+            hotels.insert(Hotel("H2", "Dos", "Loc", 1))
+            with self.assertRaises(RuntimeError):
+                with Transaction(hotels, customers):
+                    customers.insert(Customer("C2", "M", "556", "d@m.com"))
+                    raise RuntimeError("falla")
+            self.assertIn("H2", hotels)
+            self.assertNotIn("C2", customers)
+            # pylint: disable-next=protected-access
+            self.assertTrue(outer._rolled_back)
+        self.assertNotIn("H2", hotels)
+        self.assertNotIn("H2", self._read(self.hotel_file))
+
+    def test_rollback_on_exception(self):
+        """Prueba que una excepción descarta los cambios de la transacción."""
+        hotels = Hotel.table(self.hotel_file)
+        with self.assertRaises(RuntimeError):
+            with Transaction(hotels):
+                hotels.insert(Hotel("H2", "Dos", "Loc", 1))
+                raise RuntimeError("falla")
+        self.assertNotIn("H2", hotels)
+        self.assertNotIn("H2", self._read(self.hotel_file))
+
+    def test_lock_is_reentrant(self):
+        """Prueba que el candado se puede tomar dos veces en un proceso."""
+        path = os.path.join("data", ".lock")
+        with file_lock(path):
+            with file_lock(path):
+                pass
+
+    def test_no_overbooking_across_processes(self):
+        """Prueba que dos procesos no reservan la última habitación."""
+        processes = [
+            Process(target=_book_last_room,
+                    args=(self.res_file, self.hotel_file, self.cust_file,
+                          f"R{i}"))
+            for i in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        self.assertEqual(len(Reservation.load_reservations(self.res_file)), 1)
+        hotel = Hotel.load_hotels(self.hotel_file)[0]
+        self.assertEqual(hotel.rooms_available, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+"""
+Módulo de pruebas para la lista de espera y la sobreventa (waitlist.py).
+"""
+
+import gc
+import unittest
+import os
+import weakref
+from customer import Customer
+from hotel import Hotel
+from reservation import Reservation
+from storage import close_all, remove_data_files
+from transaction import lock_path
+from waitlist import set_overbooking, waitlist_path
+
+
+class TestWaitlist(unittest.TestCase):
+    """Clase de pruebas unitarias para la lista de espera."""
+
+    def setUp(self):
+        """Configura el entorno de prueba para cada test."""
+        self.res_file = "data/test_waitlist_reservations.txt"
+        self.hotel_file = "data/test_waitlist_hotels.txt"
+        self.cust_file = "data/test_waitlist_customers.txt"
+        self.tearDown()
+        Hotel.create_hotel(self.hotel_file, Hotel("H1", "Uno", "Ciudad", 1))
+        Customer.create_customer(self.cust_file,
+                                 Customer("C1", "Ana", "555", "a@mail.com"))
+
+    def tearDown(self):
+        """Limpia el entorno de prueba después de cada test."""
+        close_all()
+        set_overbooking(0)
+        set_overbooking(None, "H1")
+        for f in os.listdir("data"):
+            if f.startswith("test_waitlist_"):
+                os.remove(f"data/{f}")
+        remove_data_files([lock_path(self.res_file)])
+
+    def book(self, reservation_id, dates, **kwargs):
+        """Crea una reservación en H1 para C1."""
+        return Reservation.create_reservation(
+            self.res_file, self.hotel_file, self.cust_file,
+            Reservation(reservation_id, "H1", "C1", dates), **kwargs)
+
+    def cancel(self, reservation_id):
+        """Cancela una reservación o solicitud en espera."""
+        return Reservation.cancel_reservation(self.res_file, self.hotel_file,
+                                              reservation_id)
+
+    def test_cancel_promotes_by_priority(self):
+        """Prueba que la cancelación promueva primero la mayor prioridad."""
+        self.assertTrue(self.book("R1", ("2025-03-01", "2025-03-03")))
+        self.assertFalse(self.book("R2", ("2025-03-01", "2025-03-02"),
+                                   waitlist=True))
+        self.assertFalse(self.book("R3", ("2025-03-01", "2025-03-03"),
+                                   waitlist=True, priority=5))
+        self.assertFalse(self.book("R4", ("2025-03-01", "2025-03-02")))
+        queue = Reservation.waitlist(self.res_file)
+        self.assertEqual([e.reservation_id for e in queue.entries("H1")],
+                         ["R3", "R2"])
+        self.assertEqual(queue.position("R2"), 2)
+
+        self.assertTrue(self.cancel("R1"))
+        self.assertIsNotNone(Reservation.find_reservation(self.res_file, "R3"))
+        self.assertIsNone(Reservation.find_reservation(self.res_file, "R2"))
+        self.assertEqual(queue.position("R2"), 1)
+
+        close_all()
+        with open(waitlist_path(self.res_file), 'r', encoding='utf-8') as file:
+            self.assertEqual([line.split('|')[0] for line in file], ["R2"])
+        self.assertEqual(Reservation.waitlist(self.res_file).position("R2"), 1)
+
+    def test_skips_requests_that_do_not_fit(self):
+        """Prueba que una solicitud que no cabe conserve su lugar."""
+        self.assertTrue(self.book("R1", ("2025-03-01", "2025-03-02")))
+        self.assertTrue(self.book("R2", ("2025-03-02", "2025-03-03")))
+        self.assertFalse(self.book("R3", ("2025-03-01", "2025-03-03"),
+                                   waitlist=True, priority=9))
+        self.assertFalse(self.book("R4", ("2025-03-02", "2025-03-03"),
+                                   waitlist=True))
+        self.cancel("R2")
+        self.assertIsNotNone(Reservation.find_reservation(self.res_file, "R4"))
+        self.assertEqual(Reservation.waitlist(self.res_file).position("R3"), 1)
+
+        self.assertTrue(self.cancel("R3"))
+        self.assertIsNone(Reservation.waitlist(self.res_file).position("R3"))
+
+    def test_overbooking_limit(self):
+        """Prueba la sobreventa global, por hotel y la promoción explícita."""
+        set_overbooking(1)
+        self.assertTrue(self.book("R1", ("2025-03-01", "2025-03-02")))
+        self.assertTrue(self.book("R2", ("2025-03-01", "2025-03-02")))
+        self.assertFalse(self.book("R3", ("2025-03-01", "2025-03-02"),
+                                   waitlist=True))
+        set_overbooking(2, "H1")
+        promoted = Reservation.promote_waitlist(self.res_file,
+                                                self.hotel_file, "H1")
+        self.assertEqual([r.reservation_id for r in promoted], ["R3"])
+        with self.assertRaises(ValueError):
+            set_overbooking(-1)
+
+    def test_queue_lives_with_its_table(self):
+        """Prueba que los montículos se comparten y se liberan con la tabla."""
+        queue = Reservation.waitlist(self.res_file)
+        self.assertIs(Reservation.waitlist(self.res_file), queue)
+        table = weakref.ref(queue.table)
+        del queue
+        close_all()
+        gc.collect()
+        self.assertIsNone(table())
+
+    def test_cancel_without_waitlist_creates_no_file(self):
+        """Prueba que cancelar sin lista de espera no cree el archivo .wait."""
+        self.book("R1", ("2025-03-01", "2025-03-02"))
+        Reservation.cancel_reservation(self.res_file, self.hotel_file, "R1")
+        close_all()
+        self.assertFalse(os.path.exists(waitlist_path(self.res_file)))
+
+
+if __name__ == "__main__":
+    unittest.main()
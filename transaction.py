@@ -0,0 +1,301 @@
+"""
+Módulo de transacciones sobre los archivos de datos.
+
+Las transacciones toman un candado (lock) consultivo por directorio con
+fcntl y confirman varios archivos a la vez escribiendo primero archivos
+temporales y luego renombrándolos (o anexándolos, para los registros
+.log). Un archivo de intención permite terminar una confirmación
+interrumpida, por lo que los archivos nunca quedan a medio escribir ni
+inconsistentes entre sí.
+"""
+
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+
+import metrics
+from journal import Journal
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - plataformas sin fcntl (Windows)
+    fcntl = None
+
+LOCK_NAME = '.lock'
+INTENT_NAME = '.commit'
+
+_HELD_LOCKS = {}
+
+_ACTIVE = []
+
+
+def lock_path(filename):
+    """
+    Obtiene la ruta del candado que protege un archivo de datos.
+
+    Args:
+        filename (str): Ruta del archivo de datos.
+
+    Returns:
+        str: Ruta del candado del directorio del archivo.
+    """
+    return os.path.join(os.path.dirname(os.path.abspath(filename)), LOCK_NAME)
+
+
+@contextmanager
+def file_lock(path):
+    """
+    Toma un candado exclusivo sobre un archivo. El candado es reentrante
+    dentro del mismo proceso.
+
+    Args:
+        path (str): Ruta del archivo de candado.
+    """
+    held = _HELD_LOCKS.get(path)
+    if held is not None:
+        _HELD_LOCKS[path] = (held[0], held[1] + 1)
+        try:
+            yield
+        finally:
+            fd, depth = _HELD_LOCKS[path]
+            _HELD_LOCKS[path] = (fd, depth - 1)
+        return
+
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            start = time.perf_counter()
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            metrics.observe('lock_wait_seconds', time.perf_counter() - start)
+        _HELD_LOCKS[path] = (fd, 1)
+        try:
+            yield
+        finally:
+            del _HELD_LOCKS[path]
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def _write_temp(filename, content):
+    """
+    Escribe un archivo temporal junto a filename y lo sincroniza.
+
+    Args:
+        filename (str): Archivo destino.
+        content (object): Líneas sin salto de línea (iterable), o una
+            función que recibe la ruta temporal y escribe el archivo.
+
+    Returns:
+        str: Ruta del archivo temporal.
+    """
+    directory, name = os.path.split(os.path.abspath(filename))
+    fd, tmp_name = tempfile.mkstemp(prefix=f"{name}.", suffix='.tmp',
+                                    dir=directory)
+    if callable(content):
+        os.close(fd)
+        content(tmp_name)
+        return tmp_name
+    with os.fdopen(fd, 'w', encoding='utf-8') as file:
+        file.writelines(f"{line}\n" for line in content)
+        file.flush()
+        os.fsync(file.fileno())
+    return tmp_name
+
+
+def atomic_write(filename, content):
+    """
+    Reemplaza el contenido de un archivo de forma atómica.
+
+    Args:
+        filename (str): Archivo destino.
+        content (object): Líneas sin salto de línea (iterable), o una
+            función que recibe la ruta temporal y escribe el archivo.
+    """
+    os.replace(_write_temp(filename, content), filename)
+
+
+def _append_temp(tmp, target, offset):
+    """
+    Anexa un archivo temporal al final de otro y elimina el temporal.
+    El destino se recorta antes a offset, por lo que repetir el anexado
+    al recuperar una confirmación no duplica las líneas.
+
+    Args:
+        tmp (str): Archivo temporal con las líneas por anexar.
+        target (str): Archivo destino.
+        offset (int): Tamaño del destino antes del anexado.
+    """
+    with open(tmp, 'rb') as source, open(target, 'rb+') as file:
+        file.truncate(offset)
+        file.seek(offset)
+        file.write(source.read())
+        file.flush()
+        os.fsync(file.fileno())
+    os.remove(tmp)
+
+
+def commit_files(contents, appends=None):
+    """
+    Reemplaza varios archivos del mismo directorio y anexa líneas a
+    otros como una sola unidad.
+
+    Args:
+        contents (dict): Contenido nuevo por ruta de archivo, con el
+            mismo formato que en atomic_write.
+        appends (dict, optional): Líneas sin salto de línea que se
+            anexan, por ruta de archivo (registros .log).
+    """
+    appends = {name: lines for name, lines in (appends or {}).items()
+               if lines}
+    if not contents and not appends:
+        return
+    renames = [(_write_temp(name, content), os.path.abspath(name))
+               for name, content in contents.items()]
+    if len(renames) == 1 and not appends:
+        os.replace(*renames[0])
+        return
+    extends = [(_write_temp(name, lines), os.path.abspath(name),
+                os.path.getsize(name))
+               for name, lines in appends.items()]
+
+    intent = os.path.join(os.path.dirname((renames or extends)[0][1]),
+                          INTENT_NAME)
+    with open(intent, 'w', encoding='utf-8') as file:
+        file.writelines(f"{tmp}|{target}\n" for tmp, target in renames)
+        file.writelines(f"{tmp}|{target}|{offset}\n"
+                        for tmp, target, offset in extends)
+        file.flush()
+        os.fsync(file.fileno())
+    for tmp, target in renames:
+        os.replace(tmp, target)
+    for extend in extends:
+        _append_temp(*extend)
+    os.remove(intent)
+
+
+def recover(directory):
+    """
+    Termina una confirmación interrumpida en un directorio, si la hay.
+
+    Args:
+        directory (str): Directorio de los archivos de datos.
+
+    Returns:
+        bool: True si había una confirmación pendiente.
+    """
+    intent = os.path.join(directory, INTENT_NAME)
+    if not os.path.exists(intent):
+        return False
+    with open(intent, 'r', encoding='utf-8') as file:
+        for line in file:
+            tmp, sep, target = line.rstrip('\n').partition('|')
+            if not sep or not os.path.exists(tmp):
+                continue
+            target, sep, offset = target.partition('|')
+            if sep:
+                _append_temp(tmp, target, int(offset))
+            else:
+                os.replace(tmp, target)
+    os.remove(intent)
+    return True
+
+
+class Transaction:
+    """
+    Agrupa cambios sobre varias tablas bajo un candado y los confirma
+    de forma atómica al salir del bloque with. Si el bloque lanza una
+    excepción o se llama rollback(), las tablas se recargan del disco.
+
+    Una transacción abierta dentro de otra (anidada) confirma sus tablas
+    con la exterior. Si falla, sólo recarga las tablas que la exterior no
+    comparte y marca la exterior para descartarse, que es la que recarga
+    las tablas comunes al salir.
+
+    Atributos:
+        tables (tuple): Tablas que participan en la transacción.
+        lock (str): Ruta del candado.
+        parent (Transaction): Transacción exterior, o None.
+    """
+
+    def __init__(self, *tables):
+        """
+        Inicializa la transacción.
+
+        Args:
+            *tables (RecordTable): Tablas del mismo directorio.
+        """
+        self.tables = tables
+        self.lock = lock_path(tables[0].filename)
+        self.parent = None
+        self._lock_cm = None
+        self._rolled_back = False
+
+    def __enter__(self):
+        """Toma el candado y recarga las tablas que cambiaron en disco."""
+        self._lock_cm = file_lock(self.lock)
+        self._lock_cm.__enter__()
+        self.parent = _ACTIVE[-1] if _ACTIVE else None
+        _ACTIVE.append(self)
+        recover(os.path.dirname(self.lock))
+        for table in self.tables:
+            table.refresh()
+            table.hold()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        """Confirma o descarta los cambios y libera el candado."""
+        try:
+            _ACTIVE.remove(self)
+            for table in self.tables:
+                table.release()
+            if exc_type is not None or self._rolled_back:
+                if self.parent is not None:
+                    self.parent.rollback()
+                for table in self.tables:
+                    if self.parent is None or not table.held:
+                        table.reload()
+            else:
+                commit_tables([t for t in self.tables if t.should_flush()])
+        finally:
+            self._lock_cm.__exit__(exc_type, exc, traceback)
+
+    def rollback(self):
+        """Descarta los cambios de la transacción al salir del bloque."""
+        self._rolled_back = True
+
+
+def commit_tables(tables):
+    """
+    Escribe las tablas indicadas de forma atómica. Las tablas en modo
+    registro anexan su lote al .log (o, tras un replace(), se compactan:
+    se reescriben y su .log queda vacío) y el resto se reescribe
+    completo; los anexados y los reemplazos se confirman juntos con
+    commit_files(). Las bases de datos confirman su propia transacción.
+
+    Args:
+        tables (list): Tablas con cambios por escribir.
+    """
+    if not tables:
+        return
+    with metrics.timer('commit_seconds'):
+        journals = [t for t in tables if isinstance(t.journal, Journal)]
+        rewrites = [t for t in tables if t.journal is None
+                    or (t in journals and t.rewrite_pending)]
+        appends = [t for t in journals if t not in rewrites]
+        if rewrites or len(appends) > 1:
+            contents = {t.filename: t.write_file for t in rewrites}
+            contents.update({t.journal.path: [] for t in rewrites
+                             if t.journal is not None})
+            commit_files(contents, {t.journal.path: t.journal_lines()
+                                    for t in appends})
+            for table in rewrites:
+                table.mark_compacted()
+            for table in appends:
+                table.mark_journaled()
+        for table in tables:
+            if table.journal is not None:
+                table.flush_journal()
+                table.flush()
@@ -0,0 +1,369 @@
+"""
+Módulo de la lista de espera por hotel y de los límites de sobreventa.
+
+Una solicitud que no cabe en el hotel puede quedar en la lista de espera
+(el archivo <reservaciones>.wait, una línea por solicitud). En memoria,
+cada hotel tiene un montículo ordenado por prioridad (mayor primero) y
+hora de la solicitud, por lo que la siguiente solicitud se obtiene en
+O(log n). Al cancelarse una reservación se promueven, en ese orden, las
+solicitudes que caben en las noches liberadas.
+
+La sobreventa permite aceptar por noche hasta OVERBOOKING reservaciones
+más que habitaciones (0 por omisión). Se configura para todos los
+hoteles o por hotel con set_overbooking(), o con la variable de entorno
+RESERVATIONS_OVERBOOKING.
+"""
+
+import heapq
+import os
+from datetime import datetime
+from operator import attrgetter
+
+from journal import journal_path
+from storage import intern_text, is_open, open_table
+
+OVERBOOKING = int(os.environ.get('RESERVATIONS_OVERBOOKING', '') or 0)
+
+_OVERBOOKING = {}
+
+
+def set_overbooking(limit, hotel_id=None):
+    """
+    Cambia el límite de sobreventa.
+
+    Args:
+        limit (int): Reservaciones por noche aceptadas por encima de la
+            capacidad del hotel; None quita el límite propio del hotel.
+        hotel_id (str, optional): Hotel al que se aplica; por omisión
+            cambia el límite de todos los hoteles sin uno propio.
+
+    Raises:
+        ValueError: Si el límite es negativo, o None sin hotel_id.
+    """
+    global OVERBOOKING  # pylint: disable=global-statement
+    if limit is None and hotel_id is not None:
+        _OVERBOOKING.pop(hotel_id, None)
+        return
+    if limit is None or limit < 0:
+        raise ValueError(f"límite de sobreventa inválido: {limit}")
+    if hotel_id is None:
+        OVERBOOKING = limit
+    else:
+        _OVERBOOKING[hotel_id] = limit
+
+
+def overbooking_limit(hotel_id):
+    """
+    Obtiene el límite de sobreventa de un hotel.
+
+    Args:
+        hotel_id (str): ID del hotel.
+
+    Returns:
+        int: Reservaciones por noche aceptadas por encima de la capacidad.
+    """
+    return _OVERBOOKING.get(hotel_id, OVERBOOKING)
+
+
+def waitlist_path(filename):
+    """
+    Obtiene la ruta de la lista de espera de un archivo de reservaciones.
+
+    Args:
+        filename (str): Archivo de reservaciones o manifiesto de particiones.
+
+    Returns:
+        str: Ruta del archivo .wait.
+    """
+    return f"{filename}.wait"
+
+
+class WaitlistEntry:
+    """
+    Solicitud de reservación en espera.
+
+    Atributos:
+        reservation_id (str): ID de la reservación solicitada.
+        hotel_id (str): ID del hotel.
+        customer_id (str): ID del cliente.
+        check_in (str): Fecha de llegada.
+        check_out (str): Fecha de salida.
+        priority (int): Prioridad; las mayores se atienden primero.
+        requested_at (str): Fecha y hora ISO de la solicitud; desempata
+            las solicitudes de igual prioridad.
+    """
+
+    __slots__ = ('reservation_id', 'hotel_id', 'customer_id', 'check_in',
+                 'check_out', 'priority', 'requested_at')
+
+    def __init__(self, reservation_id, hotel_id, customer_id, dates,
+                 priority=0, requested_at=None):
+        """
+        Inicializa una solicitud.
+
+        Args:
+            reservation_id (str): ID de la reservación solicitada.
+            hotel_id (str): ID del hotel.
+            customer_id (str): ID del cliente.
+            dates (tuple): Tupla que contiene (check_in, check_out).
+            priority (int, optional): Prioridad de la solicitud.
+            requested_at (str, optional): Fecha y hora ISO; por omisión ahora.
+        """
+        self.reservation_id = reservation_id
+        self.hotel_id = intern_text(hotel_id)
+        self.customer_id = intern_text(customer_id)
+        self.check_in, self.check_out = dates
+        self.priority = int(priority)
+        self.requested_at = (requested_at or
+                             datetime.now().isoformat(timespec='microseconds'))
+
+    def sort_key(self):
+        """
+        Obtiene la clave de orden en el montículo.
+
+        Returns:
+            tuple: (-prioridad, hora de la solicitud, ID).
+        """
+        return (-self.priority, self.requested_at, self.reservation_id)
+
+    def to_line(self):
+        """
+        Convierte la solicitud a una línea del archivo de datos.
+
+        Returns:
+            str: Línea con formato
+                reservation_id|hotel_id|customer_id|check_in|check_out|priority|requested_at
+        """
+        return (f"{self.reservation_id}|{self.hotel_id}|{self.customer_id}|"
+                f"{self.check_in}|{self.check_out}|{self.priority}|"
+                f"{self.requested_at}")
+
+    @staticmethod
+    def from_line(line):
+        """
+        Crea una solicitud a partir de una línea del archivo de datos.
+
+        Args:
+            line (str): Línea sin salto de línea.
+
+        Returns:
+            WaitlistEntry: Objeto WaitlistEntry.
+
+        Raises:
+            ValueError: Si la línea no tiene el formato esperado.
+        """
+        return WaitlistEntry.from_fields(line.split('|'))
+
+    @staticmethod
+    def from_fields(fields):
+        """
+        Crea una solicitud a partir de los campos de una línea.
+
+        Args:
+            fields (list): Campos en el orden del archivo de datos.
+
+        Returns:
+            WaitlistEntry: Objeto WaitlistEntry.
+
+        Raises:
+            ValueError: Si los campos no tienen el formato esperado.
+        """
+        rid, hid, cid, cin, cout, priority, requested_at = fields
+        return WaitlistEntry(rid, hid, cid, (cin, cout), priority,
+                             requested_at)
+
+
+def waitlist_table(filename, create=True):
+    """
+    Obtiene la tabla de la lista de espera de un archivo de reservaciones.
+
+    Args:
+        filename (str): Archivo de reservaciones o manifiesto de particiones.
+        create (bool, optional): Con False no se abre una lista que
+            todavía no existe (las cancelaciones sin lista de espera no
+            crean el archivo).
+
+    Returns:
+        RecordTable: Tabla indexada por reservation_id, o None si no
+            existe y create es False.
+    """
+    path = waitlist_path(filename)
+    if not create and not (is_open(path) or os.path.exists(path)
+                           or os.path.exists(journal_path(path))):
+        return None
+    return open_table(path, WaitlistEntry.from_line,
+                      attrgetter('reservation_id'),
+                      from_fields=WaitlistEntry.from_fields)
+
+
+class Waitlist:
+    """
+    Montículos de solicitudes por hotel sobre la tabla de la lista de espera.
+
+    Las solicitudes eliminadas de la tabla no se buscan en los montículos:
+    se descartan cuando llegan a la cima.
+
+    Atributos:
+        table (RecordTable): Tabla de solicitudes.
+        heaps (dict): Lista de (clave de orden, reservation_id) por hotel_id.
+    """
+
+    def __init__(self, table):
+        """
+        Inicializa montículos vacíos (sin suscribirlos a la tabla).
+
+        Args:
+            table (RecordTable): Tabla de solicitudes.
+        """
+        self.table = table
+        self.heaps = {}
+
+    def push(self, entry):
+        """
+        Agrega una solicitud al montículo de su hotel en O(log n).
+
+        Args:
+            entry (WaitlistEntry): Solicitud guardada en la tabla.
+        """
+        heapq.heappush(self.heaps.setdefault(entry.hotel_id, []),
+                       (entry.sort_key(), entry.reservation_id))
+
+    def rebuild(self):
+        """Reconstruye los montículos a partir de la tabla."""
+        self.heaps = {}
+        for entry in self.table.values():
+            self.heaps.setdefault(entry.hotel_id, []).append(
+                (entry.sort_key(), entry.reservation_id))
+        for heap in self.heaps.values():
+            heapq.heapify(heap)
+
+    def _live(self, item):
+        """Obtiene la solicitud de un elemento, o None si ya no está."""
+        entry = self.table.get(item[1])
+        if entry is not None and entry.sort_key() == item[0]:
+            return entry
+        return None
+
+    def peek(self, hotel_id):
+        """
+        Obtiene la siguiente solicitud de un hotel sin quitarla.
+
+        Args:
+            hotel_id (str): ID del hotel.
+
+        Returns:
+            WaitlistEntry: La solicitud, o None si no hay ninguna.
+        """
+        heap = self.heaps.get(hotel_id, [])
+        while heap:
+            entry = self._live(heap[0])
+            if entry is not None:
+                return entry
+            heapq.heappop(heap)
+        return None
+
+    def entries(self, hotel_id):
+        """
+        Obtiene las solicitudes de un hotel en el orden en que se atienden.
+
+        Args:
+            hotel_id (str): ID del hotel.
+
+        Returns:
+            list: Objetos WaitlistEntry.
+        """
+        entries = {}
+        for item in sorted(self.heaps.get(hotel_id, [])):
+            entry = self._live(item)
+            if entry is not None:
+                entries.setdefault(entry.reservation_id, entry)
+        return list(entries.values())
+
+    def position(self, reservation_id):
+        """
+        Obtiene la posición de una solicitud en la lista de su hotel.
+
+        Args:
+            reservation_id (str): ID de la reservación solicitada.
+
+        Returns:
+            int: Posición (1 es la siguiente), o None si no está en espera.
+        """
+        entry = self.table.get(reservation_id)
+        if entry is None:
+            return None
+        ids = [e.reservation_id for e in self.entries(entry.hotel_id)]
+        return ids.index(reservation_id) + 1
+
+    def promote(self, hotel_id, book, is_full=None):
+        """
+        Recorre las solicitudes de un hotel en orden y quita de la lista
+        las que book() logra reservar. Las que no caben conservan su lugar.
+
+        Args:
+            hotel_id (str): ID del hotel.
+            book (callable): Recibe una WaitlistEntry y devuelve True si
+                se reservó.
+            is_full (callable, optional): Sin argumentos; devuelve True
+                cuando ya no cabe nadie y el recorrido puede terminar (si
+                la primera solicitud llena las noches liberadas, la
+                promoción cuesta O(log n)).
+
+        Returns:
+            list: Solicitudes promovidas, en orden.
+        """
+        heap = self.heaps.get(hotel_id, [])
+        promoted = []
+        skipped = []
+        while heap and not (is_full is not None and is_full()):
+            item = heapq.heappop(heap)
+            entry = self._live(item)
+            if entry is None:
+                continue
+            if book(entry):
+                self.table.delete(entry.reservation_id)
+                promoted.append(entry)
+            else:
+                skipped.append(item)
+        for item in skipped:
+            heapq.heappush(heap, item)
+        return promoted
+
+
+class _WaitlistListener:
+    """Mantiene los montículos al día con la tabla de solicitudes."""
+
+    def __init__(self, waitlist):
+        self.waitlist = waitlist
+
+    def on_insert(self, entry):
+        """Agrega una solicitud a su montículo."""
+        self.waitlist.push(entry)
+
+    def on_delete(self, _):
+        """Las solicitudes eliminadas se descartan al llegar a la cima."""
+
+    def on_reset(self, _):
+        """Reconstruye los montículos tras recargar la tabla."""
+        self.waitlist.rebuild()
+
+
+def waitlist_queue(table):
+    """
+    Obtiene los montículos de una tabla de solicitudes, creándolos y
+    suscribiéndolos a sus cambios la primera vez. Se guardan en el
+    observador de la tabla, por lo que se liberan junto con ella.
+
+    Args:
+        table (RecordTable): Tabla de la lista de espera (ver
+            waitlist_table()).
+
+    Returns:
+        Waitlist: Montículos mantenidos al día.
+    """
+    for listener in table.listeners:
+        if isinstance(listener, _WaitlistListener):
+            return listener.waitlist
+    queue = Waitlist(table)
+    table.add_listener(_WaitlistListener(queue))
+    return queue